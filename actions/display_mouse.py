@@ -0,0 +1,182 @@
+# actions/display_mouse.py
+import threading
+import time
+
+
+class DisplayRateMouse:
+    """
+    Sends the cursor at the display's rate instead of the camera's. move_to()
+    only records a new target; a timer thread runs at `rate_hz` and moves
+    `inner` along the path between targets:
+
+    - "interpolate": glide from where the cursor is to the newest target over
+      one target interval (measured), so a 30 fps stream of targets becomes a
+      continuous path. Costs up to one interval of extra lag.
+    - "extrapolate": keep going at the velocity of the last two targets for up
+      to max_extrapolate_ms past the newest one. No added lag, but overshoots
+      when the hand stops.
+
+    Ticks that would send the same integer position are skipped, and once the
+    cursor has settled the thread sleeps until the next target. Clicks, press /
+    release and scroll go straight to `inner` after snapping the cursor to the
+    newest target, so they land where the loop moved to (same order guarantee
+    as ThreadedMouse). Same methods as MouseController.
+    """
+
+    def __init__(self, inner, rate_hz: float = 120.0, mode: str = "interpolate",
+                 max_extrapolate_ms: float = 50.0, clock=time.perf_counter):
+        if mode not in ("interpolate", "extrapolate"):
+            raise ValueError(f"Unknown display mode: {mode!r} (expected interpolate or extrapolate)")
+        self.inner = inner
+        self.period = 1.0 / max(1.0, float(rate_hz))
+        self.mode = mode
+        self.max_extrapolate = max(0.0, max_extrapolate_ms / 1000.0)
+        self.clock = clock
+
+        self._cond = threading.Condition()    # guards the target state below
+        self._send_lock = threading.Lock()    # one caller of inner at a time
+        self._target = None                   # (t, x, y) newest
+        self._prev = None                     # (t, x, y) the one before
+        self._start = None                    # (x, y) where the glide to _target starts
+        self._interval = 1.0 / 30.0           # smoothed time between targets
+        self._settled = True                  # cursor reached the end of the path
+        self._sent = None                     # last (x, y) sent to inner
+        self._running = True
+
+        # Counters
+        self.targets = 0
+        self.ticks = 0
+        self.moves_sent = 0
+        self.skipped = 0          # ticks where the integer position did not change
+        self.late_ticks = 0       # ticks more than a period late (timer resynced)
+
+        self._thread = threading.Thread(target=self._output_loop, name="DisplayRateMouse", daemon=True)
+        self._thread.start()
+
+    # -------------------------
+    # Path
+    # -------------------------
+    def _position(self, now: float):
+        """(x, y, settled) along the path at `now`; call with _cond held."""
+        t1, x1, y1 = self._target
+        dt = now - t1
+        if self.mode == "interpolate":
+            u = dt / self._interval
+            if u >= 1.0:
+                return x1, y1, True
+            sx, sy = self._start
+            return sx + (x1 - sx) * u, sy + (y1 - sy) * u, False
+
+        if self._prev is None or dt >= self.max_extrapolate:
+            dt = self.max_extrapolate
+        t0, x0, y0 = self._prev if self._prev is not None else self._target
+        span = t1 - t0
+        if span <= 0.0:
+            return x1, y1, True
+        f = dt / span
+        return x1 + (x1 - x0) * f, y1 + (y1 - y0) * f, dt >= self.max_extrapolate
+
+    def _send(self, x: int, y: int):
+        # _send_lock held
+        if (x, y) == self._sent:
+            self.skipped += 1
+            return
+        self.inner.move_to(x, y)
+        self._sent = (x, y)
+        self.moves_sent += 1
+
+    def _output_loop(self):
+        next_t = self.clock()
+        while True:
+            with self._cond:
+                while self._running and (self._target is None or self._settled):
+                    self._cond.wait()
+                    next_t = self.clock()
+                if not self._running:
+                    return
+                x, y, self._settled = self._position(self.clock())
+
+            with self._send_lock:
+                self._send(int(round(x)), int(round(y)))
+            self.ticks += 1
+
+            next_t += self.period
+            delay = next_t - self.clock()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -self.period:
+                self.late_ticks += 1
+                next_t = self.clock()
+
+    # -------------------------
+    # MouseController methods
+    # -------------------------
+    def move_to(self, x: int, y: int):
+        now = self.clock()
+        with self._cond:
+            if self._target is None:
+                self._start = (x, y)
+            else:
+                # Glide on from wherever the cursor is now
+                px, py, _ = self._position(now)
+                self._start = (px, py)
+                gap = now - self._target[0]
+                if gap > 0:
+                    self._interval += 0.25 * (min(gap, 0.2) - self._interval)
+            self._prev = self._target
+            self._target = (now, x, y)
+            self._settled = False
+            self.targets += 1
+            self._cond.notify()
+
+    def _snap(self):
+        """Jump to the newest target (before a button / scroll event); _send_lock held."""
+        with self._cond:
+            if self._target is None:
+                return
+            _, x, y = self._target
+            self._prev = None          # no extrapolation past it
+            self._start = (x, y)       # glide from the target to itself
+        self._send(int(x), int(y))
+
+    def left_click(self):
+        with self._send_lock:
+            self._snap()
+            self.inner.left_click()
+
+    def right_click(self):
+        with self._send_lock:
+            self._snap()
+            self.inner.right_click()
+
+    def press_left(self):
+        with self._send_lock:
+            self._snap()
+            self.inner.press_left()
+
+    def release_left(self):
+        with self._send_lock:
+            self._snap()
+            self.inner.release_left()
+
+    def scroll(self, dy: int, dx: int = 0):
+        if dy != 0 or dx != 0:
+            with self._send_lock:
+                self._snap()
+                self.inner.scroll(dy, dx)
+
+    def stats(self) -> dict:
+        return {
+            "targets": self.targets,
+            "ticks": self.ticks,
+            "sent": self.moves_sent,
+            "skipped": self.skipped,
+            "late_ticks": self.late_ticks,
+        }
+
+    def close(self, timeout: float = 1.0):
+        """Stop the timer thread (the cursor stays where it is)."""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._thread.join(timeout=timeout)
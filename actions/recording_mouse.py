@@ -0,0 +1,102 @@
+# actions/recording_mouse.py
+
+# Event kinds (stored as uint8 in session recordings)
+MOVE = 0
+LEFT_CLICK = 1
+RIGHT_CLICK = 2
+PRESS_LEFT = 3
+RELEASE_LEFT = 4
+SCROLL = 5
+
+EVENT_NAMES = {
+    MOVE: "move",
+    LEFT_CLICK: "left_click",
+    RIGHT_CLICK: "right_click",
+    PRESS_LEFT: "press_left",
+    RELEASE_LEFT: "release_left",
+    SCROLL: "scroll",
+}
+
+
+class RecordingMouse:
+    """
+    Stand-in for MouseController that logs every call as
+    (frame_index, t_ms, kind, a, b) — a, b are x, y for moves and dx, dy for scroll.
+
+    If `inner` is given (e.g. the real MouseController) calls are forwarded to it,
+    so main.py can record a live session. Does not import pynput.
+    """
+
+    def __init__(self, inner=None):
+        self.inner = inner
+        self.events = []
+        self.frame_index = 0
+        self.t_ms = 0.0
+
+    def begin_frame(self, frame_index: int, t_ms: float):
+        self.frame_index = frame_index
+        self.t_ms = t_ms
+
+    def drain(self):
+        events, self.events = self.events, []
+        return events
+
+    def _log(self, kind, a=0, b=0):
+        self.events.append((self.frame_index, self.t_ms, kind, a, b))
+
+    def move_to(self, x: int, y: int):
+        self._log(MOVE, x, y)
+        if self.inner is not None:
+            self.inner.move_to(x, y)
+
+    def left_click(self):
+        self._log(LEFT_CLICK)
+        if self.inner is not None:
+            self.inner.left_click()
+
+    def right_click(self):
+        self._log(RIGHT_CLICK)
+        if self.inner is not None:
+            self.inner.right_click()
+
+    def press_left(self):
+        self._log(PRESS_LEFT)
+        if self.inner is not None:
+            self.inner.press_left()
+
+    def release_left(self):
+        self._log(RELEASE_LEFT)
+        if self.inner is not None:
+            self.inner.release_left()
+
+    def scroll(self, dy: int, dx: int = 0):
+        if dy != 0 or dx != 0:
+            self._log(SCROLL, dx, dy)
+        if self.inner is not None:
+            self.inner.scroll(dy, dx)
+
+
+class NullMouse:
+    """MouseController that moves nothing and only counts calls per event kind (headless runs)."""
+
+    def __init__(self):
+        self.counts = dict.fromkeys(EVENT_NAMES.values(), 0)
+
+    def move_to(self, x: int, y: int):
+        self.counts["move"] += 1
+
+    def left_click(self):
+        self.counts["left_click"] += 1
+
+    def right_click(self):
+        self.counts["right_click"] += 1
+
+    def press_left(self):
+        self.counts["press_left"] += 1
+
+    def release_left(self):
+        self.counts["release_left"] += 1
+
+    def scroll(self, dy: int, dx: int = 0):
+        if dy != 0 or dx != 0:
+            self.counts["scroll"] += 1
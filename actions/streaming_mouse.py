@@ -0,0 +1,40 @@
+# actions/streaming_mouse.py
+from actions.recording_mouse import LEFT_CLICK, RIGHT_CLICK, PRESS_LEFT, RELEASE_LEFT, SCROLL
+
+
+class StreamingMouse:
+    """
+    Publishes every MouseController call to a streaming.server.StreamServer
+    (cursor moves on the cursor topic, the rest on the events topic) and
+    forwards it to `inner`. With a NullMouse inside nothing is injected and
+    the stream is the only output.
+    """
+
+    def __init__(self, inner, server):
+        self.inner = inner
+        self.server = server
+
+    def move_to(self, x: int, y: int):
+        self.server.publish_cursor(x, y)
+        self.inner.move_to(x, y)
+
+    def left_click(self):
+        self.server.publish_event(LEFT_CLICK)
+        self.inner.left_click()
+
+    def right_click(self):
+        self.server.publish_event(RIGHT_CLICK)
+        self.inner.right_click()
+
+    def press_left(self):
+        self.server.publish_event(PRESS_LEFT)
+        self.inner.press_left()
+
+    def release_left(self):
+        self.server.publish_event(RELEASE_LEFT)
+        self.inner.release_left()
+
+    def scroll(self, dy: int, dx: int = 0):
+        if dy != 0 or dx != 0:
+            self.server.publish_event(SCROLL, dx, dy)
+        self.inner.scroll(dy, dx)
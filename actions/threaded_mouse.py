@@ -0,0 +1,154 @@
+# actions/threaded_mouse.py
+import threading
+from collections import deque
+
+from actions.recording_mouse import MOVE, LEFT_CLICK, RIGHT_CLICK, PRESS_LEFT, RELEASE_LEFT, SCROLL
+
+
+class ThreadedMouse:
+    """
+    Sends MouseController calls from a worker thread so a slow OS input API
+    never stalls the capture loop. Same methods as MouseController.
+
+    - Commands are sent in the order they were issued; the producer never waits.
+    - Consecutive move_to calls are merged: if the newest queued command is a
+      move, it is overwritten with the new position (counted in merged_moves).
+      Clicks / press / release / scroll are never merged or reordered, so each
+      one still lands at the position the loop moved to just before it.
+    - The queue holds at most `maxlen` commands. When a command arrives at a
+      full queue (the backend has stalled):
+        1. all queued moves but the newest are dropped (counted in merged_moves);
+        2. if still full, the oldest scroll, then the oldest left / right click
+           is dropped (counted in dropped);
+        3. press_left / release_left are never dropped, so a drag is never left
+           half done; only they can take the queue past `maxlen`.
+      So clicks and scrolls are only dropped while the backend is stuck.
+    - A command the backend raises on is counted in errors (the first one is
+      printed) and the worker carries on with the next.
+    """
+
+    def __init__(self, inner, maxlen: int = 64):
+        self.inner = inner
+        self.maxlen = max(2, int(maxlen))
+
+        self._cond = threading.Condition()
+        self._queue = deque()
+        self._running = True
+
+        # Counters
+        self.commands_queued = 0
+        self.commands_sent = 0
+        self.merged_moves = 0
+        self.dropped = 0
+        self.errors = 0
+        self.last_error = None
+        self.max_depth = 0
+
+        self._thread = threading.Thread(target=self._output_loop, name="ThreadedMouse", daemon=True)
+        self._thread.start()
+
+    def _put(self, kind, a=0, b=0):
+        with self._cond:
+            q = self._queue
+            if kind == MOVE and q and q[-1][0] == MOVE:
+                q[-1] = (MOVE, a, b)
+                self.merged_moves += 1
+                return
+            if len(q) >= self.maxlen:
+                self._make_room()
+            q.append((kind, a, b))
+            self.commands_queued += 1
+            if len(q) > self.max_depth:
+                self.max_depth = len(q)
+            self._cond.notify()
+
+    def _make_room(self):
+        """Overflow policy (see the class docstring); called with the lock held and the queue full."""
+        q = self._queue
+        moves = sum(1 for c in q if c[0] == MOVE)
+        if moves > 1:
+            newest = max(i for i, c in enumerate(q) if c[0] == MOVE)
+            kept = [c for i, c in enumerate(q) if c[0] != MOVE or i == newest]
+            q.clear()
+            q.extend(kept)
+            self.merged_moves += moves - 1
+        for kinds in ((SCROLL,), (LEFT_CLICK, RIGHT_CLICK)):
+            while len(q) >= self.maxlen:
+                i = next((i for i, c in enumerate(q) if c[0] in kinds), -1)
+                if i < 0:
+                    break
+                del q[i]
+                self.dropped += 1
+
+    def _output_loop(self):
+        inner = self.inner
+        while True:
+            with self._cond:
+                while not self._queue and self._running:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                kind, a, b = self._queue.popleft()
+
+            try:
+                if kind == MOVE:
+                    inner.move_to(a, b)
+                elif kind == LEFT_CLICK:
+                    inner.left_click()
+                elif kind == RIGHT_CLICK:
+                    inner.right_click()
+                elif kind == PRESS_LEFT:
+                    inner.press_left()
+                elif kind == RELEASE_LEFT:
+                    inner.release_left()
+                elif kind == SCROLL:
+                    inner.scroll(b, a)
+            except Exception as e:
+                # Keep draining: a dead worker would leave the queue growing forever
+                self.errors += 1
+                self.last_error = f"{type(e).__name__}: {e}"
+                if self.errors == 1:
+                    print(f"mouse output: {self.last_error}; continuing")
+                continue
+            self.commands_sent += 1
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def stats(self) -> dict:
+        return {
+            "queued": self.commands_queued,
+            "sent": self.commands_sent,
+            "depth": len(self._queue),
+            "max_depth": self.max_depth,
+            "merged_moves": self.merged_moves,
+            "dropped": self.dropped,
+            "errors": self.errors,
+        }
+
+    def move_to(self, x: int, y: int):
+        self._put(MOVE, x, y)
+
+    def left_click(self):
+        self._put(LEFT_CLICK)
+
+    def right_click(self):
+        self._put(RIGHT_CLICK)
+
+    def press_left(self):
+        self._put(PRESS_LEFT)
+
+    def release_left(self):
+        self._put(RELEASE_LEFT)
+
+    def scroll(self, dy: int, dx: int = 0):
+        if dy != 0 or dx != 0:
+            self._put(SCROLL, dx, dy)
+
+    def close(self, timeout: float = 1.0):
+        """Send what is still queued (a pending release_left matters), then stop."""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._thread.join(timeout=timeout)
@@ -0,0 +1,83 @@
+# benchmarks/adaptive_cadence.py
+"""
+Replays scripted sessions with three inference policies -- every frame, fixed
+every-3rd-frame, and InferenceScheduler -- and compares inference calls and the
+emitted click / drag / scroll events against the every-frame reference.
+Fails unless the scheduler emits the same events with fewer calls.
+
+    python -m benchmarks.adaptive_cadence
+"""
+from actions.recording_mouse import RecordingMouse, MOVE, EVENT_NAMES
+from core.controller import HandController
+from core.scheduler import InferenceScheduler
+from core.smoothing import CursorSmoother
+from gestures.recognizer import GestureRecognizer
+from benchmarks import synthetic
+
+
+def drive(frames, policy: str):
+    """Run the main.py loop logic over (t_ms, hand) frames; returns (calls, events, scheduler)."""
+    mouse = RecordingMouse()
+    gestures = GestureRecognizer()
+    controller = HandController(mouse, CursorSmoother(0.14, 3, 70), gestures, 1920, 1080, 0.0, 1.1, 3.0)
+    controller.set_frame_size(synthetic.FRAME_W, synthetic.FRAME_H)
+    scheduler = InferenceScheduler() if policy == "adaptive" else None
+
+    calls = 0
+    last_hand = None
+    for i, (t_ms, hand) in enumerate(frames):
+        ts = int(t_ms)
+        mouse.begin_frame(i, t_ms)
+
+        if scheduler is not None:
+            run = scheduler.should_run(ts)
+        else:
+            run = policy == "every" or (i + 1) % 3 == 0
+
+        if run:
+            calls += 1
+            if scheduler is not None:
+                scheduler.mark_run(ts)
+            last_hand = hand
+            controller.on_detection(last_hand, ts)
+
+        if last_hand is not None:
+            controller.step(last_hand, ts, t_ms / 1000.0)
+
+        if run and scheduler is not None:
+            scheduler.observe(last_hand, ts, gestures)
+
+    return calls, mouse.events, scheduler
+
+
+def actions(events):
+    return [EVENT_NAMES[e[2]] for e in events if e[2] != MOVE]
+
+
+def main():
+    sessions = {
+        "still 20s": synthetic.still(20.0),
+        "gestures 20s": synthetic.gestures_script(),
+        "swipes 10s": synthetic.swipes(10.0),
+    }
+    print(f"{'session':<14}{'policy':<10}{'calls':>7}{'Hz':>7}  actions vs every-frame")
+    failures = []
+    for name, frames in sessions.items():
+        ref_calls, ref_events, _ = drive(frames, "every")
+        ref = actions(ref_events)
+        duration_s = frames[-1][0] / 1000.0
+        for policy in ("every", "fixed3", "adaptive"):
+            calls, events, _ = drive(frames, policy)
+            got = actions(events)
+            verdict = "same" if got == ref else f"DIFF {got} vs {ref}"
+            print(f"{name:<14}{policy:<10}{calls:>7}{calls / duration_s:>7.1f}  {verdict}")
+            if policy == "adaptive" and got != ref:
+                failures.append(f"{name}: adaptive emitted {got}, every frame {ref}")
+            if policy == "adaptive" and calls >= ref_calls:
+                failures.append(f"{name}: adaptive made {calls} calls, every frame {ref_calls}")
+        print(f"{'':<24}reference actions: {ref}")
+    assert not failures, "\n".join(failures)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# benchmarks/allocations.py
+"""
+Allocation budget for the steady-state control path: replays a recorded
+10k-frame synthetic session (pointing, clicks, drags, scrolls, hand lost)
+through HandController with core.alloc.AllocationProfiler stages around
+decoding the recorded hands and around controller.step, and reports bytes,
+retained bytes and blocks per frame and GC collections by stage.
+
+Fails (exit status 1) when controller.step averages more than
+--budget bytes per frame, keeps objects alive, or triggers a full (gen 2)
+collection.
+
+    python -m benchmarks.allocations [--frames 10000] [--budget 512]
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+
+from actions.recording_mouse import NullMouse
+from core.alloc import AllocationProfiler
+from core.controller import HandController
+from core.smoothing import CursorSmoother
+from gestures.recognizer import GestureRecognizer
+from recording.session import SessionRecorder, load_session
+from benchmarks import synthetic
+
+HANDS = "hands"       # stage: recorded hands -> Hand (stands in for the tracker result)
+CONTROL = "control"   # stage: HandController.step
+
+
+def record_long_session(path: str, frames: int):
+    """gestures_script repeated to `frames` frames."""
+    script = synthetic.gestures_script()
+    period = script[-1][0] + 1000.0 / 30.0
+    rec = SessionRecorder(path)
+    for i in range(frames):
+        t_ms, hand = script[i % len(script)]
+        rec.write_frame(t_ms + (i // len(script)) * period, synthetic.FRAME_W, synthetic.FRAME_H,
+                        True, [hand] if hand else [])
+    rec.close()
+
+
+def replay_profiled(session, warm_up: int = 600) -> AllocationProfiler:
+    mouse = NullMouse()
+    controller = HandController(mouse, CursorSmoother(0.14, 3, 70), GestureRecognizer(),
+                                1920, 1080, 0.0, 1.1, 3.0)
+    now_s = [0.0]
+    controller.clock = lambda: now_s[0]
+    controller.set_frame_size(session.frame_w, session.frame_h)
+    t_col = session.frames["t_ms"].tolist()
+
+    prof = None
+    gc.collect()
+    for i, t_ms in enumerate(t_col):
+        if i == warm_up:
+            # Caches, lazily built arrays and first-use allocations are done by now
+            prof = AllocationProfiler(len(t_col)).start()
+        if prof is not None:
+            prof.begin_frame()
+            prof.stage(HANDS)
+        now_s[0] = t_ms / 1000.0
+        hands = session.hands(i)
+        hand = hands[0] if hands else None
+        if prof is not None:
+            prof.stage(CONTROL)
+        if hand is not None:
+            controller.step(hand, int(t_ms), t_ms / 1000.0)
+        if prof is not None:
+            prof.end_frame()
+    prof.stop()
+    return prof
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--frames", type=int, default=10000)
+    ap.add_argument("--budget", type=float, default=512.0, help="max mean bytes per frame in controller.step")
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, "long")
+        record_long_session(path, args.frames)
+        session = load_session(path)
+        prof = replay_profiled(session)
+        del session
+
+    print(prof.report())
+    s = prof.summary()
+    control = s["stages"][CONTROL]
+    full_gcs = sum(row["generations"][2] for row in s["gc"].values())
+    failures = []
+    if control["bytes"] > args.budget:
+        failures.append(f"controller.step allocates {control['bytes']:.0f} B / frame (budget {args.budget:.0f})")
+    if control["blocks"] > 0.01:
+        failures.append(f"controller.step keeps {control['blocks']:.2f} blocks / frame alive")
+    if full_gcs:
+        failures.append(f"{full_gcs} full (gen 2) collections during the replay")
+    print("\n" + ("\n".join("FAIL: " + f for f in failures) if failures else
+                  f"OK: controller.step {control['bytes']:.0f} B / frame (budget {args.budget:.0f}), "
+                  f"{control['blocks']:+.3f} blocks / frame, no full collections"))
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
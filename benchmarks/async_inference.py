@@ -0,0 +1,85 @@
+# benchmarks/async_inference.py
+"""
+Loop time and result age for sync vs AsyncHandTracker, with a stub landmarker
+that sleeps to simulate slow CPU inference. No camera or model needed. Fails
+if the threaded loop waits on the model or a result gets older than 2 x
+inference + one frame period.
+
+    python -m benchmarks.async_inference
+"""
+import time
+
+import numpy as np
+
+from vision.async_tracker import AsyncHandTracker
+
+
+class SleepyTracker:
+    """Stand-in for HandTracker: process() takes infer_ms and returns one fixed hand."""
+
+    def __init__(self, infer_ms: float):
+        self.infer_s = infer_ms / 1000.0
+        pts = [(100 + i, 200 + i) for i in range(21)]
+        self._hand = {"landmarks": pts, "thumb_tip": pts[4], "index_tip": pts[8]}
+
+    def process(self, frame_bgr, timestamp_ms: int):
+        time.sleep(self.infer_s)
+        return {"hands": [self._hand]}
+
+    def close(self):
+        pass
+
+
+def run(tracker, frames: int, fps: float):
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+    period = 1.0 / fps
+    start = time.monotonic()
+    loop_ms, ages_ms = [], []
+
+    for i in range(frames):
+        tick = start + i * period
+        now = time.monotonic()
+        if tick > now:
+            time.sleep(tick - now)
+
+        t0 = time.monotonic()
+        ts_ms = int((t0 - start) * 1000)
+        if getattr(tracker, "is_async", False):
+            tracker.submit(frame, ts_ms)
+            result = tracker.latest()
+            if result is not None:
+                ages_ms.append(ts_ms - result.timestamp_ms)
+        else:
+            tracker.process(frame, ts_ms)
+            ages_ms.append(0)
+        loop_ms.append((time.monotonic() - t0) * 1000.0)
+
+    return loop_ms, ages_ms
+
+
+def pct(values, p):
+    values = sorted(values)
+    return values[int(p * (len(values) - 1))] if values else 0.0
+
+
+def main(frames: int = 90, fps: float = 30.0):
+    print(f"{'infer ms':>9}{'mode':>8}{'loop p50':>10}{'loop max':>10}{'age p95':>10}{'age max':>10}{'dropped':>9}")
+    for infer_ms in (10, 40, 120):
+        for mode in ("sync", "thread"):
+            stub = SleepyTracker(infer_ms)
+            tracker = AsyncHandTracker(stub) if mode == "thread" else stub
+            loop_ms, ages_ms = run(tracker, frames, fps)
+            dropped = getattr(tracker, "frames_dropped", 0)
+            tracker.close()
+            print(f"{infer_ms:>9}{mode:>8}{pct(loop_ms, 0.5):>10.2f}{max(loop_ms):>10.2f}"
+                  f"{pct(ages_ms, 0.95):>10.0f}{max(ages_ms or [0]):>10.0f}{dropped:>9}")
+            if mode == "thread":
+                # A result is at most one inference old, plus one waiting for the next free frame
+                bound = 2 * infer_ms + 1000.0 / fps
+                assert ages_ms and max(ages_ms) <= bound, \
+                    f"{infer_ms} ms inference: result age reached {max(ages_ms or [0])} ms (bound {bound:.0f})"
+                assert pct(loop_ms, 0.5) < infer_ms / 2, f"{infer_ms} ms inference: loop waited on the model"
+
+
+if __name__ == "__main__":
+    main()
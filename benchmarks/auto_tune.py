@@ -0,0 +1,111 @@
+# benchmarks/auto_tune.py
+"""
+Offline tuner (recording/tune.py) on labeled synthetic sessions: records
+pointing tasks (moves between targets, clicks, right clicks, drags) whose
+intended cursor is a plain linear mapping at mouse speed 2, tunes on some
+of them and compares the current config with the tuned one on held-out
+sessions. Also reports parameter sets evaluated per minute, writes the
+result as a config.json override into a temporary directory, and runs a
+short tune of the One Euro smoother to check that only its parameters are
+searched, and that the pinch settings are left out with a gesture table.
+
+    python -m benchmarks.auto_tune [--trials 1500] [--workers 0] [--seconds 30]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import config as C
+from recording import tune
+from recording.session import SessionRecorder
+from benchmarks import synthetic
+
+SCREEN = (1920, 1080)
+
+
+def record_task(path: str, seconds: float, seed: int, jitter_px: float):
+    frames, labels = synthetic.pointing_task(seconds, jitter_px=jitter_px, seed=seed)
+    rec = SessionRecorder(path)
+    for t_ms, hand in frames:
+        rec.write_frame(t_ms, synthetic.FRAME_W, synthetic.FRAME_H, True, [hand])
+    rec.close()
+    with open(os.path.join(path, "labels.json"), "w", encoding="utf-8") as f:
+        json.dump(labels, f)
+
+
+def held_out(paths, params: dict, setup: dict | None = None) -> dict:
+    sessions = [tune.LabeledSession(p, *SCREEN) for p in paths]
+    return tune.combine([tune.evaluate(s, params, *SCREEN, setup) for s in sessions], sessions)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--trials", type=int, default=1500)
+    ap.add_argument("--workers", type=int, default=0, help="processes (default: one per CPU)")
+    ap.add_argument("--seconds", type=float, default=30.0, help="length of each session")
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as root:
+        train, test = [], []
+        for i in range(6):
+            path = os.path.join(root, f"task-{i}")
+            record_task(path, args.seconds, seed=100 + i, jitter_px=1.0 + 0.5 * (i % 3))
+            (train if i < 3 else test).append(path)
+
+        workers = args.workers or os.cpu_count() or 1
+        print(f"tuning on {len(train)} x {args.seconds:.0f} s sessions, {args.trials} sets, {workers} worker(s)")
+        t0 = time.perf_counter()
+        best, baseline, rate = tune.tune(train, args.trials, workers, SCREEN, log=lambda s: None)
+        print(f"done in {time.perf_counter() - t0:.1f} s: {rate:.0f} sets / minute "
+              f"({rate / workers:.0f} per worker)\n")
+
+        current = tune.fix_params(tune.current_params())
+        before, after = held_out(test, current), held_out(test, best[1])
+        print(f"held-out sessions ({len(test)}):")
+        print(f"{'':>16}{'current':>10}{'tuned':>10}")
+        for key in tune.WEIGHTS:
+            print(f"{key:>16}{before[key]:>10.1f}{after[key]:>10.1f}")
+        print(f"{'score':>16}{tune.score(before):>10.2f}{tune.score(after):>10.2f}")
+
+        print("\ntuned parameters:")
+        for key, value in best[1].items():
+            print(f"  {key:<28}{current[key]!s:>8} -> {value}")
+
+        overrides = tune.to_overrides(best[1])
+        assert "filter" not in overrides.get("smoothing", {}), "tuning overwrote the configured smoother"
+        out = os.path.join(root, "config.json")
+        C.save_overrides(overrides, out)
+        with open(out, "r", encoding="utf-8") as f:
+            merged = json.load(f)
+        assert merged["mapping"]["mouse_speed"] == best[1]["mapping.mouse_speed"]
+        assert merged["camera"] == C.DEFAULTS["camera"]     # untouched sections kept
+        print(f"\nwrote override -> {out} ({len(merged)} sections)")
+
+        setup = tune.current_setup("one_euro")
+        start = tune.fix_params(tune.current_params("one_euro"))
+        euro, _, _ = tune.tune(train, max(64, args.trials // 10), workers, SCREEN, log=lambda s: None, setup=setup)
+        tuned = {k for k in euro[1] if k.startswith("smoothing.")}
+        assert tuned == set(tune.SMOOTHING_SPACE["one_euro"]), f"one_euro tune searched {sorted(tuned)}"
+        assert tune.to_overrides(euro[1], "one_euro")["smoothing"]["filter"] == "one_euro"
+        before, after = held_out(test, start, setup), held_out(test, euro[1], setup)
+        print(f"one_euro smoother, held-out score {tune.score(before):.2f} -> {tune.score(after):.2f}")
+
+        # With a gesture table the app ignores the pinch settings, so they are not searched,
+        # and sessions are replayed with the table's own thresholds
+        table, C.GESTURE_TABLE = C.GESTURE_TABLE, [
+            {"name": "left", "a": "thumb_tip", "b": "middle_tip", "action": "left_click", "drag_ms": 480},
+            {"name": "right", "a": "thumb_tip", "b": "ring_tip", "action": "right_click"},
+        ]
+        try:
+            keys = tune.space()
+            assert not any(k.startswith("gestures.") for k in keys), f"pinch settings tuned with a table: {sorted(keys)}"
+            scored = held_out(test, tune.fix_params(tune.current_params()))
+        finally:
+            C.GESTURE_TABLE = table
+        print(f"with a gesture table: {len(keys)} keys tuned, held-out score {tune.score(scored):.2f}")
+
+
+if __name__ == "__main__":
+    main()
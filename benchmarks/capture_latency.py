@@ -0,0 +1,97 @@
+# benchmarks/capture_latency.py
+"""
+Loop latency of Webcam.read() (grab() flush) vs ThreadedCapture, using a fake
+VideoCapture that delivers frames at a fixed rate. No camera needed. For each
+flush_frames setting the threaded capture runs as main.py sets it up (no
+flushing); fails unless its read latency is far below the sync reads that
+flush, stays the same for every setting and delivers fresh frames.
+
+    python -m benchmarks.capture_latency
+"""
+import time
+from unittest import mock
+
+import numpy as np
+
+import camera.webcam as webcam
+
+
+class FakeVideoCapture:
+    """Blocks like a real camera: each grab/read waits for the next frame tick."""
+
+    def __init__(self, *args, fps: float = 30.0, **kwargs):
+        self.period = 1.0 / fps
+        self._next = time.monotonic()
+        self._frame = np.zeros((120, 160, 3), dtype=np.uint8)
+
+    def isOpened(self):
+        return True
+
+    def set(self, prop, value):
+        return True
+
+    def _wait_tick(self):
+        now = time.monotonic()
+        if self._next > now:
+            time.sleep(self._next - now)
+        self._next = max(self._next, now) + self.period
+
+    def grab(self):
+        self._wait_tick()
+        return True
+
+    def read(self, image=None):
+        self._wait_tick()
+        return True, self._frame.copy()
+
+    def release(self):
+        pass
+
+
+def run_loop(cam, iterations: int, work_s: float):
+    # Simulates main.py: read a frame, then "process" it for work_s
+    lat_ms = []
+    for _ in range(iterations):
+        t0 = time.monotonic()
+        frame, capture_t = cam.read_latest(timeout=0.5)
+        t1 = time.monotonic()
+        if frame is None:
+            continue
+        lat_ms.append((t1 - t0) * 1000.0)
+        time.sleep(work_s)
+    lat_ms.sort()
+    return sum(lat_ms) / max(1, len(lat_ms)), lat_ms[int(0.95 * (len(lat_ms) - 1))]
+
+
+def main(fps: float = 30.0, iterations: int = 60, work_ms: float = 10.0):
+    print(f"fake camera {fps:.0f} fps, {work_ms:.0f} ms work per loop, {iterations} loops")
+    print(f"{'mode':<22}{'read mean ms':>14}{'read p95 ms':>14}{'frame age ms':>14}")
+    period_ms = 1000.0 / fps
+    sync, threaded = {}, {}
+
+    with mock.patch.object(webcam.cv2, "VideoCapture", lambda *a, **k: FakeVideoCapture(fps=fps)):
+        for flush in (0, 1, 3, 5):
+            cam = webcam.Webcam(0, 160, 120, flush_frames=flush)
+            sync[flush], p95 = run_loop(cam, iterations, work_ms / 1000.0)
+            cam.release()
+            print(f"{'sync flush=' + str(flush):<22}{sync[flush]:>14.2f}{p95:>14.2f}")
+
+            # main.py: flush = 0 if THREADED_CAPTURE else CAMERA_FLUSH_FRAMES
+            cam = webcam.ThreadedCapture(webcam.Webcam(0, 160, 120, flush_frames=0))
+            time.sleep(0.1)
+            threaded[flush], p95 = run_loop(cam, iterations, work_ms / 1000.0)
+            stats = cam.stats()
+            cam.release()
+            print(f"{'threaded, flush=' + str(flush):<22}{threaded[flush]:>14.2f}{p95:>14.2f}"
+                  f"{stats['avg_age_ms']:>14.2f}")
+            assert stats["avg_age_ms"] < period_ms, f"flush={flush}: threaded frames {stats['avg_age_ms']:.1f} ms old"
+
+    for flush in (1, 3, 5):
+        assert threaded[flush] < sync[flush] / 2, \
+            f"flush={flush}: threaded read {threaded[flush]:.1f} ms vs sync {sync[flush]:.1f} ms"
+    spread = max(threaded.values()) - min(threaded.values())
+    assert spread < period_ms / 4, f"threaded read latency varies with flush_frames by {spread:.1f} ms"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# benchmarks/capture_profile.py
+"""
+Capture-profile probe against simulated cameras with scripted per-mode rates.
+Shows what each camera delivers for the old fixed request (1920x1080, driver
+default format) and which profile the probe picks, on a virtual clock.
+
+    python -m benchmarks.capture_profile
+"""
+import cv2
+import numpy as np
+
+from camera.profile import CaptureProfile, apply_profile, fourcc_code, measure, negotiate, probe, profile_to_dict
+
+
+class VirtualClock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self) -> float:
+        return self.t
+
+
+class SimulatedCapture:
+    """
+    cv2.VideoCapture stand-in. `modes` maps (fourcc, w, h) -> max fps; requests
+    for an unknown mode fall back like real drivers do: same size in the default
+    format if offered, else the default mode. read() advances the virtual clock
+    by one frame interval.
+    """
+
+    def __init__(self, modes: dict, default_fourcc: str, clock: VirtualClock):
+        self.modes = modes
+        self.clock = clock
+        self.props = {cv2.CAP_PROP_FOURCC: fourcc_code(default_fourcc),
+                      cv2.CAP_PROP_FRAME_WIDTH: 640, cv2.CAP_PROP_FRAME_HEIGHT: 480, cv2.CAP_PROP_FPS: 30}
+        self.default_fourcc = default_fourcc
+
+    def set(self, prop, value):
+        self.props[prop] = value
+        return True
+
+    def _mode(self):
+        code = int(self.props[cv2.CAP_PROP_FOURCC])
+        fourcc = "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4))
+        w, h = int(self.props[cv2.CAP_PROP_FRAME_WIDTH]), int(self.props[cv2.CAP_PROP_FRAME_HEIGHT])
+        for key in ((fourcc, w, h), (self.default_fourcc, w, h), (self.default_fourcc, 640, 480)):
+            if key in self.modes:
+                return key, min(self.modes[key], float(self.props[cv2.CAP_PROP_FPS]) or 1e9)
+        raise AssertionError("default mode missing")
+
+    def read(self):
+        (_, w, h), fps = self._mode()
+        self.clock.t += 1.0 / fps
+        return True, np.empty((h, w, 3), dtype=np.uint8)
+
+    def isOpened(self):
+        return True
+
+    def release(self):
+        pass
+
+
+CAMERAS = {
+    # Typical USB webcam: YUYV only fast at low resolutions, MJPG up to 1080p30
+    "usb webcam": ({
+        ("YUYV", 640, 480): 30, ("YUYV", 1280, 720): 10, ("YUYV", 1920, 1080): 5,
+        ("MJPG", 640, 480): 30, ("MJPG", 848, 480): 30, ("MJPG", 960, 540): 30,
+        ("MJPG", 1280, 720): 30, ("MJPG", 1920, 1080): 30,
+    }, "YUYV"),
+    # Laptop camera with 720p60 MJPG
+    "laptop 60fps": ({
+        ("YUYV", 640, 480): 30, ("YUYV", 1280, 720): 10,
+        ("MJPG", 640, 480): 60, ("MJPG", 1280, 720): 60, ("MJPG", 1920, 1080): 30,
+    }, "MJPG"),
+    # No MJPG at all
+    "yuyv only": ({
+        ("YUYV", 640, 480): 30, ("YUYV", 848, 480): 24, ("YUYV", 1280, 720): 8,
+    }, "YUYV"),
+}
+
+
+def main(target=(1280, 720), min_fps: float = 24.0):
+    print(f"target {target[0]}x{target[1]}, min {min_fps:.0f} fps (virtual clock)")
+    for name, (modes, default) in CAMERAS.items():
+        clock = VirtualClock()
+        cap = SimulatedCapture(modes, default, clock)
+
+        # Old behaviour: only width/height are requested
+        apply_profile(cap, CaptureProfile(1920, 1080, "", 0))
+        old = measure(cap, CaptureProfile(1920, 1080, "", 0), clock=clock)
+
+        clock.t = 0.0
+        best, results = probe(cap, *target, min_fps=min_fps, clock=clock)
+        probe_s = clock.t
+
+        print(f"\n{name}: fixed 1920x1080 -> {old.width}x{old.height} at {old.fps:.1f} fps, read {old.read_ms:.0f} ms")
+        for r in results:
+            p = r.profile
+            mark = "  <- chosen" if r is best else ""
+            print(f"  {p.fourcc} {p.width}x{p.height}@{p.fps:.0f}: got {r.width}x{r.height} "
+                  f"{r.fps:5.1f} fps, read {r.read_ms:5.1f} ms{mark}")
+        print(f"  probe time {probe_s:.1f} s")
+
+        # Second start: cached profile, no probe
+        cached = profile_to_dict(best, *target)
+        clock.t = 0.0
+        profile, probed = negotiate(cap, cached, *target, min_fps=min_fps)
+        assert probed is None and profile == best.profile and clock.t == 0.0
+        print(f"  cached start: {profile.fourcc} {profile.width}x{profile.height}@{profile.fps:.0f}, no probe")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# benchmarks/debug_viewer.py
+"""
+Control-loop time with the debug view off, drawn inline (the old main.py
+path) and on the DebugViewer thread. imshow / waitKey are replaced by fakes
+that sleep like the real ones, so no display is needed.
+
+    python -m benchmarks.debug_viewer
+"""
+import time
+
+import numpy as np
+
+from ui.viewer import DebugViewer, Overlay, draw_overlay
+
+SHOW_MS = 4.0      # imshow of a 1080p frame on a typical desktop
+WAIT_KEY_MS = 1.5  # waitKey(1) sleeps at least one timer tick
+
+
+def fake_show(window, img):
+    time.sleep(SHOW_MS / 1000.0)
+
+
+def fake_wait_key(delay_ms):
+    time.sleep(WAIT_KEY_MS / 1000.0)
+    return -1
+
+
+def make_overlay(i: int) -> Overlay:
+    pts = tuple((900 + 5 * k + i % 7, 500 + 3 * k) for k in range(21))
+    return Overlay(landmarks=pts, active_region=(0, 0, 1919, 1079), lines=["N=3 margin=0.00 gamma=1.10 speed=3.00"])
+
+
+def run(mode: str, frames: int, fps: float):
+    frame = np.full((1080, 1920, 3), 80, dtype=np.uint8)
+    viewer = DebugViewer(30.0, 0.5, show=fake_show, wait_key=fake_wait_key) if mode == "thread" else None
+
+    period = 1.0 / fps
+    start = time.perf_counter()
+    loop_ms = []
+    for i in range(frames):
+        tick = start + i * period
+        now = time.perf_counter()
+        if tick > now:
+            time.sleep(tick - now)
+
+        t0 = time.perf_counter()
+        if mode == "inline":
+            draw_overlay(frame, make_overlay(i))
+            fake_show("HandMouse Debug", frame)
+            fake_wait_key(1)
+        elif mode == "thread" and viewer.wants_frame():
+            viewer.publish(frame, make_overlay(i))
+        loop_ms.append((time.perf_counter() - t0) * 1000.0)
+
+    shown = 0
+    if viewer is not None:
+        viewer.close()
+        shown = viewer.frames_shown
+    return loop_ms, shown
+
+
+def pct(values, p):
+    values = sorted(values)
+    return values[int(p * (len(values) - 1))] if values else 0.0
+
+
+def main(frames: int = 300, fps: float = 60.0):
+    print(f"{frames} frames at {fps:.0f} fps, 1080p; debug-view cost added to each loop iteration")
+    print(f"{'mode':<8}{'p50 ms':>8}{'p95 ms':>8}{'max ms':>8}{'shown':>7}")
+    for mode in ("off", "inline", "thread"):
+        loop_ms, shown = run(mode, frames, fps)
+        if mode == "inline":
+            shown = frames
+        print(f"{mode:<8}{pct(loop_ms, 0.5):>8.2f}{pct(loop_ms, 0.95):>8.2f}{max(loop_ms):>8.2f}{shown:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+# benchmarks/display_rate.py
+"""
+Display-rate cursor output (actions/display_mouse.py): a producer thread
+stands in for the vision loop, moving the cursor target along a straight
+line at 30 fps, then holding still. A fake backend timestamps every move
+it receives.
+
+For 60 / 120 / 240 Hz and both modes, reports timer accuracy (send
+interval vs the period), CPU used by the output thread, moves sent vs
+skipped, the largest step and the lag behind the ideal (continuous) line,
+against direct per-frame output. Lag is the time-averaged distance behind
+the ideal line, in ms at the target speed. Checks that the path is
+monotonic for the linear input, that its steps are smaller than direct
+output's, that nothing is sent once the cursor has settled, and that a
+click lands on the newest target.
+
+    python -m benchmarks.display_rate [--seconds 3] [--speed 600]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from actions.display_mouse import DisplayRateMouse
+
+FPS = 30.0
+HOLD_S = 0.4
+
+
+class TimedMouse:
+    """Fake backend: (perf_counter, x, y) per move, (name, position) per button event."""
+
+    def __init__(self):
+        self.moves = []
+        self.buttons = []
+        self.pos = None
+
+    def move_to(self, x: int, y: int):
+        self.moves.append((time.perf_counter(), x, y))
+        self.pos = (x, y)
+
+    def left_click(self):
+        self.buttons.append(("left_click", self.pos))
+
+    def right_click(self):
+        self.buttons.append(("right_click", self.pos))
+
+    def press_left(self):
+        self.buttons.append(("press_left", self.pos))
+
+    def release_left(self):
+        self.buttons.append(("release_left", self.pos))
+
+    def scroll(self, dy: int, dx: int = 0):
+        self.buttons.append(("scroll", self.pos))
+
+
+class MeasuredMouse(DisplayRateMouse):
+    """DisplayRateMouse that records the CPU time of its timer thread."""
+
+    cpu_s = 0.0
+
+    def _output_loop(self):
+        t0 = time.thread_time()
+        try:
+            super()._output_loop()
+        finally:
+            self.cpu_s = time.thread_time() - t0
+
+
+def feed(mouse, seconds: float, speed: float):
+    """Linear targets at FPS for `seconds`, then the same target for HOLD_S. Returns (t0, t_stop)."""
+    t0 = time.perf_counter()
+    n = int(seconds * FPS)
+    for i in range(n):
+        due = t0 + i / FPS
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        t = time.perf_counter() - t0
+        mouse.move_to(int(100 + speed * t), int(200 + 0.5 * speed * t))
+    t_stop = time.perf_counter()
+    time.sleep(HOLD_S)
+    return t0, t_stop
+
+
+def analyse(moves, t0: float, t_stop: float, speed: float, period: float | None) -> dict:
+    m = np.array(moves, dtype=np.float64)
+    t, x, y = m[:, 0], m[:, 1], m[:, 2]
+    moving = t <= t_stop
+    dx, dy = np.diff(x), np.diff(y)
+    # Where the cursor was every ms (held between moves) vs the ideal line, after a warm-up
+    grid = np.arange(t0 + 0.2, t_stop, 0.001)
+    held = x[np.searchsorted(t, grid, side="right") - 1]
+    steady = t[1:] > t0 + 0.2
+    out = {
+        "monotonic": bool((dx >= 0).all() and (dy >= 0).all()),
+        "max_step": float(np.hypot(dx, dy)[steady].max()),
+        "lag_ms": float(np.mean(100 + speed * (grid - t0) - held) / speed * 1000.0),
+        "sent": len(moves),
+        "sent_while_settled": int((t > t_stop + HOLD_S / 2).sum()),
+    }
+    if period is not None:
+        gaps = np.diff(t[moving])
+        err = np.abs(gaps - period) * 1000.0
+        out["period_err_ms"] = (float(np.median(err)), float(np.percentile(err, 99)))
+    return out
+
+
+def click_lands_on_target(rate: float, mode: str) -> bool:
+    backend = TimedMouse()
+    mouse = DisplayRateMouse(backend, rate, mode)
+    for i in range(10):
+        mouse.move_to(100 + 10 * i, 100)
+        time.sleep(1.0 / FPS)
+    mouse.move_to(500, 300)     # far jump, then click right away
+    mouse.left_click()
+    mouse.close()
+    return backend.buttons == [("left_click", (500, 300))]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--seconds", type=float, default=3.0)
+    ap.add_argument("--speed", type=float, default=600.0, help="target speed, px / s along x")
+    ap.add_argument("--rates", type=float, nargs="*", default=[60.0, 120.0, 240.0])
+    args = ap.parse_args(argv)
+
+    print(f"linear target at {FPS:.0f} fps, {args.speed:.0f} px/s for {args.seconds:.0f} s, then {HOLD_S} s still\n")
+    print(f"{'output':>22}{'period err ms med/p99':>23}{'CPU %':>7}{'sent':>6}{'skipped':>9}"
+          f"{'max step':>10}{'lag ms':>8}")
+
+    backend = TimedMouse()
+    t0, t_stop = feed(backend, args.seconds, args.speed)
+    direct = analyse(backend.moves, t0, t_stop, args.speed, None)
+    print(f"{'direct (per frame)':>22}{'-':>23}{'-':>7}{direct['sent']:>6}{'-':>9}"
+          f"{direct['max_step']:>10.1f}{direct['lag_ms']:>8.1f}")
+
+    for rate in args.rates:
+        for mode in ("interpolate", "extrapolate"):
+            backend = TimedMouse()
+            mouse = MeasuredMouse(backend, rate, mode)
+            t0, t_stop = feed(mouse, args.seconds, args.speed)
+            mouse.close()
+            r = analyse(backend.moves, t0, t_stop, args.speed, 1.0 / rate)
+            err = f"{r['period_err_ms'][0]:.2f} / {r['period_err_ms'][1]:.2f}"
+            cpu = mouse.cpu_s / (args.seconds + HOLD_S) * 100.0
+            name = f"{rate:.0f} Hz {mode}"
+            print(f"{name:>22}{err:>23}{cpu:>7.2f}{r['sent']:>6}{mouse.skipped:>9}"
+                  f"{r['max_step']:>10.1f}{r['lag_ms']:>8.1f}")
+
+            assert r["monotonic"], f"{name}: path went backwards for a linear input"
+            assert r["sent_while_settled"] == 0, f"{name}: kept sending after the cursor settled"
+            assert r["max_step"] < direct["max_step"], f"{name}: steps as large as per-frame output"
+            assert click_lands_on_target(rate, mode), f"{name}: click did not land on the newest target"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+# benchmarks/event_stream.py
+"""
+Event stream throughput and latency: a publisher thread stands in for the
+vision loop (hands + cursor every frame, a gesture event every 10th) while
+1 / 16 / 64 local subscribers, in another process, receive and decode.
+One extra subscriber reads 1 KB every 100 ms through a tiny socket buffer;
+it should lose old messages (and stay only a bounded time behind) while
+everyone else gets all of theirs.
+
+Reports what the vision loop pays per frame (publish_* calls, and the one
+flush() that wakes the server thread), delivered messages, drops, and
+publish -> decoded latency.
+
+    python -m benchmarks.event_stream [--rate 200] [--seconds 3] [--address tcp://127.0.0.1:8799]
+"""
+import argparse
+import asyncio
+import multiprocessing as mp
+import socket
+import time
+
+import numpy as np
+
+from actions.recording_mouse import LEFT_CLICK
+from streaming.client import connect
+from streaming.protocol import ALL_TOPICS, HANDS, CURSOR, EVENTS, decode, encode_cursor, encode_hands, parse_address
+from streaming.server import StreamServer
+from benchmarks import synthetic
+
+MASKS = (ALL_TOPICS, HANDS, CURSOR | EVENTS)
+
+
+async def _consume(address: str, mask: int, origin: float):
+    reader, writer = await connect(address, mask)
+    buf, count, lat = b"", 0, []
+    while True:
+        data = await reader.read(65536)
+        if not data:
+            break
+        now = time.monotonic()
+        msgs, used = decode(buf + data)
+        buf = (buf + data)[used:]
+        count += len(msgs)
+        lat.extend(now - origin - m.t_ms / 1000.0 for m in msgs)
+    writer.close()
+    return count, lat
+
+
+async def _consume_slowly(address: str, origin: float, seconds: float):
+    """1 KB every 100 ms through a small socket buffer, for `seconds` after the first message."""
+    _, host, port = parse_address(address)
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    sock.connect((host, port))
+    sock.sendall(bytes([ALL_TOPICS]))
+    sock.setblocking(False)
+    buf, count, lat, until = b"", 0, [], None
+    while until is None or time.monotonic() < until:
+        await asyncio.sleep(0.1)
+        try:
+            data = sock.recv(1024)
+        except BlockingIOError:
+            continue
+        if not data:
+            break
+        now = time.monotonic()
+        if until is None:
+            until = now + seconds
+        msgs, used = decode(buf + data)
+        buf = (buf + data)[used:]
+        count += len(msgs)
+        lat.extend(now - origin - m.t_ms / 1000.0 for m in msgs)
+    sock.close()
+    return count, lat
+
+
+def subscriber_process(address, n: int, origin: float, seconds: float, out):
+    async def run():
+        tasks = [_consume(address, MASKS[i % len(MASKS)], origin) for i in range(n)]
+        tasks.append(_consume_slowly(address, origin, seconds))
+        return await asyncio.gather(*tasks)
+    out.put(asyncio.run(run()))
+
+
+def expected(frames: int, mask: int) -> int:
+    return frames * (bool(mask & HANDS) + bool(mask & CURSOR)) + (frames // 10) * bool(mask & EVENTS)
+
+
+def run(address: str, n: int, rate: float, seconds: float) -> dict:
+    origin = time.monotonic()
+    server = StreamServer(address, queue_size=256, time_origin=origin).start()
+    ctx = mp.get_context("spawn")
+    out = ctx.Queue()
+    proc = ctx.Process(target=subscriber_process, args=(address, n, origin, seconds, out), daemon=True)
+    proc.start()
+    while server.stats()["subscribers"] < n + 1 or server.topics != ALL_TOPICS:
+        time.sleep(0.01)
+    time.sleep(0.2)
+
+    hand = synthetic.make_hand(0.5, 0.7)
+    frames = int(rate * seconds)
+    cost = np.empty(frames)
+    flush = np.empty(frames)
+    t_next = time.perf_counter()
+    for i in range(frames):
+        t0 = time.perf_counter()
+        server.publish_hands(server.now_ms(), [hand], synthetic.FRAME_W, synthetic.FRAME_H)
+        server.publish_cursor(960 + i % 100, 540)
+        if i % 10 == 0:
+            server.publish_event(LEFT_CLICK)
+        t1 = time.perf_counter()
+        server.flush()
+        cost[i] = t1 - t0
+        flush[i] = time.perf_counter() - t1
+        t_next += 1.0 / rate
+        delay = t_next - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+    time.sleep(0.5)     # let the last messages arrive
+    stats = server.stats()
+    server.close()
+    results = out.get(timeout=30)
+    proc.join(timeout=5)
+
+    fast, slow = results[:-1], results[-1]
+    want = sum(expected(frames, MASKS[i % len(MASKS)]) for i in range(n))
+    lat = np.array([x for _, l in fast for x in l]) * 1000.0
+    return {
+        "publish_us": (float(np.median(cost) * 1e6), float(np.percentile(cost, 99) * 1e6)),
+        "flush_us": (float(np.median(flush) * 1e6), float(np.percentile(flush, 99) * 1e6)),
+        "delivered": sum(c for c, _ in fast) / max(1, want),
+        "msgs_per_s": sum(c for c, _ in fast) / seconds,
+        "lat_ms": (float(np.median(lat)), float(np.percentile(lat, 99))),
+        "slow_got": slow[0] / expected(frames, ALL_TOPICS),
+        "slow_age_ms": float(np.median(slow[1]) * 1000.0) if slow[1] else float("nan"),
+        "dropped": stats["dropped"],
+    }
+
+
+def encode_cost(rate: float, frames: int = 400) -> float:
+    """Median us to just encode a frame's messages, paced like run() (no server)."""
+    hand = synthetic.make_hand(0.5, 0.7)
+    cost = np.empty(frames)
+    for i in range(frames):
+        t0 = time.perf_counter()
+        encode_hands(0.0, [hand], synthetic.FRAME_W, synthetic.FRAME_H)
+        encode_cursor(0.0, i, 0)
+        cost[i] = time.perf_counter() - t0
+        time.sleep(1.0 / rate)
+    return float(np.median(cost) * 1e6)
+
+
+def publish_cost_idle(frames: int = 20000) -> float:
+    """us per frame with the server up but no subscribers (nothing is encoded)."""
+    server = StreamServer("tcp://127.0.0.1:0").start()
+    hand = synthetic.make_hand(0.5, 0.7)
+    t0 = time.perf_counter()
+    for i in range(frames):
+        server.publish_hands(0.0, [hand], synthetic.FRAME_W, synthetic.FRAME_H)
+        server.publish_cursor(i, 0)
+        server.flush()
+    dt = (time.perf_counter() - t0) / frames * 1e6
+    server.close()
+    return dt
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rate", type=float, default=200.0, help="published frames per second")
+    ap.add_argument("--seconds", type=float, default=3.0)
+    ap.add_argument("--address", default="tcp://127.0.0.1:8799")
+    ap.add_argument("--subscribers", type=int, nargs="*", default=[1, 16, 64])
+    args = ap.parse_args(argv)
+
+    print(f"publish cost, no subscribers: {publish_cost_idle():.2f} us / frame")
+    print(f"encoding alone at {args.rate:.0f} frames/s (cold caches between frames): "
+          f"{encode_cost(args.rate):.1f} us / frame")
+    print(f"\n{args.rate:.0f} frames/s (hands + cursor, event every 10th) for {args.seconds:.0f} s; "
+          f"+1 slow subscriber\n")
+    print(f"{'subs':>5}{'publish us med/p99':>20}{'flush us med/p99':>20}{'delivered':>11}{'msgs/s':>9}"
+          f"{'latency ms med/p99':>21}{'slow got':>10}{'slow age ms':>13}{'dropped':>9}")
+    for n in args.subscribers:
+        r = run(args.address, n, args.rate, args.seconds)
+        pub = f"{r['publish_us'][0]:.1f} / {r['publish_us'][1]:.1f}"
+        flush = f"{r['flush_us'][0]:.1f} / {r['flush_us'][1]:.1f}"
+        lat = f"{r['lat_ms'][0]:.2f} / {r['lat_ms'][1]:.2f}"
+        print(f"{n:>5}{pub:>20}{flush:>20}{r['delivered']:>11.3f}{r['msgs_per_s']:>9.0f}{lat:>21}"
+              f"{r['slow_got']:>10.2f}{r['slow_age_ms']:>13.0f}{r['dropped']:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+# benchmarks/gesture_engine.py
+"""
+Checks the table-driven GestureRecognizer against the hand-coded one it
+replaced (benchmarks/legacy_recognizer.py): identical events, `active` and
+`armed` on every frame of the scripted gestures session, randomized pinch
+sessions and a recorded session replayed through HandController. Then times
+update() for tables of growing size.
+
+    python -m benchmarks.gesture_engine [recordings/session-... ...]
+"""
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from actions.recording_mouse import RecordingMouse
+from core.controller import HandController
+from core.landmarks import THUMB_TIP
+from core.smoothing import CursorSmoother
+from gestures.recognizer import GestureRecognizer
+from gestures.table import GestureSpec, default_specs
+from recording.replay import events_digest, replay
+from recording.session import SessionRecorder, load_session
+from benchmarks import synthetic
+from benchmarks.legacy_recognizer import GestureRecognizer as LegacyRecognizer
+
+
+def random_session(seed: int, frames: int = 3000):
+    """
+    (t_ms, Hand, cursor) frames: pinches toward random fingertips with random
+    ramps, holds and partial closes near the thresholds, hand drift (scroll
+    motion), cursor walks with jumps, uneven frame intervals, and stretches
+    where the thumb wanders freely so several ratios cross at once.
+    """
+    rnd = random.Random(seed)
+    out = []
+    t = 1000.0
+    cx, cy = 0.5, 0.75
+    cursor = [960, 540]
+    pinch, amounts = None, []
+    wander = 0
+    thumb = np.array([0.0, 0.0])
+
+    for _ in range(frames):
+        if not amounts:
+            pinch = rnd.choice([None, "middle", "ring", "pinky", "middle", "pinky"])
+            peak = rnd.choice([1.0, 1.0, rnd.uniform(0.5, 0.9)])
+            up, hold, down = rnd.randint(1, 8), rnd.randint(0, 45), rnd.randint(1, 8)
+            amounts = ([peak * (k + 1) / up for k in range(up)] + [peak] * hold
+                       + [peak * (1 - (k + 1) / down) for k in range(down)] + [0.0] * rnd.randint(0, 10))
+            if rnd.random() < 0.15:
+                wander = rnd.randint(20, 90)
+        amount = amounts.pop(0)
+
+        t += rnd.choice([33.3, 33.3, 16.7, rnd.uniform(5, 60)])
+        cx = min(0.8, max(0.2, cx + rnd.gauss(0, 0.004)))
+        cy = min(0.85, max(0.5, cy + rnd.gauss(0, 0.006)))
+        step = 120 if rnd.random() < 0.03 else 6
+        cursor[0] += int(rnd.gauss(0, step))
+        cursor[1] += int(rnd.gauss(0, step))
+
+        hand = synthetic.make_hand(cx, cy, pinch=pinch, amount=amount, jitter_px=0.8, rnd=rnd)
+        if wander:
+            wander -= 1
+            thumb = np.clip(thumb + np.array([rnd.gauss(0, 0.04), rnd.gauss(0, 0.04)]), -0.3, 0.3)
+            hand.px[THUMB_TIP, :2] = hand.px[[12, 16, 20], :2].mean(axis=0) + thumb * np.ptp(hand.px[:, 0])
+        out.append((t, hand, tuple(cursor)))
+    return out
+
+
+def scripted_session():
+    frames = synthetic.gestures_script()
+    out, cursor = [], (960, 540)
+    for t_ms, hand in frames:
+        if hand is not None:
+            cursor = (int(hand.px[8, 0] * 1.5), int(hand.px[8, 1] * 1.5))
+            out.append((t_ms + 1000.0, hand, cursor))
+    return out
+
+
+def compare(frames) -> tuple[int, dict]:
+    """Frames where the recognizers disagree (0 = identical) and the event counts."""
+    old, new = LegacyRecognizer(), GestureRecognizer()
+    mismatches = 0
+    counts = dict.fromkeys(("left_click", "right_click", "drag_start", "drag_end", "scroll"), 0)
+    for t_ms, hand, cursor in frames:
+        a = old.update(hand, int(t_ms), cursor)
+        b = new.update(hand, int(t_ms), cursor)
+        if a != b or old.active != new.active or old.armed != new.armed:
+            mismatches += 1
+        for k in counts:
+            counts[k] += abs(b[k]) if k == "scroll" else int(b[k])
+    return mismatches, counts
+
+
+def record(frames, path):
+    rec = SessionRecorder(path)
+    for t_ms, hand in frames:
+        rec.write_frame(t_ms, synthetic.FRAME_W, synthetic.FRAME_H, True, [hand] if hand else [])
+    rec.close()
+
+
+def replay_digest(path, gestures) -> tuple[str, int]:
+    session = load_session(path)
+    mouse = RecordingMouse()
+    controller = HandController(mouse, CursorSmoother(0.14, 3, 70), gestures, 1920, 1080, 0.0, 1.1, 3.0)
+    events = replay(session, controller, mouse)
+    return events_digest(events), len(events)
+
+
+def scaled_specs(n: int) -> list[GestureSpec]:
+    """The default table plus extra click gestures on other landmark pairs, `n` in total."""
+    specs = default_specs()
+    pairs = [(a, b) for a in (8, 12, 16, 20, 3, 7) for b in (0, 5, 9, 13, 17, 2)]
+    for k in range(n - len(specs)):
+        a, b = pairs[k % len(pairs)]
+        specs.append(GestureSpec(f"extra{k}", a, b, ("left_click", "right_click")[k % 2], 0.02, 0.03))
+    specs[2].suppresses = [s.name for s in specs if s.name != "scroll"]
+    return specs
+
+
+def time_update(rec, frames, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for t_ms, hand, cursor in frames:
+            rec.update(hand, int(t_ms), cursor)
+        best = min(best, (time.perf_counter() - t0) / len(frames) * 1e6)
+    return best
+
+
+def main(sessions=()):
+    print("event equivalence, table-driven vs hand-coded recognizer:")
+    failed = False
+    cases = [("gestures_script", scripted_session())]
+    cases += [(f"random seed {s}", random_session(s)) for s in range(8)]
+    for name, frames in cases:
+        mismatches, counts = compare(frames)
+        failed |= mismatches > 0
+        shown = ", ".join(f"{k} {v}" for k, v in counts.items())
+        print(f"  {name:<18}{len(frames):>6} frames  mismatches {mismatches}  ({shown})")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        record(synthetic.gestures_script(), tmp)
+        sessions = [("recorded gestures_script", tmp)] + [(p, p) for p in sessions]
+        for name, path in sessions:
+            old = replay_digest(path, LegacyRecognizer())
+            new = replay_digest(path, GestureRecognizer())
+            failed |= old != new
+            print(f"  {name:<26} replay {new[1]} events, digest {'match' if old == new else 'DIFFERS'}")
+    if failed:
+        raise SystemExit("table-driven recognizer differs from the hand-coded one")
+
+    idle = [(t, synthetic.make_hand(0.5, 0.75), c) for t, _, c in random_session(99, 600)]
+    busy = random_session(100, 2000)
+    print(f"\nupdate() cost, us (idle hand / random pinch session):")
+    print(f"  {'hand-coded, 3':<18}{time_update(LegacyRecognizer(), idle):>8.2f}{time_update(LegacyRecognizer(), busy):>8.2f}")
+    for n in (3, 6, 12, 24, 48):
+        idle_us = time_update(GestureRecognizer(specs=scaled_specs(n)), idle)
+        busy_us = time_update(GestureRecognizer(specs=scaled_specs(n)), busy)
+        print(f"  {f'table, {n}':<18}{idle_us:>8.2f}{busy_us:>8.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
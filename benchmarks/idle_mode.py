@@ -0,0 +1,225 @@
+# benchmarks/idle_mode.py
+"""
+Idle mode (core/idle.py): CPU time and wake-up latency on a generated scene
+that alternates empty segments (sensor noise, plus a dim object moving
+outside the active region) with a hand entering from the bottom edge.
+A stub landmarker finds the bright "hand" and burns --cost-ms of CPU per
+call, like the real model.
+
+Runs the same scene with the landmarker always on (every Nth frame, as
+main.py without idle mode) and with idle mode, and reports CPU use, model
+calls, frames captured, and per hand entry the time from the hand entering
+the active region to the first detection that has it.
+
+    python -m benchmarks.idle_mode [--cycles 3] [--empty-s 8] [--hand-s 3] [--cost-ms 15]
+"""
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from camera.webcam import FrameSource, FramePool, ThreadedCapture
+from core.idle import IdleMonitor, MotionDetector
+from core.mapping import compute_active_region
+from vision.hand_tracker import HandTracker
+from benchmarks.multi_camera import BlobLandmarker
+
+W, H = 1280, 720
+FPS = 30.0
+MARGIN = 0.1
+RADIUS = 60
+EVERY_N = 3
+
+
+class SceneSource(FrameSource):
+    """
+    Camera-like source: frames paced to `fps` and drawn for the wall-clock time
+    they are read at, so a throttled reader skips scene time instead of slowing
+    it. Scene: `cycles` x (empty_s of noise, hand_s with a hand), then eof.
+    """
+
+    def __init__(self, cycles: int, empty_s: float, hand_s: float, seed: int = 0):
+        self.cycles, self.empty_s, self.hand_s = cycles, empty_s, hand_s
+        self.region = compute_active_region(W, H, MARGIN)
+        rng = np.random.default_rng(seed)
+        self._noise = [np.clip(40 + rng.normal(0, 3, (H, W, 1)), 0, 255).astype(np.uint8).repeat(3, axis=2)
+                       for _ in range(4)]
+        self._pool = FramePool(2)
+        self._start = None
+        self._n = 0
+
+    @property
+    def duration_s(self) -> float:
+        return self.cycles * (self.empty_s + self.hand_s)
+
+    def hand_center(self, t: float):
+        """(x, y) of the hand at scene time t, or None; it rises in over 0.5 s, then wanders."""
+        cycle, u = divmod(t, self.empty_s + self.hand_s)
+        u -= self.empty_s
+        if u < 0:
+            return None, int(cycle)
+        x = W * (0.3 + 0.4 * (cycle % 2)) + 80 * np.sin(2.0 * u)
+        y = H + RADIUS - min(1.0, u / 0.5) * (H * 0.45 + RADIUS) + 40 * np.sin(3.0 * u)
+        return (int(x), int(y)), int(cycle)
+
+    def read(self, out=None):
+        now = time.monotonic()
+        if self._start is None:
+            self._start = now
+        # Next frame boundary, like a camera running at FPS
+        due = self._start + np.ceil((now - self._start) * FPS) / FPS
+        if due > now:
+            time.sleep(due - now)
+        t = time.monotonic() - self._start
+        if t >= self.duration_s:
+            self.eof = True
+            return None
+
+        buf = out if out is not None else self._pool.next()
+        if buf is None or buf.shape != (H, W, 3):
+            buf = np.empty((H, W, 3), dtype=np.uint8)
+            if out is None:
+                self._pool.keep(buf)
+        self._n += 1
+        buf[:] = self._noise[self._n % len(self._noise)]
+
+        # Something moving above the active region (a person walking past in the background)
+        bx = int((t * 300) % W)
+        cv2.rectangle(buf, (bx, 5), (bx + 80, int(H * MARGIN) - 5), (100, 100, 100), -1)
+
+        center, cycle = self.hand_center(t)
+        if center is not None:
+            cv2.circle(buf, center, RADIUS, (230, 230, 230), -1)
+        return buf
+
+    def hand_entries(self) -> list:
+        """Monotonic times the hand reaches the active region, whether or not a frame was read then."""
+        out = []
+        for c in range(self.cycles):
+            t0 = c * (self.empty_s + self.hand_s) + self.empty_s
+            for u in np.arange(0.0, self.hand_s, 0.001):
+                center, _ = self.hand_center(t0 + u)
+                if center[1] - RADIUS < self.region.y1:
+                    out.append(self._start + t0 + u)
+                    break
+        return out
+
+
+def run(args, idle: IdleMonitor | None) -> dict:
+    source = SceneSource(args.cycles, args.empty_s, args.hand_s)
+    tracker = HandTracker(1, 0.5, 0.5, "", landmarker=BlobLandmarker(args.cost_ms))
+    tracker.warm_up(W, H)
+    cam = ThreadedCapture(source)
+    region = source.region
+
+    detections = []      # (monotonic, has hand)
+    usage = []           # (monotonic, process CPU s) per iteration
+    calls = frames = 0
+    last_hand = None
+    t0, cpu0 = time.monotonic(), time.process_time()
+    try:
+        while True:
+            usage.append((time.monotonic(), time.process_time()))
+            frame, capture_t = cam.read_latest(timeout=0.05)
+            if frame is None:
+                if cam.eof:
+                    break
+                continue
+            frames += 1
+            timestamp_ms = int((capture_t - t0) * 1000.0)
+
+            waking = False
+            if idle is not None and idle.idle:
+                waking = idle.motion(frame, region, timestamp_ms)
+                if waking:
+                    cam.set_interval(0.0)
+            if idle is not None and idle.idle:
+                continue
+            if not waking and frames % EVERY_N:
+                continue
+
+            hands = tracker.process(frame, timestamp_ms)["hands"]
+            calls += 1
+            last_hand = hands[0] if hands else None
+            detections.append((time.monotonic(), last_hand is not None))
+            if idle is not None and idle.observe(last_hand, timestamp_ms):
+                cam.set_interval(idle.frame_interval_s)
+    finally:
+        wall, cpu = time.monotonic() - t0, time.process_time() - cpu0
+        captured = cam.stats()["captured"]
+        cam.release()
+
+    # CPU over the empty stretches, from 0.5 s after idle could have started
+    mono, used = np.array(usage).T
+    empty_cpu = empty_wall = 0.0
+    for c in range(source.cycles):
+        a = source._start + c * (source.empty_s + source.hand_s) + args.idle_after_ms / 1000.0 + 0.5
+        b = source._start + c * (source.empty_s + source.hand_s) + source.empty_s
+        if b > a:
+            empty_cpu += float(np.interp(b, mono, used) - np.interp(a, mono, used))
+            empty_wall += b - a
+
+    wake = []
+    entries = source.hand_entries()
+    for entry in entries:
+        hit = next((t for t, has in detections if has and t >= entry), None)
+        wake.append((hit - entry) * 1000.0 if hit is not None else float("nan"))
+    out = {
+        "cpu": cpu / wall,
+        "cpu_empty": empty_cpu / max(1e-9, empty_wall),
+        "calls_per_s": calls / wall,
+        "captured_per_s": captured / wall,
+        "wake_ms": wake,
+        "entries": len(entries),
+    }
+    if idle is not None:
+        out.update(idle.stats())
+    return out
+
+
+def detector_cost(iterations: int = 2000) -> float:
+    """us per MotionDetector.update on a full 1280x720 frame."""
+    frames = [np.clip(40 + np.random.default_rng(i).normal(0, 3, (H, W, 3)), 0, 255).astype(np.uint8)
+              for i in range(2)]
+    region = compute_active_region(W, H, MARGIN)
+    det = MotionDetector()
+    det.update(frames[0], region)
+    t0 = time.perf_counter()
+    moved = 0
+    for i in range(iterations):
+        moved += det.update(frames[i % 2], region)
+    assert moved == 0, "sensor noise alone must not count as motion"
+    return (time.perf_counter() - t0) / iterations * 1e6
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--cycles", type=int, default=3)
+    ap.add_argument("--empty-s", type=float, default=8.0)
+    ap.add_argument("--hand-s", type=float, default=3.0)
+    ap.add_argument("--cost-ms", type=float, default=15.0, help="stub landmarker CPU per call")
+    ap.add_argument("--idle-after-ms", type=float, default=2000.0)
+    ap.add_argument("--idle-fps", type=float, default=10.0)
+    args = ap.parse_args(argv)
+
+    print(f"motion detector: {detector_cost():.0f} us / frame ({W}x{H} -> 64 px wide gray)")
+    print(f"scene: {args.cycles} x ({args.empty_s:.0f} s empty, {args.hand_s:.0f} s hand), {FPS:.0f} fps, "
+          f"landmarker {args.cost_ms:.0f} ms / call, every {EVERY_N}rd frame while tracking\n")
+    print(f"{'mode':>12}{'CPU %':>8}{'empty CPU %':>13}{'model/s':>9}{'frames/s':>10}{'wake ms med/max':>17}{'wakeups':>9}")
+    for name in ("always on", "idle"):
+        idle = IdleMonitor(args.idle_after_ms, args.idle_fps) if name == "idle" else None
+        r = run(args, idle)
+        wake = np.array(r["wake_ms"])
+        shown = f"{np.nanmedian(wake):.0f} / {np.nanmax(wake):.0f}" if np.isfinite(wake).any() else "-"
+        wakeups = f"{r['wakeups']}/{r['entries']}" if idle is not None else "-"
+        print(f"{name:>12}{r['cpu'] * 100:>8.1f}{r['cpu_empty'] * 100:>13.1f}{r['calls_per_s']:>9.1f}{r['captured_per_s']:>10.1f}"
+              f"{shown:>17}{wakeups:>9}")
+        print(f"{'':>12}wake ms per entry: {' '.join(f'{w:.0f}' for w in wake)}")
+        if idle is not None:
+            assert np.isfinite(wake).all(), "every hand entry must be detected"
+            assert r["wakeups"] == r["entries"], "motion outside the active region woke tracking"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# benchmarks/landmark_pipeline.py
+"""
+Per-frame cost of landmark extraction and gesture evaluation: the old
+list-of-int-tuples path with the recognizer as first shipped
+(benchmarks/baseline_recognizer.py) vs Hand (float32 (21, 3) arrays, with
+scalar reads for the per-frame pose gate and pinch distances) with the current
+table-driven recognizer, and the net per-frame total. The vectorized
+pair_distances is timed as well; it pays off for the gesture table, not for
+three pairs.
+
+    python -m benchmarks.landmark_pipeline
+"""
+import math
+import random
+import time
+from types import SimpleNamespace
+
+from core.landmarks import hand_from_landmarks, pair_distances
+from core.pose import is_index_pointing
+from gestures.recognizer import GestureRecognizer
+from benchmarks.baseline_recognizer import GestureRecognizer as BaselineRecognizer
+
+W, H = 1920, 1080
+
+
+def fake_landmarks(seed=3):
+    rnd = random.Random(seed)
+    return [SimpleNamespace(x=rnd.uniform(0.3, 0.7), y=rnd.uniform(0.3, 0.7), z=rnd.uniform(-0.1, 0.1))
+            for _ in range(21)]
+
+
+# -------------------------
+# Old path (as it was before Hand arrays)
+# -------------------------
+def legacy_extract(hand_landmarks, w, h):
+    pts = []
+    for lm in hand_landmarks:
+        pts.append((int(lm.x * w), int(lm.y * h)))
+    return {"landmarks": pts, "thumb_tip": pts[4], "index_tip": pts[8]}
+
+
+def legacy_is_index_pointing(lms):
+    return (lms[8][1] < lms[6][1] and lms[12][1] > lms[10][1]
+            and lms[16][1] > lms[14][1] and lms[20][1] > lms[18][1])
+
+
+def legacy_ratios(pts):
+    def dist(a, b):
+        return math.hypot(a[0] - b[0], a[1] - b[1])
+    palm_w = max(dist(pts[5], pts[17]), 1.0)
+    return dist(pts[4], pts[12]) / palm_w, dist(pts[4], pts[16]) / palm_w, dist(pts[4], pts[20]) / palm_w
+
+
+def hand_ratios(hand):
+    palm_w = max(hand.distance(5, 17), 1.0)
+    return hand.distance(4, 12) / palm_w, hand.distance(4, 16) / palm_w, hand.distance(4, 20) / palm_w
+
+
+def timeit(fn, n):
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) / n * 1e6
+
+
+def main(n: int = 20000):
+    lms = fake_landmarks()
+    old = legacy_extract(lms, W, H)
+    new = hand_from_landmarks(lms, W, H)
+    rec_old, rec_new = BaselineRecognizer(), GestureRecognizer()
+    cursor = (500, 500)
+
+    rows = [
+        ("extract", timeit(lambda: legacy_extract(lms, W, H), n),
+         timeit(lambda: hand_from_landmarks(lms, W, H), n)),
+        ("pose gate", timeit(lambda: legacy_is_index_pointing(old["landmarks"]), n),
+         timeit(lambda: is_index_pointing(new), n)),
+        ("pinch distances", timeit(lambda: legacy_ratios(old["landmarks"]), n),
+         timeit(lambda: hand_ratios(new), n)),
+        ("pair_distances (batch)", timeit(lambda: legacy_ratios(old["landmarks"]), n),
+         timeit(lambda: pair_distances(new.px, rec_new._a, rec_new._b), n)),
+        ("recognizer.update", timeit(lambda: rec_old.update(old, 0, cursor), n),
+         timeit(lambda: rec_new.update(new, 0, cursor), n)),
+    ]
+    assert is_index_pointing(new) == legacy_is_index_pointing(old["landmarks"])
+    assert all(abs(a - b) < 0.01 for a, b in zip(hand_ratios(new), legacy_ratios(old["landmarks"])))
+    assert rec_old.update(old, 0, cursor) == rec_new.update(new, 0, cursor)
+    # What one frame with a fresh detection runs (the pinch distances are inside update)
+    per_frame = {"extract", "pose gate", "recognizer.update"}
+    rows.append(("per frame (net)", sum(a for name, a, _ in rows if name in per_frame),
+                 sum(b for name, _, b in rows if name in per_frame)))
+    print(f"{'stage':<24}{'before us':>11}{'Hand us':>11}{'change':>9}")
+    for name, a, b in rows:
+        print(f"{name:<24}{a:>11.2f}{b:>11.2f}{(b - a) / a * 100.0:>+8.0f}%")
+    print("before: int tuples and the recognizer as first shipped; Hand: arrays and the table-driven recognizer")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# benchmarks/latency_overhead.py
+"""
+Cost of timing one stage with LatencyStats (two perf() calls + add()).
+Exits non-zero if it exceeds the budget.
+
+    python -m benchmarks.latency_overhead [budget_us]
+"""
+import sys
+
+from core.latency import LatencyStats, perf, DETECT, GESTURES, OUTPUT
+
+
+def per_stage_us(n: int = 200000) -> float:
+    stats = LatencyStats(2048)
+    stages = (DETECT, GESTURES, OUTPUT)
+
+    t0 = perf()
+    for i in range(n):
+        s = stages[i % 3]
+    base = perf() - t0
+
+    t0 = perf()
+    for i in range(n):
+        s = stages[i % 3]
+        t = perf()
+        stats.add(s, perf() - t)
+    timed = perf() - t0
+
+    return (timed - base) / n * 1e6
+
+
+def main(budget_us: float = 3.0):
+    us = per_stage_us()
+    stats = LatencyStats(2048)
+    for i in range(2048):
+        stats.add(DETECT, i * 1e-5)
+    t0 = perf()
+    stats.summary()
+    summary_ms = (perf() - t0) * 1000.0
+
+    print(f"instrumentation overhead: {us:.3f} us per stage (budget {budget_us:.1f} us)")
+    print(f"summary() over a full 2048-sample window: {summary_ms:.2f} ms")
+    if us > budget_us:
+        print("FAIL: over budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 3.0)
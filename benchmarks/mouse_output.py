@@ -0,0 +1,194 @@
+# benchmarks/mouse_output.py
+"""
+Producer stall and event order for direct vs ThreadedMouse output, with a fake
+backend that sleeps on every call to simulate a slow OS input API.
+
+Checks that clicks / drags / scrolls reach the backend in exactly the issued
+order, each preceded by the same cursor position the loop had moved to, that a
+stalled backend keeps the queue bounded, and that a backend raising errors does
+not stop the output thread.
+
+    python -m benchmarks.mouse_output
+"""
+import threading
+import time
+
+from actions.recording_mouse import RecordingMouse, MOVE, EVENT_NAMES
+from actions.threaded_mouse import ThreadedMouse
+
+
+class SlowMouse(RecordingMouse):
+    """RecordingMouse that sleeps `delay_ms` per call (pynput on a busy desktop)."""
+
+    def __init__(self, delay_ms: float):
+        super().__init__()
+        self.delay_s = delay_ms / 1000.0
+
+    def _log(self, kind, a=0, b=0):
+        time.sleep(self.delay_s)
+        super()._log(kind, a, b)
+
+
+def script(frames: int = 240):
+    """Per-frame calls of the loop: a move every frame, plus click / drag / scroll."""
+    out = []
+    for i in range(frames):
+        calls = [("move_to", (400 + i, 300 + (i % 50)))]
+        if i % 40 == 10:
+            calls.append(("left_click", ()))
+        if i % 40 == 20:
+            calls.append(("press_left", ()))
+        if i % 40 == 25:
+            calls.append(("release_left", ()))
+        if i % 40 == 30:
+            calls.append(("scroll", (-2,)))
+        if i % 40 == 35:
+            calls.append(("right_click", ()))
+        out.append(calls)
+    return out
+
+
+def expected_actions(frames):
+    """(action, position moved to just before it) for every non-move call."""
+    pos, out = None, []
+    for calls in frames:
+        for name, args in calls:
+            if name == "move_to":
+                pos = args
+            else:
+                out.append((name, pos))
+    return out
+
+
+def sent_actions(events):
+    pos, out = None, []
+    for _, _, kind, a, b in events:
+        if kind == MOVE:
+            pos = (a, b)
+        else:
+            out.append((EVENT_NAMES[kind], pos))
+    return out
+
+
+class StalledMouse(RecordingMouse):
+    """RecordingMouse whose calls block until `resume` is set (a hung OS input API)."""
+
+    def __init__(self):
+        super().__init__()
+        self.resume = threading.Event()
+
+    def _log(self, kind, a=0, b=0):
+        self.resume.wait()
+        super()._log(kind, a, b)
+
+
+def check_stall(frames, maxlen: int = 16):
+    """A stalled backend keeps the queue bounded; press / release all arrive, in order, once it resumes."""
+    backend = StalledMouse()
+    mouse = ThreadedMouse(backend, maxlen=maxlen)
+    presses = 0
+    for calls in frames * 4:
+        for name, args in calls:
+            getattr(mouse, name)(*args)
+            presses += name in ("press_left", "release_left")
+    # Only press / release may take it past maxlen (plus the newest move and the arriving command)
+    bound = max(maxlen, presses + 2)
+    assert mouse.max_depth <= bound, f"queue grew to {mouse.max_depth} (maxlen {maxlen}, bound {bound})"
+    backend.resume.set()
+    mouse.close(timeout=10.0)
+    s = mouse.stats()
+    buttons = [EVENT_NAMES[e[2]] for e in backend.events if EVENT_NAMES[e[2]] in ("press_left", "release_left")]
+    assert len(buttons) == presses and buttons == ["press_left", "release_left"] * (presses // 2), \
+        "press / release lost or reordered"
+    assert backend.events[-1][2:] == (MOVE,) + frames[-1][0][1], "newest position not sent last"
+    print(f"stalled backend, maxlen {maxlen}: max q {s['max_depth']}, sent {s['sent']}, "
+          f"merged {s['merged_moves']}, dropped {s['dropped']}, press/release {len(buttons)}/{presses}")
+
+
+class FailingMouse(RecordingMouse):
+    """RecordingMouse whose every `every`-th call raises (a flaky OS input API)."""
+
+    def __init__(self, every: int = 3):
+        super().__init__()
+        self.every = every
+        self.calls = 0
+
+    def _log(self, kind, a=0, b=0):
+        self.calls += 1
+        if self.calls % self.every == 0:
+            raise OSError("input injection failed")
+        super()._log(kind, a, b)
+
+
+def check_errors(frames, every: int = 3):
+    """A backend that raises does not stop the worker: the rest is still sent and errors are counted."""
+    backend = FailingMouse(every)
+    mouse = ThreadedMouse(backend)
+    issued = 0
+    for calls in frames:
+        for name, args in calls:
+            getattr(mouse, name)(*args)
+            issued += 1
+    mouse.close(timeout=10.0)
+    s = mouse.stats()
+    assert s["depth"] == 0 and not mouse._thread.is_alive(), "queue not drained after backend errors"
+    assert s["errors"] == backend.calls // every and s["sent"] == len(backend.events), \
+        f"errors {s['errors']}, sent {s['sent']} for {backend.calls} backend calls"
+    print(f"failing backend (one in {every} calls): sent {s['sent']}, errors {s['errors']}, last {mouse.last_error!r}")
+
+
+def run(mouse, frames, fps: float):
+    """Issue each frame's calls at `fps`; returns the time spent in mouse calls per frame (ms)."""
+    period = 1.0 / fps
+    start = time.perf_counter()
+    call_ms = []
+    for i, calls in enumerate(frames):
+        tick = start + i * period
+        now = time.perf_counter()
+        if tick > now:
+            time.sleep(tick - now)
+        t0 = time.perf_counter()
+        for name, args in calls:
+            getattr(mouse, name)(*args)
+        call_ms.append((time.perf_counter() - t0) * 1000.0)
+    return call_ms
+
+
+def pct(values, p):
+    values = sorted(values)
+    return values[int(p * (len(values) - 1))] if values else 0.0
+
+
+def main(fps: float = 60.0):
+    frames = script()
+    expected = expected_actions(frames)
+    last_move = (MOVE,) + frames[-1][0][1]
+    n_calls = sum(len(c) for c in frames)
+    print(f"{len(frames)} frames at {fps:.0f} fps, {n_calls} calls; fake backend sleeps `delay` ms per call")
+    print(f"{'mode':<10}{'delay':>7}{'call p50':>10}{'call max':>10}{'sent':>6}{'merged':>8}{'max q':>7}  order")
+
+    for delay_ms in (2.0, 8.0, 40.0):
+        # Direct: the loop waits on every backend call
+        backend = SlowMouse(delay_ms)
+        call_ms = run(backend, frames, fps)
+        ok = sent_actions(backend.events) == expected
+        print(f"{'direct':<10}{delay_ms:>7.1f}{pct(call_ms, 0.5):>10.2f}{max(call_ms):>10.2f}"
+              f"{len(backend.events):>6}{0:>8}{0:>7}  {'same' if ok else 'DIFF'}")
+
+        backend = SlowMouse(delay_ms)
+        mouse = ThreadedMouse(backend)
+        call_ms = run(mouse, frames, fps)
+        mouse.close(timeout=30.0)
+        ok = sent_actions(backend.events) == expected and backend.events[-1][2:] == last_move
+        s = mouse.stats()
+        print(f"{'threaded':<10}{delay_ms:>7.1f}{pct(call_ms, 0.5):>10.2f}{max(call_ms):>10.2f}"
+              f"{s['sent']:>6}{s['merged_moves']:>8}{s['max_depth']:>7}  {'same' if ok else 'DIFF'}")
+        if not ok:
+            raise SystemExit(f"event order differs with a {delay_ms} ms backend")
+
+    check_stall(frames)
+    check_errors(frames)
+
+
+if __name__ == "__main__":
+    main()
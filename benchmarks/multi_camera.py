@@ -0,0 +1,196 @@
+# benchmarks/multi_camera.py
+"""
+Multi-camera tracking on generated video files: a bright square (the "hand")
+sweeps across a wide workspace that each camera only partly sees. A stub
+landmarker finds the square and burns --cost-ms of CPU per call while holding
+the GIL, like the real model.
+
+Compares, for 1 / 2 / 4 cameras:
+  in-process  one thread running every camera's tracker in turn
+  processes   MultiCameraTracker (one worker process per camera)
+reporting results per second per camera, capture -> result latency and the
+fraction of results that have the hand. Also checks fuse() on fixed views.
+
+    python -m benchmarks.multi_camera [--cost-ms 8] [--seconds 4]
+
+Scaling needs spare cores: with fewer cores than cameras the workers share
+them and latency grows as in-process.
+"""
+import argparse
+import functools
+import os
+import tempfile
+import time
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+
+from camera.sources import VideoFileSource
+from camera.webcam import ThreadedCapture
+from vision.hand_tracker import HandTracker
+from vision.multi_camera import CameraView, MultiCameraTracker, fuse, to_workspace
+from benchmarks.synthetic import POINTING
+
+CAM_W, CAM_H = 320, 240
+FPS = 30.0
+SQUARE = 0.06       # hand square side, fraction of workspace width
+
+
+def hand_x(i: int, frames: int) -> float:
+    """Workspace x of the square in frame i: one sweep right and back."""
+    return 0.5 - 0.45 * np.cos(2.0 * np.pi * i / frames)
+
+
+def camera_regions(n: int):
+    """n side-by-side views of the workspace; 1 camera sees the left 60%."""
+    if n == 1:
+        return [(0.0, 0.0, 0.6, 1.0)]
+    width = 1.0 / n + 0.1
+    step = (1.0 - width) / (n - 1)
+    return [(i * step, 0.0, i * step + width, 1.0) for i in range(n)]
+
+
+def write_videos(root: str, regions, seconds: float) -> list[str]:
+    frames = int(seconds * FPS)
+    paths = []
+    for c, (x0, y0, x1, y1) in enumerate(regions):
+        path = os.path.join(root, f"cam{c}-{len(regions)}.avi")
+        out = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), FPS, (CAM_W, CAM_H))
+        for i in range(frames):
+            frame = np.full((CAM_H, CAM_W, 3), 30, dtype=np.uint8)
+            cx = (hand_x(i, frames) - x0) / (x1 - x0) * CAM_W
+            half = SQUARE / (x1 - x0) * CAM_W / 2
+            a, b = int(max(0, cx - half)), int(min(CAM_W, cx + half))
+            if b > a:
+                frame[CAM_H // 2 - int(half):CAM_H // 2 + int(half), a:b] = 230
+            out.write(frame)
+        out.release()
+        paths.append(path)
+    return paths
+
+
+class BlobLandmarker:
+    """Pointing hand centred on the bright square; score falls as the square leaves the frame."""
+
+    def __init__(self, cost_ms: float = 8.0):
+        self.cost_ms = cost_ms
+
+    def detect_for_video(self, mp_image, timestamp_ms):
+        end = time.perf_counter() + self.cost_ms / 1000.0
+        while time.perf_counter() < end:
+            pass
+        img = mp_image.numpy_view()[:, :, 0]
+        h, w = img.shape
+        ys, xs = np.nonzero(img > 128)
+        if xs.size < 20:
+            return SimpleNamespace(hand_landmarks=[], handedness=[])
+        cx, cy = (xs.mean() + 0.5) / w, (ys.mean() + 0.5) / h
+        visible = min(1.0, (xs.max() - xs.min() + 1) / max(1, ys.max() - ys.min() + 1))
+        lms = [SimpleNamespace(x=cx + x * 0.2, y=cy + y * 0.2, z=0.0) for x, y in POINTING.tolist()]
+        score = 0.5 + 0.45 * visible
+        return SimpleNamespace(hand_landmarks=[lms], handedness=[[SimpleNamespace(category_name="Right", score=score)]])
+
+    def close(self):
+        pass
+
+
+def summarize(ages_s, has_hand, results, seconds) -> dict:
+    ages = np.array(ages_s) * 1000.0
+    return {
+        "rate": [r / seconds for r in results],
+        "median_ms": float(np.median(ages)) if ages.size else float("nan"),
+        "p95_ms": float(np.percentile(ages, 95)) if ages.size else float("nan"),
+        "coverage": float(np.mean(has_hand)) if has_hand else 0.0,
+    }
+
+
+def run_in_process(paths, regions, cost_ms: float, seconds: float) -> dict:
+    trackers = [HandTracker(1, 0.5, 0.5, "", landmarker=BlobLandmarker(cost_ms)) for _ in paths]
+    for t in trackers:
+        t.warm_up(CAM_W, CAM_H)
+    cams = [ThreadedCapture(VideoFileSource(p)) for p in paths]
+    ages, has_hand, results = [], [], [0] * len(paths)
+    sees = [False] * len(paths)     # newest result of each camera has the hand
+    ts = 0
+    try:
+        while not all(c.eof for c in cams):
+            seen = False
+            for i, cam in enumerate(cams):
+                frame, capture_t = cam.read_latest(timeout=0.0)
+                if frame is None:
+                    continue
+                ts += 1
+                hands = trackers[i].process(frame, ts)["hands"]
+                ages.append(time.monotonic() - capture_t)
+                sees[i] = bool(hands)
+                has_hand.append(any(sees))
+                results[i] += 1
+                seen = True
+            if not seen:
+                time.sleep(0.002)
+    finally:
+        for c in cams:
+            c.release()
+    return summarize(ages, has_hand, results, seconds)
+
+
+def run_processes(paths, regions, cost_ms: float, seconds: float, fusion: str = "best") -> dict:
+    sources = [{"source": "file", "file_path": p, "width": CAM_W, "height": CAM_H, "region": list(r)}
+               for p, r in zip(paths, regions)]
+    multi = MultiCameraTracker(sources, dict(max_hands=1, min_det_conf=0.5, min_track_conf=0.5, model_path=""),
+                               fusion=fusion, landmarker_factory=functools.partial(BlobLandmarker, cost_ms))
+    ages, has_hand = [], []
+    try:
+        while not multi.eof:
+            canvas, capture_t = multi.read_latest(timeout=0.05)
+            if canvas is None:
+                continue
+            ages.append(time.monotonic() - capture_t)
+            has_hand.append(bool(multi.latest().hands))
+        stats = multi.stats()
+    finally:
+        multi.close()
+    out = summarize(ages, has_hand, stats["results"], seconds)
+    return out
+
+
+def check_fusion():
+    a = np.zeros((21, 3), dtype=np.float32)
+    b = np.ones((21, 3), dtype=np.float32)
+    va = CameraView(0, 1.00, a, "Right", 0.90)
+    vb = CameraView(1, 1.02, b, "Right", 0.95)
+    assert fuse([va, vb], "best")[0] == 1
+    assert fuse([va, vb], "best", prefer=0, switch_margin=0.1)[0] == 0      # within the margin: stay
+    assert fuse([va, vb], "best", prefer=0, switch_margin=0.01)[0] == 1
+    _, norm, _, _, t = fuse([va, vb], "blend")
+    assert abs(float(norm[0, 0]) - 0.95 / 1.85) < 1e-5 and t == 1.02
+    vc = CameraView(2, 1.03, b, "Left", 0.5)
+    assert abs(float(fuse([va, vb, vc], "blend")[1][0, 0]) - 0.95 / 1.85) < 1e-5   # other hand left out
+    ws = to_workspace(np.full((21, 3), 0.5, dtype=np.float32), (0.4, 0.0, 1.0, 1.0))
+    assert abs(float(ws[0, 0]) - 0.7) < 1e-6 and float(ws[0, 1]) == 0.5
+    print("fuse(): ok")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--cost-ms", type=float, default=8.0, help="stub inference CPU time per frame")
+    ap.add_argument("--seconds", type=float, default=4.0)
+    ap.add_argument("--cameras", type=int, nargs="*", default=[1, 2, 4])
+    args = ap.parse_args(argv)
+
+    check_fusion()
+    print(f"{os.cpu_count()} CPU(s), {FPS:.0f} fps per camera, stub inference {args.cost_ms:.1f} ms\n")
+    print(f"{'cameras':<9}{'mode':<12}{'results/s per camera':<26}{'median ms':>10}{'p95 ms':>9}{'hand':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.cameras:
+            regions = camera_regions(n)
+            paths = write_videos(tmp, regions, args.seconds)
+            for mode, run in (("in-process", run_in_process), ("processes", run_processes)):
+                r = run(paths, regions, args.cost_ms, args.seconds)
+                rates = " ".join(f"{x:.0f}" for x in r["rate"])
+                print(f"{n:<9}{mode:<12}{rates:<26}{r['median_ms']:>10.1f}{r['p95_ms']:>9.1f}{r['coverage']:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
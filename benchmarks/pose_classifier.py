@@ -0,0 +1,113 @@
+# benchmarks/pose_classifier.py
+"""
+Trains the pose classifier (gestures/train_pose.py) on recorded synthetic
+sessions -- pointing / open / fist / peace, both hands, rotated up to 90
+degrees either way, varying size and jitter -- and evaluates it on held-out
+sessions: confusion matrix, per-hand latency, and pointing accuracy against
+is_index_pointing for upright and sideways hands.
+
+    python -m benchmarks.pose_classifier
+"""
+import math
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+
+from core.pose import is_index_pointing
+from gestures import train_pose
+from gestures.poses import PoseClassifier
+from recording.session import SessionRecorder
+from benchmarks import synthetic
+
+MAX_ANGLE = math.radians(90)
+
+
+def pose_frames(pose: str, handedness: str, seed: int, frames: int = 300):
+    """(t_ms, Hand, angle) with the hand drifting in position, size and rotation."""
+    rnd = random.Random(seed)
+    angle = rnd.uniform(-MAX_ANGLE, MAX_ANGLE)
+    size = rnd.uniform(0.07, 0.15)
+    cx, cy = rnd.uniform(0.35, 0.65), rnd.uniform(0.55, 0.8)
+    out = []
+    for i in range(frames):
+        angle = min(MAX_ANGLE, max(-MAX_ANGLE, angle + rnd.gauss(0, 0.08)))
+        size = min(0.16, max(0.06, size + rnd.gauss(0, 0.002)))
+        cx = min(0.7, max(0.3, cx + rnd.gauss(0, 0.005)))
+        cy = min(0.85, max(0.5, cy + rnd.gauss(0, 0.005)))
+        hand = synthetic.make_hand(cx, cy, size, pose=synthetic.POSES[pose], angle=angle,
+                                   handedness=handedness, jitter_px=1.5, rnd=rnd)
+        out.append((i * 33.3, hand, angle))
+    return out
+
+
+def record(frames, path):
+    rec = SessionRecorder(path)
+    for t_ms, hand, _ in frames:
+        rec.write_frame(t_ms, synthetic.FRAME_W, synthetic.FRAME_H, True, [hand])
+    rec.close()
+
+
+def make_sessions(root: str, seed0: int):
+    """Records one session per pose and hand; returns (SESSION=LABEL args, {label: frames})."""
+    args, frames = [], {}
+    for p, pose in enumerate(synthetic.POSES):
+        for h, handedness in enumerate(("Right", "Left")):
+            f = pose_frames(pose, handedness, seed0 + 10 * p + h)
+            path = os.path.join(root, f"{pose}-{handedness}-{seed0}")
+            record(f, path)
+            args.append(f"{path}={pose}")
+            frames.setdefault(pose, []).extend(f)
+    return args, frames
+
+
+def pointing_accuracy(frames: dict, is_pointing) -> tuple[float, float]:
+    """Pointing-vs-not accuracy for upright (|angle| < 30 deg) and sideways (> 60 deg) hands."""
+    upright, sideways = [], []
+    for label, fs in frames.items():
+        for _, hand, angle in fs:
+            ok = is_pointing(hand) == (label == "pointing")
+            if abs(angle) < math.radians(30):
+                upright.append(ok)
+            elif abs(angle) > math.radians(60):
+                sideways.append(ok)
+    return float(np.mean(upright)), float(np.mean(sideways))
+
+
+def per_call_us(fn, hands, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for hand in hands:
+            fn(hand)
+        best = min(best, (time.perf_counter() - t0) / len(hands) * 1e6)
+    return best
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        train_args, _ = make_sessions(tmp, seed0=100)
+        test_args, test_frames = make_sessions(tmp, seed0=500)
+        model_path = os.path.join(tmp, "pose_model.npz")
+        _, cm = train_pose.run(train_args, test_args, out=model_path)
+        clf = PoseClassifier.load(model_path)
+
+    accuracy = np.trace(cm) / cm.sum()
+    hands = [hand for fs in test_frames.values() for _, hand, _ in fs]
+    print(f"\nper hand, us: classifier predict() {per_call_us(clf.predict, hands):.1f}, "
+          f"is_index_pointing {per_call_us(is_index_pointing, hands):.1f}")
+
+    print("\npointing vs not (held-out):      upright   sideways")
+    for name, fn in (("is_index_pointing", is_index_pointing),
+                     ("classifier == 'pointing'", lambda h: clf.predict(h) == "pointing")):
+        up, side = pointing_accuracy(test_frames, fn)
+        print(f"  {name:<28}{up:>9.3f}{side:>11.3f}")
+
+    if accuracy < 0.95:
+        raise SystemExit(f"held-out accuracy {accuracy:.3f} below 0.95")
+
+
+if __name__ == "__main__":
+    main()
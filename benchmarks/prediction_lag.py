@@ -0,0 +1,86 @@
+# benchmarks/prediction_lag.py
+"""
+Replays synthetic index-tip paths (linear, circular, at rest) the way main.py sees
+them with PROCESS_EVERY_N_FRAMES and compares stale `last_hand` reuse against
+TipPredictor. Reports mean lag (distance to where the hand really is when the cursor
+moves) and RMS frame-to-frame jitter. Fails unless prediction lowers the mean lag
+on the moving paths (and keeps it at rest) without adding jitter.
+
+    python -m benchmarks.prediction_lag
+"""
+import math
+import random
+
+from core.prediction import TipPredictor
+
+FPS = 30.0
+FRAME_MS = 1000.0 / FPS
+
+
+def linear(t_ms):
+    # 0.6 px/ms sweep, bouncing across a 1280px frame
+    x = (0.6 * t_ms) % 2000.0
+    x = x if x < 1000.0 else 2000.0 - x
+    return 140.0 + x, 360.0 + 0.15 * x
+
+
+def circular(t_ms):
+    a = 2.0 * math.pi * t_ms / 1500.0
+    return 640.0 + 200.0 * math.cos(a), 360.0 + 200.0 * math.sin(a)
+
+
+def still(t_ms):
+    return 640.0, 360.0
+
+
+def replay(path, every_n: int, latency_ms: float, noise_px: float, frames: int, predict: bool, seed=1):
+    rnd = random.Random(seed)
+    pred = TipPredictor()
+    pred.note_latency(latency_ms)
+
+    last = None
+    lags, steps = [], []
+    prev_out = None
+    for i in range(1, frames + 1):
+        t = i * FRAME_MS
+        if i % every_n == 0:
+            x, y = path(t)
+            last = (x + rnd.gauss(0, noise_px), y + rnd.gauss(0, noise_px))
+            pred.update(last[0], last[1], t)
+        if last is None:
+            continue
+
+        out = pred.predict(t) if predict else last
+        tx, ty = path(t + latency_ms)   # where the hand is when the cursor actually moves
+        lags.append(math.hypot(out[0] - tx, out[1] - ty))
+        if prev_out is not None:
+            steps.append(math.hypot(out[0] - prev_out[0], out[1] - prev_out[1]))
+        prev_out = out
+
+    # jitter: RMS deviation of per-frame steps from their mean (0 for perfectly even motion)
+    mean_step = sum(steps) / len(steps)
+    jitter = math.sqrt(sum((s - mean_step) ** 2 for s in steps) / len(steps))
+    return sum(lags) / len(lags), jitter
+
+
+def main(every_n: int = 3, latency_ms: float = 45.0, noise_px: float = 1.5, frames: int = 900):
+    print(f"N={every_n} latency={latency_ms:.0f}ms noise={noise_px}px frames={frames}")
+    print(f"{'path':<10}{'mode':<10}{'mean lag px':>12}{'jitter px':>11}")
+    failures = []
+    for name, path in (("linear", linear), ("circular", circular), ("still", still)):
+        rows = {}
+        for mode in ("stale", "predict"):
+            rows[mode] = replay(path, every_n, latency_ms, noise_px, frames, predict=(mode == "predict"))
+            print(f"{name:<10}{mode:<10}{rows[mode][0]:>12.2f}{rows[mode][1]:>11.2f}")
+        (stale_lag, stale_jitter), (lag, jitter) = rows["stale"], rows["predict"]
+        # At rest there is no lag to remove; only noise, which must not grow
+        lag_limit = stale_lag * 1.05 if path is still else stale_lag
+        if not lag < lag_limit:
+            failures.append(f"{name}: mean lag {lag:.2f} px with prediction, {stale_lag:.2f} px stale")
+        if jitter > stale_jitter:
+            failures.append(f"{name}: jitter {jitter:.2f} px with prediction, {stale_jitter:.2f} px stale")
+    assert not failures, "\n".join(failures)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+# benchmarks/process_pipeline.py
+"""
+Shared-memory process pipeline (vision/pipeline.py) against the
+single-process loop. A stub landmarker finds the synthetic source's bright
+disc and burns --cost-ms of CPU per call while holding the GIL, like the real
+model; mouse output burns --output-ms per move, like a slow injection API.
+Both loops drive the same HandController.
+
+  throughput  looping video file read as fast as it decodes: control steps per second
+  latency     synthetic camera at 30 fps: capture -> end of controller.step, ms
+
+Then checks that a killed inference or capture process is restarted and
+results resume, and that SIGINT shuts a running pipeline down cleanly (worker
+processes gone, shared memory unlinked).
+
+    python -m benchmarks.process_pipeline [--cost-ms 20] [--output-ms 10] [--seconds 4]
+
+The pipeline only gains with spare cores: on one core its processes take turns.
+"""
+import argparse
+import functools
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+
+from actions.recording_mouse import NullMouse
+from camera.sources import SyntheticSource, open_source
+from camera.webcam import ThreadedCapture
+from core.controller import HandController
+from core.smoothing import CursorSmoother
+from gestures.recognizer import GestureRecognizer
+from vision.hand_tracker import HandTracker
+from vision.pipeline import ProcessPipeline
+from benchmarks.multi_camera import BlobLandmarker
+from benchmarks.synthetic import POINTING
+
+W, H = 640, 480
+FPS = 30.0
+TRACKER = dict(max_hands=1, min_det_conf=0.5, min_track_conf=0.5, model_path="")
+
+
+class SlowMouse(NullMouse):
+    """NullMouse whose moves burn `cost_ms` of CPU."""
+
+    def __init__(self, cost_ms: float):
+        super().__init__()
+        self.cost_s = cost_ms / 1000.0
+
+    def move_to(self, x: int, y: int):
+        end = time.perf_counter() + self.cost_s
+        while time.perf_counter() < end:
+            pass
+        super().move_to(x, y)
+
+
+def write_video(path: str, frames: int):
+    source = SyntheticSource(W, H, FPS, realtime=False, frames=frames)
+    out = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), FPS, (W, H))
+    while (frame := source.read()) is not None:
+        out.write(frame)
+    out.release()
+
+
+def make_controller(output_ms: float) -> HandController:
+    return HandController(SlowMouse(output_ms), CursorSmoother(0.3, 1, 200), GestureRecognizer(),
+                          1920, 1080, 0.1, 1.0, 1.0)
+
+
+def summarize(ages_s, has_hand, wall_s: float, captured: int) -> dict:
+    ages = np.array(ages_s) * 1000.0
+    return {
+        "steps_per_s": len(ages) / wall_s,
+        "captured_per_s": captured / wall_s,
+        "median_ms": float(np.median(ages)) if ages.size else float("nan"),
+        "p95_ms": float(np.percentile(ages, 95)) if ages.size else float("nan"),
+        "hand": float(np.mean(has_hand)) if has_hand else 0.0,
+    }
+
+
+def run_single(spec: dict, cost_ms: float, output_ms: float, seconds: float) -> dict:
+    """main.py's sync loop: threaded capture, tracker.process and controller.step in one process."""
+    tracker = HandTracker(landmarker=BlobLandmarker(cost_ms), **TRACKER)
+    tracker.warm_up(W, H)
+    controller = make_controller(output_ms)
+    cam = ThreadedCapture(open_source(spec))
+    origin = time.monotonic()
+    ages, has_hand = [], []
+    ts = 0
+    t0 = time.monotonic()
+    try:
+        while not cam.eof and time.monotonic() - t0 < seconds:
+            frame, capture_t = cam.read_latest(timeout=0.05)
+            if frame is None:
+                continue
+            ts = max(ts + 1, int((capture_t - origin) * 1000.0))
+            hands = tracker.process(frame, ts)["hands"]
+            controller.set_frame_size(frame.shape[1], frame.shape[0])
+            if hands:
+                controller.step(hands[0], ts, capture_t)
+            ages.append(time.monotonic() - capture_t)
+            has_hand.append(bool(hands))
+        wall = time.monotonic() - t0
+    finally:
+        cam.release()
+        tracker.close()
+    return summarize(ages, has_hand, wall, cam.frames_captured)
+
+
+def blob_offset(frame, hand) -> float:
+    """Pixels between the disc in `frame` and the one `hand` was found on (BlobLandmarker)."""
+    ys, xs = np.nonzero(frame[:, :, 0] > 128)
+    h, w = frame.shape[:2]
+    cx, cy = (hand.norm[:, :2].mean(axis=0) - 0.2 * POINTING.mean(axis=0)) * (w, h) - 0.5
+    return float(np.hypot(xs.mean() - cx, ys.mean() - cy)) if xs.size else float("inf")
+
+
+def run_pipeline(spec: dict, cost_ms: float, output_ms: float, seconds: float, kill=None,
+                 check_frames: bool = False) -> tuple[dict, dict]:
+    """
+    Same control loop on ProcessPipeline results, until the source ends or
+    `seconds` passed. kill: [(after_s, worker name)] to kill that worker
+    process during the run. check_frames: assert every returned frame is the
+    one its landmarks came from.
+    """
+    pipeline = ProcessPipeline(spec, TRACKER, landmarker_factory=functools.partial(BlobLandmarker, cost_ms))
+    controller = make_controller(output_ms)
+    kill = sorted(kill or [])
+    ages, has_hand = [], []
+    # Timed from the first result: the pipeline warms its tracker up in the background
+    while pipeline.read_latest(timeout=0.05)[0] is None:
+        pass
+    t0 = time.monotonic()
+    try:
+        while not pipeline.eof and time.monotonic() - t0 < seconds:
+            if kill and time.monotonic() - t0 >= kill[0][0]:
+                pipeline._procs[kill.pop(0)[1]].kill()
+            frame, capture_t = pipeline.read_latest(timeout=0.05)
+            if frame is None:
+                continue
+            result = pipeline.latest()
+            if check_frames and result.hands:
+                offset = blob_offset(frame, result.hands[0])
+                assert offset < 1.0, f"frame does not match its landmarks ({offset:.1f} px apart)"
+            controller.set_frame_size(frame.shape[1], frame.shape[0])
+            if result.hands:
+                controller.step(result.hands[0], result.timestamp_ms, capture_t)
+            ages.append(time.monotonic() - capture_t)
+            has_hand.append(bool(result.hands))
+        wall = time.monotonic() - t0
+        stats = pipeline.stats()
+    finally:
+        pipeline.close()
+    return summarize(ages, has_hand, wall, stats["captured"]), stats
+
+
+def child(argv):
+    """Runs a pipeline until SIGINT, like main.py; prints its shared-memory names and pids."""
+    spec = {"source": "synthetic", "width": W, "height": H}
+    pipeline = ProcessPipeline(spec, TRACKER, landmarker_factory=functools.partial(BlobLandmarker, 5.0))
+    try:
+        print(pipeline._ring._shm.name, pipeline._board._shm.name,
+              *(p.pid for p in pipeline._procs.values()), flush=True)
+        while True:
+            pipeline.read_latest(timeout=0.05)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pipeline.close()
+
+
+def check_sigint() -> bool:
+    proc = subprocess.Popen([sys.executable, "-m", "benchmarks.process_pipeline", "--child"],
+                            stdout=subprocess.PIPE, text=True)
+    names_pids = proc.stdout.readline().split()
+    time.sleep(1.5)
+    t0 = time.monotonic()
+    proc.send_signal(signal.SIGINT)
+    code = proc.wait(timeout=10)
+    print(f"SIGINT: exited with {code} after {(time.monotonic() - t0) * 1000.0:.0f} ms")
+    ok = code == 0
+    for pid in names_pids[2:]:
+        try:
+            os.kill(int(pid), 0)
+            ok = False          # worker still running
+        except OSError:
+            pass
+    for name in names_pids[:2]:
+        try:
+            shared_memory.SharedMemory(name=name).close()
+            ok = False          # block left behind
+        except FileNotFoundError:
+            pass
+    return ok
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--cost-ms", type=float, default=20.0, help="stub inference CPU time per frame")
+    ap.add_argument("--output-ms", type=float, default=10.0, help="CPU time per mouse move")
+    ap.add_argument("--seconds", type=float, default=4.0)
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+    if args.child:
+        return child(argv)
+
+    print(f"{os.cpu_count()} CPU(s), {W}x{H}, stub inference {args.cost_ms:.0f} ms, "
+          f"mouse output {args.output_ms:.0f} ms per move\n")
+    print(f"{'source':<22}{'loop':<14}{'steps/s':>8}{'captured/s':>12}{'median ms':>11}{'p95 ms':>8}{'hand':>6}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic.avi")
+        write_video(path, int(FPS))
+        runs = (
+            ("file, unpaced", {"source": "file", "file_path": path, "file_realtime": False, "file_loop": True,
+                               "width": W, "height": H}),
+            ("synthetic, 30 fps", {"source": "synthetic", "width": W, "height": H}),
+        )
+        for name, spec in runs:
+            single = run_single(spec, args.cost_ms, args.output_ms, args.seconds)
+            piped, stats = run_pipeline(spec, args.cost_ms, args.output_ms, args.seconds)
+            for loop, r in (("one process", single), ("processes", piped)):
+                print(f"{name:<22}{loop:<14}{r['steps_per_s']:>8.1f}{r['captured_per_s']:>12.1f}"
+                      f"{r['median_ms']:>11.1f}{r['p95_ms']:>8.1f}{r['hand']:>6.2f}")
+            assert piped["hand"] > 0.9, f"{name}: pipeline results are missing the hand"
+            assert stats["restarts"] == {"capture": 0, "inference": 0}, f"{name}: unexpected restarts {stats}"
+
+    spec = {"source": "synthetic", "width": W, "height": H, "synthetic_frames": int(4 * FPS)}
+    r, stats = run_pipeline(spec, 5.0, 0.0, 10.0, kill=[(1.0, "inference"), (2.0, "capture")], check_frames=True)
+    print(f"\nkilled inference at 1 s and capture at 2 s: restarts {stats['restarts']}, "
+          f"{stats['results']} results, hand {r['hand']:.2f}")
+    assert stats["restarts"] == {"capture": 1, "inference": 1}, "killed workers were not restarted"
+    assert r["hand"] > 0.9 and stats["results"] > 2 * FPS, "results did not resume after the restarts"
+
+    if os.name == "posix":
+        assert check_sigint(), "SIGINT left worker processes or shared memory behind"
+
+
+if __name__ == "__main__":
+    main()
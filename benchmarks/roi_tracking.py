@@ -0,0 +1,104 @@
+# benchmarks/roi_tracking.py
+"""
+ms per frame for full-frame vs ROI inference in HandTracker, and checks that
+ROI landmarks are remapped into full-frame pixels correctly and that the model
+sees ROI images of one size (its frame-to-frame tracking assumes a stable
+image geometry), from a box that moves only now and then.
+
+Uses a stub landmarker that "detects" a bright square and whose cost grows with
+the image size like the real model's preprocessing does. No camera or model needed.
+
+    python -m benchmarks.roi_tracking
+"""
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from vision.hand_tracker import HandTracker
+
+# Fixed landmark layout inside the detected box (fractions of width/height)
+LAYOUT = [((i % 5) / 4.0, (i // 5) / 4.0) for i in range(21)]
+HAND_SIZE = 160
+
+
+class BlobLandmarker:
+    def __init__(self):
+        self.sizes = set()      # (w, h) of every image the model saw
+
+    def _detect(self, mp_image):
+        img = mp_image.numpy_view()
+        self.sizes.add((img.shape[1], img.shape[0]))
+        h, w = img.shape[:2]
+        mask = img[:, :, 0] > 127
+        cols = np.flatnonzero(mask.any(axis=0))
+        rows = np.flatnonzero(mask.any(axis=1))
+        if cols.size == 0:
+            return SimpleNamespace(hand_landmarks=[], handedness=[])
+
+        x0, x1 = cols[0], cols[-1] + 1
+        y0, y1 = rows[0], rows[-1] + 1
+        lms = [SimpleNamespace(x=(x0 + fx * (x1 - x0)) / w, y=(y0 + fy * (y1 - y0)) / h, z=0.0)
+               for fx, fy in LAYOUT]
+        cat = SimpleNamespace(category_name="Right", score=0.95)
+        return SimpleNamespace(hand_landmarks=[lms], handedness=[[cat]])
+
+    def detect_for_video(self, mp_image, timestamp_ms):
+        return self._detect(mp_image)
+
+    def close(self):
+        pass
+
+
+def make_frame(w, h, cx, cy):
+    frame = np.zeros((h, w, 3), dtype=np.uint8)
+    x0, y0 = int(cx - HAND_SIZE / 2), int(cy - HAND_SIZE / 2)
+    frame[y0:y0 + HAND_SIZE, x0:x0 + HAND_SIZE] = 255
+    return frame, (x0, y0)
+
+
+def expected_landmarks(x0, y0):
+    return [(x0 + fx * HAND_SIZE, y0 + fy * HAND_SIZE) for fx, fy in LAYOUT]
+
+
+def run(tracker, w, h, frames):
+    times_ms, max_err = [], 0.0
+    for i in range(frames):
+        cx = w / 2 + 300 * np.sin(i / 20.0)
+        cy = h / 2 + 150 * np.cos(i / 25.0)
+        frame, (x0, y0) = make_frame(w, h, cx, cy)
+
+        t0 = time.perf_counter()
+        hands = tracker.process(frame, i * 33)["hands"]
+        times_ms.append((time.perf_counter() - t0) * 1000.0)
+
+        if hands:
+            for (px, py), (ex, ey) in zip(hands[0]["landmarks"], expected_landmarks(x0, y0)):
+                max_err = max(max_err, abs(px - ex), abs(py - ey))
+    return sum(times_ms) / len(times_ms), max_err
+
+
+def main(w: int = 1920, h: int = 1080, frames: int = 120):
+    print(f"{w}x{h}, {frames} frames, hand {HAND_SIZE}px")
+    print(f"{'mode':<24}{'ms/frame':>10}{'max remap err px':>18}")
+    for label, kwargs in (
+        ("full frame", dict(roi_enabled=False)),
+        ("roi (no downscale)", dict(roi_enabled=True, roi_infer_size=0)),
+        ("roi infer_size=256", dict(roi_enabled=True, roi_infer_size=256)),
+        ("roi infer_size=128", dict(roi_enabled=True, roi_infer_size=128)),
+    ):
+        landmarker = BlobLandmarker()
+        tracker = HandTracker(1, 0.6, 0.6, "", landmarker=landmarker, **kwargs)
+        ms, err = run(tracker, w, h, frames)
+        print(f"{label:<24}{ms:>10.3f}{err:>18.2f}  (roi={tracker.roi_frames} full={tracker.full_frames} "
+              f"box moves={tracker.roi_moves})")
+        assert err <= 2.0, f"{label}: landmarks remapped {err:.1f} px off"
+        if kwargs.get("roi_infer_size"):
+            size = kwargs["roi_infer_size"]
+            assert landmarker.sizes <= {(w, h), (size, size)}, f"{label}: model saw sizes {landmarker.sizes}"
+        if tracker.roi_frames:
+            assert tracker.roi_moves < tracker.roi_frames / 2, f"{label}: ROI box moved {tracker.roi_moves} times"
+
+
+if __name__ == "__main__":
+    main()
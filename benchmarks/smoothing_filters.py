@@ -0,0 +1,76 @@
+# benchmarks/smoothing_filters.py
+"""
+Jitter-vs-lag comparison of the cursor smoothers on synthetic noisy trajectories.
+
+- rest:  hand held still, noisy measurements -> RMS jitter of the output (px)
+- slow / fast: constant-speed sweeps -> mean lag behind the true position (px)
+- us/update: cost of one update() call
+
+    python -m benchmarks.smoothing_filters [noise_px]
+"""
+import math
+import random
+import sys
+import time
+
+from config import DEFAULTS
+from core.smoothing import SMOOTHERS, make_smoother
+
+FPS = 30.0
+
+
+def params():
+    # config.py defaults, not the local config.json, so runs are comparable
+    return {k: float(v) for k, v in DEFAULTS["smoothing"].items() if k != "filter"}
+
+
+def trajectory(kind: str, frames: int, noise_px: float, seed: int = 7):
+    rnd = random.Random(seed)
+    speed = {"rest": 0.0, "slow": 300.0, "fast": 1500.0}[kind]   # screen px/s
+    for i in range(frames):
+        t = i / FPS
+        # bounce across a 1920px wide screen
+        x = (200.0 + speed * t) % 3000.0
+        x = x if x < 1500.0 else 3000.0 - x
+        tx, ty = 200.0 + x, 540.0
+        yield t, tx, ty, tx + rnd.gauss(0, noise_px), ty + rnd.gauss(0, noise_px)
+
+
+def rest_jitter(name: str, noise_px: float, frames: int = 600):
+    f = make_smoother(name, params())
+    out = [f.update(mx, my, t) for t, _, _, mx, my in trajectory("rest", frames, noise_px)][30:]
+    cx = sum(p[0] for p in out) / len(out)
+    cy = sum(p[1] for p in out) / len(out)
+    return math.sqrt(sum((x - cx) ** 2 + (y - cy) ** 2 for x, y in out) / len(out))
+
+
+def motion_lag(name: str, kind: str, noise_px: float, frames: int = 600):
+    f = make_smoother(name, params())
+    lags = []
+    for i, (t, tx, ty, mx, my) in enumerate(trajectory(kind, frames, noise_px)):
+        x, y = f.update(mx, my, t)
+        if i >= 30:
+            lags.append(math.hypot(x - tx, y - ty))
+    return sum(lags) / len(lags)
+
+
+def us_per_update(name: str, n: int = 20000):
+    f = make_smoother(name, params())
+    pts = [(t, mx, my) for t, _, _, mx, my in trajectory("slow", n, 2.0)]
+    t0 = time.perf_counter()
+    for t, mx, my in pts:
+        f.update(mx, my, t)
+    return (time.perf_counter() - t0) / n * 1e6
+
+
+def main(noise_px: float = 3.0):
+    print(f"{FPS:.0f} Hz updates, measurement noise {noise_px}px (screen)")
+    print(f"{'filter':<12}{'rest jitter':>12}{'slow lag':>10}{'fast lag':>10}{'us/update':>11}")
+    for name in SMOOTHERS:
+        print(f"{name:<12}{rest_jitter(name, noise_px):>12.2f}"
+              f"{motion_lag(name, 'slow', noise_px):>10.1f}{motion_lag(name, 'fast', noise_px):>10.1f}"
+              f"{us_per_update(name):>11.2f}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 3.0)
@@ -0,0 +1,117 @@
+# benchmarks/startup.py
+"""
+Time to first hand result for the old sequential startup (open camera, load
+model, first frame pays graph setup) vs open_camera_and_tracker (camera and
+model in parallel, warm-up on a blank frame), and the same with a camera that
+delivers another size than expected (warmed up again). Camera and model are
+stubs that sleep; the model stub rejects timestamps that do not increase, like
+MediaPipe. The mediapipe import is real and measured in a fresh interpreter.
+
+    python -m benchmarks.startup
+"""
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from core.startup import StartupTimeline, open_camera_and_tracker
+from vision.hand_tracker import HandTracker
+
+CAMERA_OPEN_MS = 700.0     # DirectShow open + first frame on a typical webcam
+MODEL_LOAD_MS = 400.0      # reading hand_landmarker.task and building the graph
+GRAPH_SETUP_MS = 600.0     # one-time cost of the first detect call
+INFER_MS = 15.0
+
+
+class StubCamera:
+    def __init__(self, width: int = 640, height: int = 480):
+        time.sleep(CAMERA_OPEN_MS / 1000.0)
+        self._frame = np.zeros((height, width, 3), dtype=np.uint8)
+
+    def read_latest(self, timeout: float = 0.0):
+        return self._frame, time.monotonic()
+
+    def frame_size(self):
+        return self._frame.shape[1], self._frame.shape[0]
+
+    def release(self):
+        pass
+
+
+class StubLandmarker:
+    def __init__(self):
+        time.sleep(MODEL_LOAD_MS / 1000.0)
+        self._calls = 0
+        self._last_ts = None
+
+    def detect_for_video(self, mp_image, timestamp_ms):
+        if self._last_ts is not None and timestamp_ms <= self._last_ts:
+            raise ValueError("Input timestamp must be monotonically increasing")
+        self._last_ts = timestamp_ms
+        self._calls += 1
+        time.sleep((GRAPH_SETUP_MS if self._calls == 1 else INFER_MS) / 1000.0)
+        return None
+
+    def close(self):
+        pass
+
+
+def create_tracker():
+    return HandTracker(1, 0.5, 0.5, "", landmarker=StubLandmarker())
+
+
+def sequential():
+    timeline = StartupTimeline()
+    cam = StubCamera()
+    timeline.mark("camera open")
+    tracker = create_tracker()
+    timeline.mark("model loaded")
+    frame, _ = cam.read_latest()
+    tracker.process(frame, 1)
+    timeline.mark("first result")
+    return timeline
+
+
+def pipelined(expected=(640, 480)):
+    timeline = StartupTimeline()
+    cam, tracker = open_camera_and_tracker(StubCamera, create_tracker, warm_up=True,
+                                           warm_up_size=expected, timeline=timeline,
+                                           frame_size=lambda c: c.frame_size())
+    frame, _ = cam.read_latest()
+    tracker.process(frame, 1)
+    tracker.process(frame, 1)       # repeated timestamp: clamped, not rejected
+    timeline.mark("first result")
+    return timeline
+
+
+def mismatched():
+    """Expects 1920x1080 (the default fixed request), the camera delivers 640x480."""
+    timeline = pipelined(expected=(1920, 1080))
+    assert "model warmed up at camera size" in timeline, "tracker was not warmed up at the camera size"
+    return timeline
+
+
+def import_ms(module: str) -> float:
+    code = f"import time; t = time.perf_counter(); import {module}; print((time.perf_counter() - t) * 1000)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return float(out.stdout.strip())
+
+
+def main():
+    print("import times (fresh interpreter):")
+    for module in ("cv2", "vision.hand_tracker", "mediapipe", "main"):
+        print(f"  {module:<22}{import_ms(module):8.1f} ms")
+    print("  (vision.hand_tracker now imports mediapipe on first use, on the model thread;")
+    print("   main imports cv2 and the camera / tracker modules while the camera opens)")
+    print()
+
+    # Pay the in-process mediapipe import up front so both runs compare the same work
+    HandTracker(1, 0.5, 0.5, "", landmarker=StubLandmarker()).warm_up(64, 64)
+
+    for name, run in (("sequential", sequential), ("pipelined", pipelined), ("other size", mismatched)):
+        print(f"{name}: {run().report()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,399 @@
+# benchmarks/suite.py
+"""
+Hardware-free benchmark suite for the per-frame path: microbenchmarks of each
+stage on synthetic landmark sessions (benchmarks/synthetic.py) and whole-loop
+throughput with a generated camera, a replaying stub tracker and a null mouse.
+No camera, display or model needed.
+
+    python -m benchmarks.suite                                  # run, print
+    python -m benchmarks.suite --save benchmarks/baselines/NAME.json
+    python -m benchmarks.suite --compare benchmarks/baselines/NAME.json [--threshold 10]
+    python -m benchmarks.suite -k gestures -k loop --quick
+
+Every result is microseconds per call (or per frame), lower is better: the
+fastest of --repeat passes over a fixed session, each pass repeated to last
+at least 50 ms. --compare re-measures anything that looks slower (--retries)
+and exits with status 1 if a benchmark is still more than --threshold percent
+slower than the baseline.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from actions.recording_mouse import NullMouse
+from camera.sources import SyntheticSource
+from core.controller import HandController
+from core.landmarks import INDEX_TIP, hand_from_landmarks
+from core.latency import LatencyStats, CURSOR
+from core.mapping import compute_active_region, map_cam_to_screen
+from core.pose import is_index_pointing, pose_features
+from core.prediction import TipPredictor
+from core.sensitivity import apply_mouse_speed
+from core.smoothing import SMOOTHERS, CursorSmoother, make_smoother
+from config import DEFAULTS
+from gestures.recognizer import GestureRecognizer
+from benchmarks import synthetic
+
+BASELINE_VERSION = 1
+SCREEN_W, SCREEN_H = 1920, 1080
+
+_BENCHES = {}
+
+
+def bench(name: str):
+    """
+    Register `setup() -> (run, calls)`: run() does `calls` calls (or frames)
+    over a fixed synthetic session and is timed as a whole.
+    """
+    def deco(setup):
+        _BENCHES[name] = setup
+        return setup
+    return deco
+
+
+def hands(session: str):
+    return [(t, h) for t, h in synthetic.SESSIONS[session]() if h is not None]
+
+
+def _smoothing_params():
+    # config.py defaults, not the local config.json, so runs are comparable
+    return {k: float(v) for k, v in DEFAULTS["smoothing"].items() if k != "filter"}
+
+
+def _mapped():
+    region = compute_active_region(synthetic.FRAME_W, synthetic.FRAME_H, 0.0)
+    return [(t / 1000.0, *map_cam_to_screen(*h.px[INDEX_TIP].tolist(), region, SCREEN_W, SCREEN_H, 1.1))
+            for t, h in hands("swipes")]
+
+
+# -------------------------
+# Per-stage microbenchmarks
+# -------------------------
+@bench("landmarks.hand_from_landmarks")
+def _():
+    lms = [[SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in h.norm.tolist()]
+           for _, h in hands("swipes")]
+
+    def run():
+        for lm in lms:
+            hand_from_landmarks(lm, synthetic.FRAME_W, synthetic.FRAME_H)
+    return run, len(lms)
+
+
+@bench("pose.is_index_pointing")
+def _():
+    hs = [h for _, h in hands("gestures")]
+
+    def run():
+        for h in hs:
+            is_index_pointing(h)
+    return run, len(hs)
+
+
+@bench("pose.pose_features")
+def _():
+    pxs = [h.px for _, h in hands("gestures")]
+
+    def run():
+        for px in pxs:
+            pose_features(px)
+    return run, len(pxs)
+
+
+@bench("mapping.map_cam_to_screen")
+def _():
+    region = compute_active_region(synthetic.FRAME_W, synthetic.FRAME_H, 0.0)
+    tips = [h.point(INDEX_TIP) for _, h in hands("swipes")]
+
+    def run():
+        for x, y in tips:
+            map_cam_to_screen(x, y, region, SCREEN_W, SCREEN_H, gamma=1.1)
+    return run, len(tips)
+
+
+@bench("sensitivity.apply_mouse_speed")
+def _():
+    pts = [(x, y) for _, x, y in _mapped()]
+
+    def run():
+        for x, y in pts:
+            apply_mouse_speed(x, y, SCREEN_W, SCREEN_H, 3.0)
+    return run, len(pts)
+
+
+def _smoother_bench(name):
+    def setup():
+        pts = _mapped()
+        f = make_smoother(name, _smoothing_params())
+
+        def run():
+            f.reset()
+            for t, x, y in pts:
+                f.update(x, y, t)
+        return run, len(pts)
+    return setup
+
+
+for _name in SMOOTHERS:
+    bench(f"smoothing.{_name}.update")(_smoother_bench(_name))
+
+
+@bench("prediction.TipPredictor")
+def _():
+    tips = [(t, *h.px[INDEX_TIP].tolist()) for t, h in hands("swipes")]
+    p = TipPredictor()
+
+    def run():
+        p.reset()
+        for t, x, y in tips:
+            p.update(x, y, t)
+            p.predict(t + 30.0)
+    return run, len(tips)
+
+
+def _recognizer_bench(session):
+    def setup():
+        frames = hands(session)
+
+        def run():
+            g = GestureRecognizer()
+            for t, h in frames:
+                g.update(h, int(t) + 1000, (960, 540))
+        return run, len(frames)
+    return setup
+
+
+for _session in ("still", "gestures"):
+    bench(f"gestures.GestureRecognizer.update[{_session}]")(_recognizer_bench(_session))
+
+
+@bench("latency.LatencyStats.add")
+def _():
+    stats = LatencyStats(2048)
+    n = 10000
+
+    def run():
+        for i in range(n):
+            stats.add(CURSOR, 0.001)
+    return run, n
+
+
+def _controller(mouse, stats=None):
+    c = HandController(mouse, CursorSmoother(0.14, 3, 70), GestureRecognizer(), SCREEN_W, SCREEN_H,
+                       0.0, 1.1, 3.0, predictor=TipPredictor(), stats=stats)
+    c.set_frame_size(synthetic.FRAME_W, synthetic.FRAME_H)
+    return c
+
+
+def _controller_bench(session):
+    def setup():
+        frames = hands(session)
+
+        def run():
+            c = _controller(NullMouse())
+            for t, h in frames:
+                c.on_detection(h, int(t))
+                c.step(h, int(t), t / 1000.0)
+        return run, len(frames)
+    return setup
+
+
+for _session in ("jitter", "swipes", "gestures"):
+    bench(f"controller.HandController.step[{_session}]")(_controller_bench(_session))
+
+
+# -------------------------
+# Whole loop
+# -------------------------
+class StubTracker:
+    """Replays a synthetic session's hands as tracker results, one per process() call."""
+
+    is_async = False
+
+    def __init__(self, frames):
+        self._hands = [h for _, h in frames]
+        self._i = 0
+
+    def process(self, frame, timestamp_ms):
+        hand = self._hands[self._i % len(self._hands)]
+        self._i += 1
+        return {"hands": [hand] if hand is not None else []}
+
+
+def _loop_bench(every_n, frame_size):
+    def setup():
+        frames = synthetic.gestures_script()
+        n = len(frames)
+
+        def run():
+            cam = SyntheticSource(*frame_size, realtime=False, frames=n)
+            tracker = StubTracker(frames)
+            controller = _controller(NullMouse(), stats=LatencyStats())
+            last_hand = None
+            i = 0
+            # main.py's loop without cv2.flip / the viewer / recording
+            while True:
+                frame, capture_t = cam.read_latest()
+                if frame is None:
+                    break
+                h, w = frame.shape[:2]
+                controller.set_frame_size(w, h)
+                i += 1
+                ts = int(i * 1000.0 / 30.0)
+                if i % every_n == 0:
+                    hands_ = tracker.process(frame, ts)["hands"]
+                    last_hand = hands_[0] if hands_ else None
+                    controller.on_detection(last_hand, ts)
+                if last_hand is not None:
+                    controller.step(last_hand, ts, capture_t)
+        return run, n
+    return setup
+
+
+bench("loop.synthetic_camera[every 1, 640x360]")(_loop_bench(1, (640, 360)))
+bench("loop.synthetic_camera[every 3, 1280x720]")(_loop_bench(3, (1280, 720)))
+
+
+# -------------------------
+# Runner, baselines
+# -------------------------
+def measure(setup, repeat: int, min_pass_s: float) -> dict:
+    """Fastest and median per-call time over `repeat` passes of at least min_pass_s each."""
+    run, calls = setup()
+    t0 = time.perf_counter()
+    run()   # warm-up, and sizes the passes
+    loops = max(1, int(np.ceil(min_pass_s / max(time.perf_counter() - t0, 1e-6))))
+    passes = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()   # like timeit: collections land in random passes otherwise
+    try:
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            for _ in range(loops):
+                run()
+            passes.append((time.perf_counter() - t0) * 1e6 / (calls * loops))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return {"us": round(min(passes), 4), "median_us": round(float(np.median(passes)), 4),
+            "calls": calls * loops}
+
+
+def run_suite(patterns=(), repeat: int = 7, min_pass_s: float = 0.05, out=sys.stdout) -> dict:
+    results = {}
+    for name, setup in _BENCHES.items():
+        if patterns and not any(p in name for p in patterns):
+            continue
+        results[name] = r = measure(setup, repeat, min_pass_s)
+        print(f"  {name:<48}{r['us']:>10.2f} us  (median {r['median_us']:.2f}, {r['calls']} calls/pass)", file=out)
+    return results
+
+
+def machine() -> dict:
+    return {"platform": platform.platform(), "machine": platform.machine(), "processor": platform.processor(),
+            "python": platform.python_version(), "numpy": np.__version__}
+
+
+def save_baseline(path: str, results: dict):
+    data = {"version": BASELINE_VERSION, "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "machine": machine(), "results": results}
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def load_baseline(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version: {data.get('version')!r}")
+    return data
+
+
+def _change_pct(base: float, now: float) -> float:
+    return (now - base) / base * 100.0 if base > 0 else 0.0
+
+
+def recheck(baseline: dict, results: dict, threshold_pct: float, retries: int, repeat: int, min_pass_s: float):
+    """
+    Re-measure benchmarks that look slower than the baseline, keeping the fastest
+    result, so a regression has to reproduce rather than be one noisy run.
+    """
+    old = baseline["results"]
+    for name, r in results.items():
+        for _ in range(retries):
+            if name not in old or _change_pct(old[name]["us"], r["us"]) <= threshold_pct:
+                break
+            again = measure(_BENCHES[name], repeat, min_pass_s)
+            if again["us"] < r["us"]:
+                results[name] = r = again
+
+
+def compare(baseline: dict, results: dict, threshold_pct: float) -> list[str]:
+    """Prints a comparison table; returns the names that regressed beyond threshold_pct."""
+    old = baseline["results"]
+    regressed = []
+    print(f"\n{'benchmark':<48}{'base us':>10}{'now us':>10}{'change':>9}")
+    for name, r in results.items():
+        if name not in old:
+            print(f"{name:<48}{'-':>10}{r['us']:>10.2f}{'new':>9}")
+            continue
+        base = old[name]["us"]
+        change = _change_pct(base, r["us"])
+        flag = ""
+        if change > threshold_pct:
+            flag = "  REGRESSION"
+            regressed.append(name)
+        elif change < -threshold_pct:
+            flag = "  faster"
+        print(f"{name:<48}{base:>10.2f}{r['us']:>10.2f}{change:>+8.1f}%{flag}")
+    missing = sorted(set(old) - set(results))
+    if missing:
+        print(f"not run: {', '.join(missing)}")
+    if baseline.get("machine") != machine():
+        print("note: baseline was recorded on a different machine / Python / NumPy")
+    return regressed
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="HandMouse hardware-free benchmark suite")
+    ap.add_argument("-k", dest="patterns", action="append", default=[], help="only benchmarks containing this text")
+    ap.add_argument("--quick", action="store_true", help="fewer, shorter passes (noisier)")
+    ap.add_argument("--repeat", type=int, default=7, help="timed passes per benchmark (fastest is reported)")
+    ap.add_argument("--save", metavar="JSON", help="write results as a baseline")
+    ap.add_argument("--compare", metavar="JSON", help="compare against a baseline")
+    ap.add_argument("--threshold", type=float, default=10.0, help="regression threshold in percent")
+    ap.add_argument("--retries", type=int, default=2, help="re-measure apparent regressions up to this many times")
+    ap.add_argument("--list", action="store_true", help="list benchmark names and exit")
+    args = ap.parse_args(argv)
+
+    if args.list:
+        print("\n".join(_BENCHES))
+        return
+
+    baseline = load_baseline(args.compare) if args.compare else None
+    repeat, min_pass_s = (3, 0.01) if args.quick else (max(1, args.repeat), 0.05)
+    print(f"benchmarks (fastest of {repeat} passes, us per call / frame):")
+    results = run_suite(args.patterns, repeat, min_pass_s)
+
+    if args.save:
+        save_baseline(args.save, results)
+        print(f"saved baseline {args.save}")
+    if baseline is not None:
+        recheck(baseline, results, args.threshold, max(0, args.retries), repeat, min_pass_s)
+        regressed = compare(baseline, results, args.threshold)
+        if regressed:
+            print(f"\n{len(regressed)} regression(s) beyond {args.threshold:.0f}%: {', '.join(regressed)}")
+            sys.exit(1)
+        print(f"\nno regressions beyond {args.threshold:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
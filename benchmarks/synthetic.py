@@ -0,0 +1,231 @@
+# benchmarks/synthetic.py
+"""
+Synthetic hands and scripted sessions for hardware-free benchmarks.
+
+Hands are built from a fixed "pointing" pose (index up, other fingers folded)
+in palm units, placed and scaled in the frame, with optional thumb pinches.
+"""
+import math
+import random
+
+import numpy as np
+
+from core.landmarks import Hand
+
+# Pointing pose in palm units (x right, y down, wrist at the origin)
+POINTING = np.array([
+    (0.00, 0.00),                                                   # 0 wrist
+    (-0.35, -0.20), (-0.60, -0.45), (-0.80, -0.65), (-0.95, -0.80), # 1-4 thumb
+    (-0.50, -0.90), (-0.55, -1.35), (-0.57, -1.60), (-0.60, -1.85), # 5-8 index (extended)
+    (-0.15, -0.95), (-0.15, -1.30), (-0.12, -1.15), (-0.10, -1.00), # 9-12 middle (folded)
+    (0.15, -0.90), (0.17, -1.20), (0.24, -1.05), (0.30, -0.95),     # 13-16 ring (folded)
+    (0.45, -0.80), (0.50, -1.05), (0.62, -0.95), (0.70, -0.80),     # 17-20 pinky (folded)
+], dtype=np.float32)
+
+
+def _with(pose: np.ndarray, points: dict) -> np.ndarray:
+    out = pose.copy()
+    for i, xy in points.items():
+        out[i] = xy
+    return out
+
+
+# Other static poses, same units
+OPEN = _with(POINTING, {
+    1: (-0.35, -0.20), 2: (-0.65, -0.40), 3: (-0.90, -0.55), 4: (-1.10, -0.65),
+    9: (-0.15, -0.95), 10: (-0.15, -1.40), 11: (-0.14, -1.70), 12: (-0.13, -1.95),
+    13: (0.15, -0.90), 14: (0.18, -1.30), 15: (0.20, -1.55), 16: (0.22, -1.78),
+    17: (0.45, -0.80), 18: (0.52, -1.10), 19: (0.57, -1.30), 20: (0.61, -1.48),
+})
+FIST = _with(POINTING, {
+    5: (-0.50, -0.90), 6: (-0.52, -1.25), 7: (-0.45, -1.10), 8: (-0.40, -0.95),
+    3: (-0.60, -0.70), 4: (-0.35, -0.85),
+})
+PEACE = _with(POINTING, {
+    9: (-0.15, -0.95), 10: (-0.05, -1.40), 11: (0.00, -1.65), 12: (0.04, -1.90),
+})
+POSES = {"pointing": POINTING, "open": OPEN, "fist": FIST, "peace": PEACE}
+
+PINCH_TARGETS = {"middle": 12, "ring": 16, "pinky": 20}
+
+FRAME_W, FRAME_H = 1280, 720
+
+
+def make_hand(cx: float, cy: float, size: float = 0.12, pinch: str | None = None, amount: float = 0.0,
+              w: int = FRAME_W, h: int = FRAME_H, jitter_px: float = 0.0, rnd: random.Random | None = None,
+              pose: np.ndarray = POINTING, angle: float = 0.0, handedness: str = "Right") -> Hand:
+    """
+    Hand with its wrist at normalized (cx, cy). `size` is one palm unit as a fraction
+    of frame width. pinch/amount move the thumb tip (and IP joint) toward a fingertip:
+    amount=1 closes the pinch completely. `angle` (radians, clockwise on screen)
+    rotates the hand about the wrist; a "Left" hand is the mirror image.
+    """
+    pts = pose.copy()
+    if pinch is not None and amount > 0.0:
+        target = pts[PINCH_TARGETS[pinch]]
+        pts[4] = pts[4] + (target - pts[4]) * amount
+        pts[3] = pts[3] + (target - pts[3]) * amount * 0.6
+        if pinch != "middle":
+            # Sweep across the palm, below the other fingertips, like a real thumb
+            pts[4, 1] += 0.45 * math.sin(math.pi * amount)
+    if angle:
+        c, s = math.cos(angle), math.sin(angle)
+        pts = pts @ np.array([[c, s], [-s, c]], dtype=np.float32)
+    if handedness == "Left":
+        pts[:, 0] = -pts[:, 0]
+
+    norm = np.zeros((21, 3), dtype=np.float32)
+    norm[:, 0] = cx + pts[:, 0] * size
+    norm[:, 1] = cy + pts[:, 1] * size * (w / h)
+    if jitter_px > 0.0:
+        rnd = rnd or random
+        norm[:, 0] += np.array([rnd.gauss(0, jitter_px) for _ in range(21)], dtype=np.float32) / w
+        norm[:, 1] += np.array([rnd.gauss(0, jitter_px) for _ in range(21)], dtype=np.float32) / h
+    return Hand(norm, w, h, handedness, 0.95)
+
+
+def pinch_amount(t: float, start: float, hold: float, ramp: float = 0.15) -> float:
+    """0 -> 1 over `ramp` s from `start`, held for `hold` s, then back to 0 over `ramp` s."""
+    if t < start or t > start + 2 * ramp + hold:
+        return 0.0
+    if t < start + ramp:
+        return (t - start) / ramp
+    if t <= start + ramp + hold:
+        return 1.0
+    return 1.0 - (t - start - ramp - hold) / ramp
+
+
+# -------------------------
+# Scripted sessions: list of (t_ms, Hand | None), one entry per camera frame
+# -------------------------
+def still(duration_s: float = 10.0, fps: float = 30.0, jitter_px: float = 0.6, seed: int = 1):
+    rnd = random.Random(seed)
+    return [(i * 1000.0 / fps, make_hand(0.5, 0.75, jitter_px=jitter_px, rnd=rnd))
+            for i in range(int(duration_s * fps))]
+
+
+def jitter(duration_s: float = 10.0, fps: float = 30.0, jitter_px: float = 2.5, tremor_px: float = 4.0, seed: int = 4):
+    """Resting hand with heavy landmark noise and a slow ~8 Hz tremor of the whole hand."""
+    rnd = random.Random(seed)
+    out = []
+    for i in range(int(duration_s * fps)):
+        t = i / fps
+        dx = tremor_px * math.sin(2 * math.pi * 8.0 * t) / FRAME_W
+        dy = tremor_px * math.cos(2 * math.pi * 7.0 * t) / FRAME_H
+        out.append((t * 1000.0, make_hand(0.5 + dx, 0.75 + dy, jitter_px=jitter_px, rnd=rnd)))
+    return out
+
+
+def swipes(duration_s: float = 10.0, fps: float = 30.0, period_s: float = 2.0, jitter_px: float = 0.6, seed: int = 2):
+    rnd = random.Random(seed)
+    out = []
+    for i in range(int(duration_s * fps)):
+        t = i / fps
+        cx = 0.5 + 0.25 * math.sin(2 * math.pi * t / period_s)
+        out.append((t * 1000.0, make_hand(cx, 0.75, jitter_px=jitter_px, rnd=rnd)))
+    return out
+
+
+def gestures_script(fps: float = 30.0, jitter_px: float = 0.6, seed: int = 3):
+    """
+    Mostly still hand (20 s) with: left click at 3 s, right click at 6 s, a drag at
+    9-10.5 s (moving right), a scroll at 13-14 s (moving down), a swipe at 16 s
+    and the hand out of view for 18.5-19 s.
+    """
+    def ramp(t, t0, dur):
+        return min(1.0, max(0.0, (t - t0) / dur))
+
+    rnd = random.Random(seed)
+    out = []
+    for i in range(int(20.0 * fps)):
+        t = i / fps
+        cx = 0.5 + 0.1 * ramp(t, 9.3, 1.0)
+        cy = 0.75 + 0.1 * ramp(t, 13.15, 1.0)
+        if 16.0 <= t < 16.6:
+            cx += 0.2 * math.sin(math.pi * (t - 16.0) / 0.6)
+
+        pinch, amount = None, 0.0
+        if 3.0 <= t < 3.6:
+            pinch, amount = "middle", pinch_amount(t, 3.0, 0.2)
+        elif 6.0 <= t < 6.6:
+            pinch, amount = "ring", pinch_amount(t, 6.0, 0.2)
+        elif 9.0 <= t < 10.8:
+            pinch, amount = "middle", pinch_amount(t, 9.0, 1.2)
+        elif 13.0 <= t < 14.4:
+            pinch, amount = "pinky", pinch_amount(t, 13.0, 1.0)
+
+        if 18.5 <= t < 19.0:
+            out.append((t * 1000.0, None))
+        else:
+            out.append((t * 1000.0, make_hand(cx, cy, pinch=pinch, amount=amount, jitter_px=jitter_px, rnd=rnd)))
+    return out
+
+
+def pointing_task(duration_s: float = 30.0, fps: float = 30.0, jitter_px: float = 1.5, seed: int = 5,
+                  speed: float = 2.0, size: float = 0.08):
+    """
+    A user moving between random screen targets, pausing on each and sometimes
+    clicking, right-clicking or dragging to the next one, with ground-truth
+    labels in the recording/tune.py labels.json format. The intended cursor is
+    the noise-free index tip mapped linearly (no gamma) and scaled by `speed`
+    about the frame center. Returns (frames, labels).
+    """
+    rnd = random.Random(seed)
+
+    def wrist_for(tx: float, ty: float):
+        # Wrist position that puts the index tip on screen fraction (tx, ty)
+        nx, ny = 0.5 + (tx - 0.5) / speed, 0.5 + (ty - 0.5) / speed
+        return nx - POINTING[8, 0] * size, ny - POINTING[8, 1] * size * (FRAME_W / FRAME_H)
+
+    # Script: (t_start, t_end, from, to, pinch, pinch_start, pinch_hold)
+    segments, clicks, drags = [], [], []
+    t, pos = 0.5, (0.5, 0.5)
+    segments.append((0.0, t, pos, pos, None, 0.0, 0.0))
+    while t < duration_s - 2.0:
+        target = (rnd.uniform(0.1, 0.9), rnd.uniform(0.1, 0.9))
+        move = rnd.uniform(0.3, 0.8)
+        dwell = rnd.uniform(0.6, 1.2)
+        roll = rnd.random()
+        if roll < 0.2:
+            # Drag: pinch, hold still, move to the target, release there
+            hold_still, ramp = 0.6, 0.15
+            segments.append((t, t + ramp + hold_still, pos, pos, "middle", t, hold_still + move + 0.1))
+            t_move = t + ramp + hold_still
+            segments.append((t_move, t_move + move, pos, target, "middle", t, hold_still + move + 0.1))
+            end = t + ramp + hold_still + move + 0.1
+            segments.append((t_move + move, end + ramp + dwell, target, target, "middle", t, hold_still + move + 0.1))
+            drags.append((t * 1000.0, (end + ramp / 2) * 1000.0))
+            t = end + ramp + dwell
+        else:
+            segments.append((t, t + move, pos, target, None, 0.0, 0.0))
+            t += move
+            pinch = "middle" if roll < 0.55 else "ring" if roll < 0.7 else None
+            start = t + rnd.uniform(0.15, 0.3)
+            segments.append((t, t + dwell, target, target, pinch, start, 0.1))
+            if pinch is not None:
+                clicks.append((start * 1000.0, "left_click" if pinch == "middle" else "right_click"))
+            t += dwell
+        pos = target
+
+    frames, targets = [], []
+    k = 0
+    for i in range(int(duration_s * fps)):
+        ti = i / fps
+        while k < len(segments) - 1 and ti >= segments[k][1]:
+            k += 1
+        t0, t1, a, b, pinch, p_start, p_hold = segments[k]
+        u = min(1.0, max(0.0, (ti - t0) / max(1e-6, t1 - t0)))
+        u = 0.5 - 0.5 * math.cos(math.pi * u)       # ease in / out
+        tx, ty = a[0] + (b[0] - a[0]) * u, a[1] + (b[1] - a[1]) * u
+        amount = pinch_amount(ti, p_start, p_hold) if pinch else 0.0
+        cx, cy = wrist_for(tx, ty)
+        hand = make_hand(cx, cy, size, pinch=pinch, amount=amount, jitter_px=jitter_px, rnd=rnd)
+        frames.append((ti * 1000.0, hand))
+        targets.append((round(ti * 1000.0, 2), round(min(1.0, max(0.0, tx)), 5), round(min(1.0, max(0.0, ty)), 5)))
+
+    labels = {"clicks": clicks, "drags": drags, "targets": targets}
+    return frames, labels
+
+
+# name -> generator of (t_ms, Hand | None) frames
+SESSIONS = {"still": still, "jitter": jitter, "swipes": swipes, "gestures": gestures_script}
@@ -0,0 +1,156 @@
+# camera/profile.py
+import time
+from dataclasses import dataclass, asdict
+
+import cv2
+
+
+@dataclass
+class CaptureProfile:
+    width: int
+    height: int
+    fourcc: str = "MJPG"   # "" = leave the driver default
+    fps: float = 30.0
+
+
+@dataclass
+class ProbeResult:
+    profile: CaptureProfile   # what was requested
+    width: int                # what the driver actually delivered
+    height: int
+    fps: float                # measured delivered frames per second
+    read_ms: float            # median time blocked in read()
+    ok: bool = True
+
+
+# Tried in order; the driver may silently substitute any of these
+CANDIDATES = [
+    CaptureProfile(1280, 720, "MJPG", 60),
+    CaptureProfile(1280, 720, "MJPG", 30),
+    CaptureProfile(960, 540, "MJPG", 30),
+    CaptureProfile(848, 480, "MJPG", 30),
+    CaptureProfile(640, 480, "MJPG", 30),
+    CaptureProfile(1280, 720, "YUYV", 30),
+    CaptureProfile(640, 480, "YUYV", 30),
+    CaptureProfile(1920, 1080, "MJPG", 30),
+]
+
+
+def fourcc_code(fourcc: str) -> int:
+    return cv2.VideoWriter_fourcc(*fourcc)
+
+
+def apply_profile(cap, profile: CaptureProfile):
+    # FOURCC first: many drivers only offer high resolutions at high fps with MJPG
+    if profile.fourcc:
+        cap.set(cv2.CAP_PROP_FOURCC, fourcc_code(profile.fourcc))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, profile.width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, profile.height)
+    if profile.fps:
+        cap.set(cv2.CAP_PROP_FPS, profile.fps)
+
+
+def measure(cap, profile: CaptureProfile, warmup: int = 3, frames: int = 15,
+            max_seconds: float = 0.75, clock=time.perf_counter) -> ProbeResult:
+    """Apply `profile`, drop `warmup` frames, then time up to `frames` reads (or max_seconds)."""
+    apply_profile(cap, profile)
+    for _ in range(warmup):
+        ok, _ = cap.read()
+        if not ok:
+            return ProbeResult(profile, 0, 0, 0.0, float("inf"), ok=False)
+
+    reads_ms = []
+    w = h = 0
+    start = clock()
+    while len(reads_ms) < frames and (clock() - start) < max_seconds:
+        t0 = clock()
+        ok, frame = cap.read()
+        t1 = clock()
+        if not ok or frame is None:
+            return ProbeResult(profile, 0, 0, 0.0, float("inf"), ok=False)
+        h, w = frame.shape[:2]
+        reads_ms.append((t1 - t0) * 1000.0)
+
+    elapsed = clock() - start
+    fps = len(reads_ms) / elapsed if elapsed > 0 else 0.0
+    reads_ms.sort()
+    return ProbeResult(profile, w, h, fps, reads_ms[len(reads_ms) // 2])
+
+
+def choose(results, target_w: int, target_h: int, min_fps: float = 24.0):
+    """
+    Best measured profile: no larger than the target resolution (the tracker does
+    not need more) and at least min_fps; among those within 10% of the fastest
+    rate, the most pixels, then the shortest read. Falls back to the fastest
+    working profile.
+    """
+    working = [r for r in results if r.ok and r.fps > 0]
+    if not working:
+        return None
+
+    fitting = [r for r in working
+               if r.width <= target_w and r.height <= target_h and r.fps >= min_fps]
+    if not fitting:
+        return max(working, key=lambda r: (r.fps, -r.width * r.height))
+
+    best_fps = max(r.fps for r in fitting)
+    fast = [r for r in fitting if r.fps >= 0.9 * best_fps]
+    # Prefer a profile the driver honoured as requested, so the cached one reproduces it
+    return max(fast, key=lambda r: (r.width * r.height, _honoured(r), -r.read_ms))
+
+
+def _honoured(r: ProbeResult) -> bool:
+    return (r.width, r.height) == (r.profile.width, r.profile.height)
+
+
+def probe(cap, target_w: int, target_h: int, min_fps: float = 24.0,
+          candidates=None, clock=time.perf_counter, **measure_kw):
+    """
+    Measure candidates on an open capture, largest first. Returns
+    (best ProbeResult | None, all results).
+
+    Candidates larger than the target are skipped, and probing stops once a
+    profile is honoured at a rate no later (smaller or slower) candidate could
+    beat by more than 10%.
+    """
+    # Skip what is larger than needed; measuring it costs seconds on slow modes
+    todo = [p for p in (candidates or CANDIDATES) if p.width <= target_w and p.height <= target_h]
+    todo.sort(key=lambda p: (p.width * p.height, p.fps), reverse=True)
+
+    results = []
+    for i, profile in enumerate(todo):
+        r = measure(cap, profile, clock=clock, **measure_kw)
+        results.append(r)
+        rest_fps = max((p.fps for p in todo[i + 1:]), default=0.0)
+        if r.ok and _honoured(r) and r.fps >= min_fps and r.fps >= 0.9 * rest_fps:
+            break
+    return choose(results, target_w, target_h, min_fps), results
+
+
+def negotiate(cap, cached: dict | None, target_w: int, target_h: int, min_fps: float = 24.0):
+    """
+    Apply the cached profile if it was chosen for this target, otherwise probe.
+    Returns (profile applied or None, ProbeResult to cache or None).
+    """
+    if cached and cached.get("target") == [target_w, target_h]:
+        profile = profile_from_dict(cached)
+        apply_profile(cap, profile)
+        return profile, None
+
+    best, _ = probe(cap, target_w, target_h, min_fps)
+    if best is None:
+        return None, None
+    apply_profile(cap, best.profile)
+    return best.profile, best
+
+
+def profile_to_dict(result: ProbeResult, target_w: int, target_h: int) -> dict:
+    d = asdict(result.profile)
+    d["target"] = [target_w, target_h]
+    d["measured_fps"] = round(result.fps, 1)
+    d["read_ms"] = round(result.read_ms, 2)
+    return d
+
+
+def profile_from_dict(d: dict) -> CaptureProfile:
+    return CaptureProfile(int(d["width"]), int(d["height"]), str(d.get("fourcc", "")), float(d.get("fps", 0)))
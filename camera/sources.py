@@ -0,0 +1,122 @@
+# camera/sources.py
+import time
+
+import cv2
+import numpy as np
+
+from camera.webcam import FrameSource, FramePool, Webcam, cap_frame_size, read_into
+
+
+class VideoFileSource(FrameSource):
+    """
+    Frames from a video file. realtime=True paces reads to the file's fps (like a
+    camera); False returns them as fast as they decode. loop=True rewinds at the end.
+    """
+
+    def __init__(self, path: str, realtime: bool = True, loop: bool = False, fps: float = 0.0):
+        self.cap = cv2.VideoCapture(path)
+        if not self.cap.isOpened():
+            raise RuntimeError(f"Could not open video file: {path}")
+        self.realtime = realtime
+        self.loop = loop
+        self.fps = fps or self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self.eof = False
+        self._pool = FramePool(2)
+        self._start = None
+        self._n = 0
+
+    def read(self, out=None):
+        if self.eof:
+            return None
+        if self.realtime:
+            if self._start is None:
+                self._start = time.monotonic()
+            due = self._start + self._n / self.fps
+            now = time.monotonic()
+            if due > now:
+                time.sleep(due - now)
+
+        frame = read_into(self.cap, out, self._pool)
+        if frame is None and self.loop and self._n > 0:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            frame = read_into(self.cap, out, self._pool)
+        if frame is None:
+            self.eof = True
+            return None
+        self._n += 1
+        return frame
+
+    def frame_size(self):
+        return cap_frame_size(self.cap)
+
+    def release(self):
+        self.cap.release()
+
+
+class SyntheticSource(FrameSource):
+    """
+    Generated frames: a dark background with a bright disc circling the centre.
+    `frames` > 0 ends the stream after that many frames. Draws into reused
+    buffers, so it costs no allocation after the first frames.
+    """
+
+    def __init__(self, width: int = 1280, height: int = 720, fps: float = 30.0,
+                 realtime: bool = True, frames: int = 0):
+        self.width = int(width)
+        self.height = int(height)
+        self.fps = fps
+        self.realtime = realtime
+        self.frames = int(frames)
+        self.eof = False
+        self._pool = FramePool(2)
+        self._start = None
+        self._n = 0
+
+    def read(self, out=None):
+        if self.frames and self._n >= self.frames:
+            self.eof = True
+            return None
+        if self.realtime:
+            if self._start is None:
+                self._start = time.monotonic()
+            due = self._start + self._n / self.fps
+            now = time.monotonic()
+            if due > now:
+                time.sleep(due - now)
+
+        shape = (self.height, self.width, 3)
+        buf = out if out is not None else self._pool.next()
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, dtype=np.uint8)
+            if out is None:
+                self._pool.keep(buf)
+
+        buf[:] = 40
+        a = 2.0 * np.pi * self._n / (4.0 * self.fps)    # one turn every 4 s
+        r = min(self.width, self.height) // 4
+        center = (int(self.width / 2 + r * np.cos(a)), int(self.height / 2 + r * np.sin(a)))
+        cv2.circle(buf, center, max(8, r // 4), (230, 230, 230), -1)
+        self._n += 1
+        return buf
+
+    def frame_size(self):
+        return self.width, self.height
+
+
+def open_source(spec: dict) -> FrameSource:
+    """
+    FrameSource from a camera settings dict (the keys of config "camera":
+    source, index, width, height, backend, file_path, ...). Used by camera
+    worker processes, so it only takes plain data.
+    """
+    kind = str(spec.get("source", "webcam")).lower()
+    if kind == "file":
+        return VideoFileSource(spec["file_path"], realtime=spec.get("file_realtime", True),
+                               loop=spec.get("file_loop", False))
+    if kind == "synthetic":
+        return SyntheticSource(spec.get("width", 1280), spec.get("height", 720),
+                               frames=spec.get("synthetic_frames", 0))
+    if kind == "webcam":
+        return Webcam(int(spec.get("index", 0)), int(spec.get("width", 1280)), int(spec.get("height", 720)),
+                      flush_frames=0, backend=spec.get("backend", "auto"))
+    raise ValueError(f"Unknown camera source: {kind!r} (expected webcam, file or synthetic)")
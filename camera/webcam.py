@@ -1,14 +1,114 @@
 # camera/webcam.py
+import sys
+import threading
+import time
+
 import cv2
 
-class Webcam:
-    def __init__(self, index: int, width: int, height: int):
-        self.cap = cv2.VideoCapture(index, cv2.CAP_DSHOW)
+# cv2 capture APIs by config name; "auto" picks the native one for the platform
+BACKENDS = {
+    "dshow": cv2.CAP_DSHOW,
+    "msmf": cv2.CAP_MSMF,
+    "v4l2": cv2.CAP_V4L2,
+    "any": cv2.CAP_ANY,
+}
+
+
+def backend_api(name: str) -> int:
+    if name == "auto":
+        if sys.platform == "win32":
+            return cv2.CAP_DSHOW
+        if sys.platform.startswith("linux"):
+            return cv2.CAP_V4L2
+        return cv2.CAP_ANY
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown camera backend: {name!r} (expected auto or one of {sorted(BACKENDS)})")
+    return BACKENDS[name]
+
+
+class FramePool:
+    """
+    Round-robin reusable frame buffers, so steady-state capture does not allocate.
+    Buffers are adopted from the first frames read (whatever shape the source
+    delivers) and replaced if the shape changes.
+    """
+
+    def __init__(self, size: int = 2):
+        self._bufs = [None] * max(1, size)
+        self._i = 0
+
+    def next(self):
+        """Buffer to read the next frame into (None until one has been adopted)."""
+        self._i = (self._i + 1) % len(self._bufs)
+        return self._bufs[self._i]
+
+    def keep(self, frame):
+        """Adopt `frame` as the current buffer (first read, or the source reallocated)."""
+        self._bufs[self._i] = frame
+
+
+class FrameSource:
+    """
+    Base for camera / file / synthetic sources.
+
+    read(out=None) returns the next frame or None. With `out` the frame is read
+    into it when shapes match; without, into the source's own FramePool, so a
+    returned frame is only valid until the call after next. `eof` is set once a
+    finite source has nothing left.
+    """
+
+    eof = False
+
+    def read(self, out=None):
+        raise NotImplementedError
+
+    def read_latest(self, timeout: float = 0.0):
+        """
+        Same shape as ThreadedCapture.read_latest: (frame, capture_time).
+        capture_time is time.monotonic() right after the read returned.
+        """
+        frame = self.read()
+        if frame is None:
+            return None, None
+        return frame, time.monotonic()
+
+    def frame_size(self):
+        """(width, height) of the frames the source delivers, or None if unknown."""
+        return None
+
+    def release(self):
+        pass
+
+
+def cap_frame_size(cap):
+    """(width, height) a cv2.VideoCapture reports, or None before it knows."""
+    w, h = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    return (w, h) if w > 0 and h > 0 else None
+
+
+def read_into(cap, out, pool: FramePool):
+    """cap.read() into `out` or the next pool buffer; returns the frame or None."""
+    buf = out if out is not None else pool.next()
+    ok, frame = cap.read(image=buf) if buf is not None else cap.read()
+    if not ok or frame is None:
+        return None
+    if out is None and frame is not buf:
+        pool.keep(frame)
+    return frame
+
+
+class Webcam(FrameSource):
+    """cv2.VideoCapture device; backend "auto" is DirectShow on Windows, V4L2 on Linux."""
+
+    def __init__(self, index: int, width: int, height: int, flush_frames: int = 3, backend: str = "auto"):
+        self.cap = cv2.VideoCapture(index, backend_api(backend))
         if not self.cap.isOpened():
             raise RuntimeError("Could not open webcam. Try changing CAMERA_INDEX.")
 
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        self.flush_frames = max(0, int(flush_frames))
+        self._pool = FramePool(2)
 
         # Reduce latency due to buffered frames (best effort; depends on backend/driver)
         try:
@@ -16,14 +116,174 @@ class Webcam:
         except Exception:
             pass
 
-    def read(self):
+    def read(self, out=None):
         # Flush a few buffered frames to reduce latency
-        for _ in range(3):
+        for _ in range(self.flush_frames):
             self.cap.grab()
-        ok, frame = self.cap.read()
-        if not ok:
-            return None
-        return frame
+        return read_into(self.cap, out, self._pool)
+
+    def frame_size(self):
+        return cap_frame_size(self.cap)
 
     def release(self):
         self.cap.release()
+
+
+class ThreadedCapture:
+    """
+    Pulls frames from `source` (a FrameSource) on a background thread into a
+    single "latest frame" slot. Older frames are overwritten, so the consumer
+    always gets the newest one and never waits on stale buffered frames.
+
+    Three reused buffers rotate between the capture thread, the slot and the
+    consumer: a frame returned by read_latest() stays valid until the next
+    read_latest() call. Keep a copy if it is needed for longer.
+    """
+
+    def __init__(self, source):
+        self.source = source
+
+        self._cond = threading.Condition()
+        self._bufs = [None, None, None]
+        self._slot = -1            # buffer index holding the newest frame
+        self._held = -1            # buffer index last handed to the consumer
+        self._frame_t = None
+        self._seq = 0
+        self._read_seq = 0
+        self._running = True
+        self.interval_s = 0.0      # minimum time between captures (0 = camera rate)
+        self._wake = threading.Event()
+
+        # Counters
+        self.frames_captured = 0
+        self.frames_delivered = 0
+        self.frames_dropped = 0    # overwritten before the consumer took them
+        self.last_age_ms = 0.0     # capture -> read_latest for the last delivered frame
+        self.max_age_ms = 0.0
+        self._age_sum_ms = 0.0
+
+        self._thread = threading.Thread(target=self._capture_loop, name="ThreadedCapture", daemon=True)
+        self._thread.start()
+
+    @property
+    def eof(self) -> bool:
+        """Source finished and its last frame was delivered."""
+        return self.source.eof and self._seq == self._read_seq
+
+    def _first_frame(self) -> bool:
+        """
+        Reads the first frame (into the source's own pool), copies it into
+        three buffers owned by this capture, so none of them aliases a buffer
+        the source writes again, and publishes it. False if the source ended or
+        release() was called first.
+        """
+        while self._running:
+            frame = self.source.read()
+            if frame is not None:
+                self._bufs = [frame.copy() for _ in range(3)]
+                self._publish(0, self._bufs[0], time.monotonic())
+                return True
+            if self.source.eof:
+                return False
+            time.sleep(0.005)
+        return False
+
+    def _publish(self, i: int, frame, t: float):
+        with self._cond:
+            if self._seq != self._read_seq:
+                self.frames_dropped += 1
+            self._bufs[i] = frame
+            self._slot = i
+            self._frame_t = t
+            self._seq += 1
+            self.frames_captured += 1
+            self._cond.notify_all()
+
+    def _capture_loop(self):
+        if not self._first_frame():
+            return
+        while self._running:
+            with self._cond:
+                i = next(k for k in range(3) if k != self._slot and k != self._held)
+            # Always into one of our buffers (never out=None); a different array
+            # back means the shape changed and the source allocated it for this read
+            frame = self.source.read(out=self._bufs[i])
+            t = time.monotonic()
+            if frame is None:
+                if self.source.eof:
+                    return
+                # Camera hiccup; don't spin
+                time.sleep(0.005)
+                continue
+
+            self._publish(i, frame, t)
+
+            if self.interval_s > 0:
+                # Throttled (idle): don't even grab until the next frame is due
+                self._wake.wait(self.interval_s - (time.monotonic() - t))
+                self._wake.clear()
+
+    def read_latest(self, timeout: float = 0.0):
+        """
+        Returns (frame, capture_time) for the newest frame not yet returned.
+        If none is ready, waits up to `timeout` seconds for the next one,
+        then returns (None, None).
+        """
+        with self._cond:
+            if self._seq == self._read_seq:
+                if timeout <= 0:
+                    return None, None
+                self._cond.wait(timeout)
+                if self._seq == self._read_seq:
+                    return None, None
+
+            self._read_seq = self._seq
+            self._held = self._slot
+            frame, t = self._bufs[self._slot], self._frame_t
+
+        age_ms = (time.monotonic() - t) * 1000.0
+        self.frames_delivered += 1
+        self.last_age_ms = age_ms
+        self._age_sum_ms += age_ms
+        if age_ms > self.max_age_ms:
+            self.max_age_ms = age_ms
+        return frame, t
+
+    def read(self):
+        frame, _ = self.read_latest(timeout=1.0)
+        return frame
+
+    def frame_size(self, timeout: float = 2.0):
+        """
+        (width, height) of the captured frames: waits up to `timeout` s for the
+        first frame, then falls back to what the source reports.
+        """
+        with self._cond:
+            if self._seq == 0:
+                self._cond.wait_for(lambda: self._seq > 0 or not self._thread.is_alive(), timeout)
+            if self._seq > 0:
+                h, w = self._bufs[self._slot].shape[:2]
+                return w, h
+        return self.source.frame_size()
+
+    def set_interval(self, seconds: float):
+        """Capture at most one frame per `seconds` (0 = every frame); takes effect immediately."""
+        self.interval_s = max(0.0, float(seconds))
+        self._wake.set()
+
+    def stats(self) -> dict:
+        delivered = max(1, self.frames_delivered)
+        return {
+            "captured": self.frames_captured,
+            "delivered": self.frames_delivered,
+            "dropped": self.frames_dropped,
+            "last_age_ms": self.last_age_ms,
+            "avg_age_ms": self._age_sum_ms / delivered,
+            "max_age_ms": self.max_age_ms,
+        }
+
+    def release(self):
+        self._running = False
+        self._wake.set()
+        self._thread.join(timeout=1.0)
+        self.source.release()
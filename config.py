@@ -1,4 +1,5 @@
 # config.py
+import copy
 import json
 import os
 import sys
@@ -26,11 +27,58 @@ MODEL_PATH = os.path.join(BASE_DIR, "models", "hand_landmarker.task")
 # -----------------------
 DEFAULTS = {
     "camera": {
+        # "webcam", "file" (file_path) or "synthetic" (generated frames, no camera)
+        "source": "webcam",
+        # cv2 capture API: "auto" (DirectShow on Windows, V4L2 on Linux), "dshow", "msmf", "v4l2", "any"
+        "backend": "auto",
+        "file_path": "",
+        "file_realtime": True,   # pace file frames to the file's fps (False: as fast as they decode)
+        "file_loop": False,
+        "synthetic_frames": 0,   # stop after this many generated frames (0 = endless)
         "index": 0,
         "width": 1920,
         "height": 1080,
         "mirror": True,
+        # "landmarks": mirror detections instead of flipping every frame; "pixels": cv2.flip each frame
+        "mirror_mode": "landmarks",
         "process_every_n_frames": 3,
+        "threaded_capture": True,
+        "flush_frames": 3,
+        # "fixed": just request width x height; "auto": probe resolution / FOURCC / fps
+        # up to target_width x target_height and cache the fastest in profile_cache
+        "profile": "fixed",
+        "target_width": 1280,
+        "target_height": 720,
+        "min_fps": 24,
+        "profile_cache": {},
+        # Several cameras: one capture + hand tracker process each, e.g.
+        # [{"index": 0, "region": [0, 0, 0.6, 1]}, {"index": 1, "region": [0.4, 0, 1, 1]}].
+        # Entries override the keys above; "region" places the camera's (mirrored) view
+        # in the shared workspace (default: all of it). Empty = the single camera above.
+        "sources": [],
+        "fusion": "best",             # "best": highest-scoring view; "blend": score-weighted mean
+        "fusion_max_skew_ms": 100,    # views this much older than the newest are ignored
+        "fusion_switch_margin": 0.1,  # score lead another camera needs to take over ("best")
+    },
+    "scheduler": {
+        # Adaptive inference cadence; replaces process_every_n_frames when enabled
+        "adaptive": False,
+        "min_interval_ms": 0,
+        "max_interval_ms": 150,
+        "fast_speed": 1.5,      # palm widths / s -> full rate at or above
+        "slow_speed": 0.3,      # palm widths / s -> max_interval at or below
+    },
+    "idle": {
+        # No hand for after_ms: stop running the landmarker, capture only fps frames/s and
+        # watch for motion in the active region on a tiny grayscale frame instead.
+        # Off by default: saves CPU, but a returning hand is picked up later (about
+        # 1/fps s plus one frame)
+        "enabled": False,
+        "after_ms": 5000,
+        "fps": 10,
+        "motion_width": 64,         # px width the active region is shrunk to
+        "motion_threshold": 16,     # gray-level change that counts as a changed pixel
+        "motion_fraction": 0.01,    # fraction of changed pixels that wakes tracking
     },
     "mapping": {
         "active_region_margin": 0.0,
@@ -38,14 +86,47 @@ DEFAULTS = {
         "mouse_speed": 3.0,
     },
     "smoothing": {
+        # "ema" (CursorSmoother), "one_euro", "double_exp" or "kalman"
+        "filter": "ema",
         "ema_alpha": 0.14,
         "deadzone_px": 3,
         "max_step_px": 70,
+        "one_euro_min_cutoff": 1.0,
+        "one_euro_beta": 0.01,
+        "one_euro_d_cutoff": 1.0,
+        "double_exp_alpha": 0.35,
+        "double_exp_beta": 0.1,
+        "kalman_process_noise": 0.0001,
+        "kalman_measurement_noise": 16.0,
+    },
+    "prediction": {
+        # Kalman extrapolation of the index tip to cover skipped / in-flight frames
+        "enabled": False,
+        "process_noise": 0.0002,
+        "measurement_noise": 4.0,
+        "max_horizon_ms": 120,
+        "max_overshoot_px": 40,
+        "rest_speed": 0.25,
     },
     "mediapipe": {
         "max_hands": 1,
         "min_detection_conf": 0.6,
         "min_tracking_conf": 0.6,
+        # "sync" (detect_for_video on the loop thread), "live_stream" (MediaPipe
+        # async callback), "thread" (sync landmarker on a worker thread) or
+        # "processes" (capture and landmarker in their own processes, frames
+        # passed through shared memory; vision/pipeline.py)
+        "inference_mode": "sync",
+        # "processes": frame slots in the shared ring, restarts per crashed process
+        "pipeline_slots": 4,
+        "pipeline_max_restarts": 5,
+        # ROI mode: after a confident detection, only a padded box around the
+        # last hand is sent to the model (full-frame scan on a miss / every K frames)
+        "roi_enabled": False,
+        "roi_padding": 0.6,
+        "roi_infer_size": 256,
+        "roi_full_scan_every": 15,
+        "roi_min_score": 0.8,
     },
     "gestures": {
         "pinch_start_ratio": 0.30,
@@ -54,6 +135,9 @@ DEFAULTS = {
         "pinch_drag_ms": 480,
         "click_debounce_ms": 250,
         "click_max_move_px": 35,
+        # Declarative gesture table (see README); empty = the built-in
+        # left click / drag, right click and scroll pinches from these settings
+        "table": [],
     },
     "scroll": {
         "pinch_start_ratio": 0.32,
@@ -61,8 +145,60 @@ DEFAULTS = {
         "px_per_step": 22,
         "max_step": 6,
     },
+    "poses": {
+        # Static pose classifier trained with gestures/train_pose.py ("" = off)
+        "model_path": "",
+        "min_confidence": 0.6,
+        # If set (e.g. "pointing"), this pose gates cursor movement instead of the finger y test
+        "pointing_label": "",
+    },
+    "output": {
+        # Send mouse events from a worker thread; consecutive moves are merged.
+        # Off by default: while the OS input API is stuck, queued clicks / scrolls
+        # beyond actions/threaded_mouse.py's queue limit are dropped
+        "threaded": False,
+        # "pynput" moves the real cursor; "none" only logs (headless runs with file/synthetic sources)
+        "mouse": "pynput",
+        # Move the cursor at this rate (e.g. the monitor's 120 / 144 Hz) on a timer thread,
+        # gliding between the loop's cursor targets; 0 = one move per loop iteration
+        "display_rate_hz": 0,
+        "display_mode": "interpolate",   # or "extrapolate" (no added lag, may overshoot)
+        "max_extrapolate_ms": 50,
+        # Used when the screen size can't be queried (non-Windows)
+        "screen_width": 1920,
+        "screen_height": 1080,
+    },
+    "stream": {
+        # Broadcast hands / cursor / gesture events to local subscribers (streaming/).
+        # With "output": {"mouse": "none"} the stream is the only output (headless).
+        "enabled": False,
+        "address": "tcp://127.0.0.1:8765",   # or "unix:///tmp/handmouse.sock"
+        "queue_size": 256,                   # per subscriber; oldest messages dropped when full
+    },
     "debug": {
         "show_debug": False,
+        # Debug window runs on its own thread at up to viewer_fps, frames scaled by viewer_scale
+        "viewer_fps": 30,
+        "viewer_scale": 0.5,
+    },
+    "profiling": {
+        # Per-stage latency ring buffers (p50/p95/p99); report written on exit if set
+        "enabled": True,
+        "window": 2048,
+        "report_path": "",
+        # Bytes / objects allocated per frame and GC pauses by stage (tracemalloc:
+        # slows the loop down a lot); report printed on exit
+        "allocations": False,
+        # Time from launch to camera open, model loaded, first result and first
+        # cursor move; printed on exit
+        "startup_report": False,
+    },
+    "recording": {
+        # Record frame timestamps, hands and mouse events for recording/replay.py
+        "enabled": False,
+        "dir": "recordings",
+        "save_frames": False,
+        "frame_scale": 0.25,
     },
 }
 
@@ -95,12 +231,33 @@ def write_json(path: str, data: dict):
         json.dump(data, f, indent=2)
 
 existing = load_json(CONFIG_JSON_PATH)
-if not existing:
-    # Create a default config.json next to exe/script so users can edit it
-    write_json(CONFIG_JSON_PATH, DEFAULTS)
-    settings = dict(DEFAULTS)
-else:
-    settings = deep_merge(DEFAULTS, existing)
+settings = deep_merge(DEFAULTS, existing)
+
+def save_camera_profile(index: int, profile: dict):
+    """Store a probed capture profile for camera `index` in config.json."""
+    data = load_json(CONFIG_JSON_PATH)
+    if not data:
+        if os.path.exists(CONFIG_JSON_PATH):
+            return  # unreadable user file; don't overwrite it
+        data = copy.deepcopy(DEFAULTS)
+    camera = data.setdefault("camera", {})
+    cache = camera.setdefault("profile_cache", {})
+    cache[str(index)] = profile
+    write_json(CONFIG_JSON_PATH, data)
+
+def save_overrides(overrides: dict, path: str = CONFIG_JSON_PATH):
+    """Deep-merge `overrides` (e.g. tuned parameters) into config.json at `path`."""
+    data = load_json(path)
+    if not data:
+        if os.path.exists(path):
+            raise ValueError(f"Not overwriting unreadable config file: {path}")
+        data = copy.deepcopy(DEFAULTS)
+    write_json(path, deep_merge(data, overrides))
+
+def ensure_config_json():
+    """Create a default config.json next to exe/script so users can edit it (not done on import)."""
+    if not existing and not os.path.exists(CONFIG_JSON_PATH):
+        write_json(CONFIG_JSON_PATH, DEFAULTS)
 
 
 # -----------------------
@@ -108,11 +265,54 @@ else:
 # -----------------------
 
 # Camera
+CAMERA_SOURCE = str(settings["camera"]["source"]).lower()
+CAMERA_BACKEND = str(settings["camera"]["backend"]).lower()
+CAMERA_FILE_PATH = str(settings["camera"]["file_path"])
+if CAMERA_FILE_PATH and not os.path.isabs(CAMERA_FILE_PATH):
+    CAMERA_FILE_PATH = os.path.join(BASE_DIR, CAMERA_FILE_PATH)
+CAMERA_FILE_REALTIME = bool(settings["camera"]["file_realtime"])
+CAMERA_FILE_LOOP = bool(settings["camera"]["file_loop"])
+CAMERA_SYNTHETIC_FRAMES = int(settings["camera"]["synthetic_frames"])
 CAMERA_INDEX = int(settings["camera"]["index"])
 CAMERA_WIDTH = int(settings["camera"]["width"])
 CAMERA_HEIGHT = int(settings["camera"]["height"])
 MIRROR_CAMERA = bool(settings["camera"]["mirror"])
+MIRROR_MODE = str(settings["camera"]["mirror_mode"]).lower()
 PROCESS_EVERY_N_FRAMES = max(1, int(settings["camera"]["process_every_n_frames"]))
+THREADED_CAPTURE = bool(settings["camera"]["threaded_capture"])
+CAMERA_FLUSH_FRAMES = max(0, int(settings["camera"]["flush_frames"]))
+CAMERA_PROFILE = str(settings["camera"]["profile"]).lower()
+CAMERA_TARGET_WIDTH = int(settings["camera"]["target_width"])
+CAMERA_TARGET_HEIGHT = int(settings["camera"]["target_height"])
+CAMERA_MIN_FPS = float(settings["camera"]["min_fps"])
+CAMERA_PROFILE_CACHE = dict(settings["camera"]["profile_cache"] or {})
+
+_camera_base = {k: settings["camera"][k] for k in
+                ("source", "backend", "file_path", "file_realtime", "file_loop", "synthetic_frames",
+                 "index", "width", "height")}
+CAMERA_SPEC = dict(_camera_base, file_path=CAMERA_FILE_PATH)   # single camera, for worker processes
+CAMERA_SOURCES = [deep_merge(_camera_base, s) for s in settings["camera"]["sources"] or []]
+for _s in CAMERA_SOURCES:
+    if _s["file_path"] and not os.path.isabs(_s["file_path"]):
+        _s["file_path"] = os.path.join(BASE_DIR, _s["file_path"])
+CAMERA_FUSION = str(settings["camera"]["fusion"]).lower()
+CAMERA_FUSION_MAX_SKEW_MS = float(settings["camera"]["fusion_max_skew_ms"])
+CAMERA_FUSION_SWITCH_MARGIN = float(settings["camera"]["fusion_switch_margin"])
+
+# Inference scheduler
+ADAPTIVE_INFERENCE = bool(settings["scheduler"]["adaptive"])
+SCHED_MIN_INTERVAL_MS = float(settings["scheduler"]["min_interval_ms"])
+SCHED_MAX_INTERVAL_MS = float(settings["scheduler"]["max_interval_ms"])
+SCHED_FAST_SPEED = float(settings["scheduler"]["fast_speed"])
+SCHED_SLOW_SPEED = float(settings["scheduler"]["slow_speed"])
+
+# Idle mode
+IDLE_ENABLED = bool(settings["idle"]["enabled"])
+IDLE_AFTER_MS = float(settings["idle"]["after_ms"])
+IDLE_FPS = float(settings["idle"]["fps"])
+IDLE_MOTION_WIDTH = int(settings["idle"]["motion_width"])
+IDLE_MOTION_THRESHOLD = int(settings["idle"]["motion_threshold"])
+IDLE_MOTION_FRACTION = float(settings["idle"]["motion_fraction"])
 
 # Cursor mapping
 ACTIVE_REGION_MARGIN = float(settings["mapping"]["active_region_margin"])
@@ -123,11 +323,29 @@ MOUSE_SPEED = float(settings["mapping"]["mouse_speed"])
 EMA_ALPHA = float(settings["smoothing"]["ema_alpha"])
 DEADZONE_PX = int(settings["smoothing"]["deadzone_px"])
 MAX_STEP_PX = int(settings["smoothing"]["max_step_px"])
+SMOOTHING_FILTER = str(settings["smoothing"]["filter"]).lower()
+SMOOTHING_PARAMS = {k: float(v) for k, v in settings["smoothing"].items() if k != "filter"}
+
+# Prediction
+PREDICTION_ENABLED = bool(settings["prediction"]["enabled"])
+PREDICTION_PROCESS_NOISE = float(settings["prediction"]["process_noise"])
+PREDICTION_MEASUREMENT_NOISE = float(settings["prediction"]["measurement_noise"])
+PREDICTION_MAX_HORIZON_MS = float(settings["prediction"]["max_horizon_ms"])
+PREDICTION_MAX_OVERSHOOT_PX = float(settings["prediction"]["max_overshoot_px"])
+PREDICTION_REST_SPEED = float(settings["prediction"]["rest_speed"])
 
 # MediaPipe
 MAX_HANDS = int(settings["mediapipe"]["max_hands"])
 MIN_DETECTION_CONF = float(settings["mediapipe"]["min_detection_conf"])
 MIN_TRACKING_CONF = float(settings["mediapipe"]["min_tracking_conf"])
+INFERENCE_MODE = str(settings["mediapipe"]["inference_mode"]).lower()
+ROI_ENABLED = bool(settings["mediapipe"]["roi_enabled"])
+ROI_PADDING = float(settings["mediapipe"]["roi_padding"])
+ROI_INFER_SIZE = int(settings["mediapipe"]["roi_infer_size"])
+ROI_FULL_SCAN_EVERY = max(1, int(settings["mediapipe"]["roi_full_scan_every"]))
+ROI_MIN_SCORE = float(settings["mediapipe"]["roi_min_score"])
+PIPELINE_SLOTS = max(4, int(settings["mediapipe"]["pipeline_slots"]))
+PIPELINE_MAX_RESTARTS = max(0, int(settings["mediapipe"]["pipeline_max_restarts"]))
 
 # Gestures
 PINCH_START_RATIO = float(settings["gestures"]["pinch_start_ratio"])
@@ -136,6 +354,7 @@ PINCH_CLICK_MS = int(settings["gestures"]["pinch_click_ms"])
 PINCH_DRAG_MS = int(settings["gestures"]["pinch_drag_ms"])
 CLICK_DEBOUNCE_MS = int(settings["gestures"]["click_debounce_ms"])
 CLICK_MAX_MOVE_PX = int(settings["gestures"]["click_max_move_px"])
+GESTURE_TABLE = list(settings["gestures"]["table"] or [])
 
 # Scroll (thumb+pinky mode)
 SCROLL_PINCH_START_RATIO = float(settings["scroll"]["pinch_start_ratio"])
@@ -143,5 +362,43 @@ SCROLL_PINCH_END_RATIO = float(settings["scroll"]["pinch_end_ratio"])
 SCROLL_PX_PER_STEP = int(settings["scroll"]["px_per_step"])
 SCROLL_MAX_STEP = int(settings["scroll"]["max_step"])
 
+# Pose classifier
+POSE_MODEL_PATH = str(settings["poses"]["model_path"])
+if POSE_MODEL_PATH and not os.path.isabs(POSE_MODEL_PATH):
+    POSE_MODEL_PATH = os.path.join(BASE_DIR, POSE_MODEL_PATH)
+POSE_MIN_CONFIDENCE = float(settings["poses"]["min_confidence"])
+POSE_POINTING_LABEL = str(settings["poses"]["pointing_label"])
+
+# Mouse output
+THREADED_OUTPUT = bool(settings["output"]["threaded"])
+OUTPUT_MOUSE = str(settings["output"]["mouse"]).lower()
+DISPLAY_RATE_HZ = float(settings["output"]["display_rate_hz"])
+DISPLAY_MODE = str(settings["output"]["display_mode"]).lower()
+MAX_EXTRAPOLATE_MS = float(settings["output"]["max_extrapolate_ms"])
+SCREEN_WIDTH = int(settings["output"]["screen_width"])
+SCREEN_HEIGHT = int(settings["output"]["screen_height"])
+
+# Event stream
+STREAM_ENABLED = bool(settings["stream"]["enabled"])
+STREAM_ADDRESS = str(settings["stream"]["address"])
+STREAM_QUEUE_SIZE = int(settings["stream"]["queue_size"])
+
 # Debug
 SHOW_DEBUG = bool(settings["debug"]["show_debug"])
+VIEWER_FPS = float(settings["debug"]["viewer_fps"])
+VIEWER_SCALE = float(settings["debug"]["viewer_scale"])
+
+# Profiling
+PROFILING_ENABLED = bool(settings["profiling"]["enabled"])
+PROFILING_WINDOW = int(settings["profiling"]["window"])
+PROFILING_REPORT_PATH = str(settings["profiling"]["report_path"])
+PROFILING_ALLOCATIONS = bool(settings["profiling"]["allocations"])
+PROFILING_STARTUP_REPORT = bool(settings["profiling"]["startup_report"])
+if PROFILING_REPORT_PATH and not os.path.isabs(PROFILING_REPORT_PATH):
+    PROFILING_REPORT_PATH = os.path.join(BASE_DIR, PROFILING_REPORT_PATH)
+
+# Recording
+RECORDING_ENABLED = bool(settings["recording"]["enabled"])
+RECORDING_DIR = os.path.join(BASE_DIR, str(settings["recording"]["dir"]))
+RECORDING_SAVE_FRAMES = bool(settings["recording"]["save_frames"])
+RECORDING_FRAME_SCALE = float(settings["recording"]["frame_scale"])
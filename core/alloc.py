@@ -0,0 +1,155 @@
+# core/alloc.py
+import gc
+import sys
+import tracemalloc
+from array import array
+
+from core.latency import perf
+
+# Stage name used before the first stage() call of a frame / outside frames
+IDLE_STAGE = "between frames"
+
+
+class AllocationProfiler:
+    """
+    Per-frame allocation and GC-pause accounting for the loop
+    ("profiling": {"allocations": true}). Slow (tracemalloc traces every
+    allocation); meant for finding allocations, not for normal runs.
+
+    Per frame and per stage:
+      bytes     tracemalloc high-water mark above the stage's starting level:
+                what the stage had allocated at most at once (temporaries
+                included, even if freed before the stage ended)
+      retained  net traced bytes still allocated at the end of the stage
+      blocks    net change in sys.getallocatedblocks() (objects kept alive)
+    GC: every collection (gc.callbacks) with its generation and pause,
+    attributed to the stage it interrupted.
+
+        prof.begin_frame(); prof.stage(READ); ...; prof.stage(DETECT); ...; prof.end_frame()
+
+    Samples go to fixed-size rings (the last `size` frames) and all counters
+    are preallocated arrays, so the profiler keeps nothing alive per frame and
+    its own temporaries stay within a stage's first few dozen bytes.
+    """
+
+    def __init__(self, size: int = 2048):
+        self.size = max(16, int(size))
+        self.frames = 0
+        # Counters live in arrays, not lists: a list would keep one int object per
+        # sample alive, and the profiler would count its own bookkeeping
+        self._bytes = array("q", bytes(8 * self.size))
+        self._retained = array("q", bytes(8 * self.size))
+        self._blocks = array("q", bytes(8 * self.size))
+        self._frame = array("q", [0, 0, 0])   # bytes, retained, blocks of the current frame
+        self._stages = {}         # stage -> array [bytes sum, retained sum, blocks sum, count]
+        self._gc = {}             # stage -> [collections, pause s sum, max pause s, per-generation counts]
+        self._stage = IDLE_STAGE
+        self._gc_t0 = 0.0
+        self._running = False
+
+        # Where the current stage started
+        self._stage_cur0 = 0
+        self._stage_blocks0 = 0
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        gc.callbacks.append(self._on_gc)
+        self._running = True
+        tracemalloc.reset_peak()
+        self._stage_cur0, _ = tracemalloc.get_traced_memory()
+        self._stage_blocks0 = sys.getallocatedblocks()
+        return self
+
+    def stop(self):
+        if self._running:
+            gc.callbacks.remove(self._on_gc)
+            tracemalloc.stop()
+            self._running = False
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._gc_t0 = perf()
+            return
+        pause = perf() - self._gc_t0
+        row = self._gc.get(self._stage)
+        if row is None:
+            row = self._gc[self._stage] = [0, 0.0, 0.0, [0, 0, 0]]
+        row[0] += 1
+        row[1] += pause
+        if pause > row[2]:
+            row[2] = pause
+        row[3][info["generation"]] += 1
+
+    # -------------------------
+    # Hot path
+    # -------------------------
+    def begin_frame(self):
+        self._close_stage()     # IDLE_STAGE: whatever ran since end_frame()
+        frame = self._frame
+        frame[0] = frame[1] = frame[2] = 0
+
+    def _close_stage(self):
+        cur, peak = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks()
+        row = self._stages.get(self._stage)
+        if row is None:
+            row = self._stages[self._stage] = array("q", [0, 0, 0, 0])
+        frame = self._frame
+        used = peak - self._stage_cur0
+        kept = cur - self._stage_cur0
+        new_blocks = blocks - self._stage_blocks0
+        row[0] += used
+        row[1] += kept
+        row[2] += new_blocks
+        row[3] += 1
+        frame[0] += used
+        frame[1] += kept
+        frame[2] += new_blocks
+        tracemalloc.reset_peak()
+        self._stage_cur0 = cur
+        self._stage_blocks0 = blocks
+
+    def stage(self, name: str):
+        """End the current stage and start `name`."""
+        self._close_stage()
+        self._stage = name
+
+    def end_frame(self):
+        self._close_stage()
+        self._stage = IDLE_STAGE
+        i = self.frames % self.size
+        self._bytes[i], self._retained[i], self._blocks[i] = self._frame
+        self.frames += 1
+
+    # -------------------------
+    # Reporting
+    # -------------------------
+    def _window(self, ring) -> list:
+        return ring[:self.frames].tolist() if self.frames < self.size else ring.tolist()
+
+    def summary(self) -> dict:
+        """Per-frame means / max over the window, per-stage means, GC pauses per stage."""
+        frame = {}
+        for key, ring in (("bytes", self._bytes), ("retained", self._retained), ("blocks", self._blocks)):
+            vals = self._window(ring)
+            frame[key] = {"mean": sum(vals) / len(vals), "max": max(vals)} if vals else {"mean": 0.0, "max": 0}
+        stages = {name: {"bytes": b / n, "retained": r / n, "blocks": k / n}
+                  for name, (b, r, k, n) in self._stages.items() if n}
+        gc_stats = {name: {"collections": c, "pause_ms": s * 1000.0, "max_pause_ms": m * 1000.0,
+                           "generations": list(g)}
+                    for name, (c, s, m, g) in self._gc.items()}
+        return {"frames": self.frames, "per_frame": frame, "stages": stages, "gc": gc_stats}
+
+    def report(self) -> str:
+        s = self.summary()
+        f = s["per_frame"]
+        lines = [f"allocations over {s['frames']} frames: "
+                 f"{f['bytes']['mean']:.0f} B / frame (max {f['bytes']['max']}), "
+                 f"retained {f['retained']['mean']:+.1f} B, blocks {f['blocks']['mean']:+.2f} / frame"]
+        for name, row in sorted(s["stages"].items(), key=lambda kv: -kv[1]["bytes"]):
+            lines.append(f"  {name:<16}{row['bytes']:>10.0f} B{row['retained']:>+10.1f} B{row['blocks']:>+8.2f} blocks")
+        for name, row in s["gc"].items():
+            lines.append(f"  gc in {name}: {row['collections']} collections (gen {row['generations']}), "
+                         f"{row['pause_ms']:.1f} ms total, max {row['max_pause_ms']:.2f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,146 @@
+# core/controller.py
+import time
+
+from core.mapping import compute_active_region, map_cam_to_screen
+from core.sensitivity import apply_mouse_speed
+from core.pose import is_index_pointing
+from core.latency import perf, CURSOR, GESTURES, OUTPUT, MOTION_TO_CURSOR
+
+
+class HandController:
+    """
+    Per-frame hand -> cursor + gesture logic, shared by main.py and the replay driver.
+
+    `mouse` is anything with the MouseController methods (the real one, a
+    RecordingMouse, ...). Nothing here touches the camera or the model.
+    `stats` (core.latency.LatencyStats) times cursor / gestures / output and the
+    capture -> move_to latency.
+
+    `poses` (gestures.poses.PoseClassifier) labels each hand's static pose into
+    `pose`; with `pointing_label` set, that pose gates the cursor instead of
+    is_index_pointing.
+    """
+
+    def __init__(
+        self,
+        mouse,
+        smoother,
+        gestures,
+        screen_w: int,
+        screen_h: int,
+        active_region_margin: float,
+        map_gamma: float,
+        mouse_speed: float,
+        predictor=None,
+        clock=time.monotonic,
+        stats=None,
+        poses=None,
+        pointing_label: str = "",
+    ):
+        self.mouse = mouse
+        self.smoother = smoother
+        self.gestures = gestures
+        self.screen_w = screen_w
+        self.screen_h = screen_h
+        self.active_region_margin = active_region_margin
+        self.map_gamma = map_gamma
+        self.mouse_speed = mouse_speed
+        self.predictor = predictor
+        self.clock = clock
+        self.stats = stats
+        self.poses = poses
+        self.pointing_label = pointing_label if poses is not None else ""
+        self.pose = None   # label from the last step (None: no classifier / not confident)
+
+        self.active_region = None
+
+        # Cursor value used for gesture gating even when not moving
+        self.last_cursor = (screen_w // 2, screen_h // 2)
+        self.moves = 0
+
+    def set_frame_size(self, w: int, h: int):
+        if self.active_region is None:
+            self.active_region = compute_active_region(w, h, self.active_region_margin)
+
+    def on_detection(self, hand, det_ts_ms: int):
+        """A fresh tracker result (hand or None) for the frame stamped det_ts_ms."""
+        if self.predictor is None:
+            return
+        if hand is None:
+            self.predictor.reset()
+        else:
+            tx, ty = hand["index_tip"]
+            self.predictor.update(tx, ty, det_ts_ms)
+
+    def step(self, hand, timestamp_ms: int, capture_t: float):
+        """Drive cursor and gestures from `hand` for this frame. Returns the gesture events."""
+        stats = self.stats
+        t_out = 0.0
+        t0 = perf()
+
+        if self.poses is not None:
+            self.pose = self.poses.predict(hand)
+
+        # Move cursor only if user is "pointing" with index finger
+        if self.pointing_label:
+            pointing = self.pose == self.pointing_label
+        else:
+            pointing = is_index_pointing(hand)
+
+        if pointing:
+            x_px, y_px = hand["index_tip"]
+            if self.predictor is not None:
+                # Where the tip should be by the time the cursor moves
+                predicted = self.predictor.predict(timestamp_ms)
+                if predicted is not None:
+                    x_px, y_px = predicted
+
+            sx, sy = map_cam_to_screen(
+                x_px, y_px, self.active_region, self.screen_w, self.screen_h, gamma=self.map_gamma
+            )
+            sx, sy = self.smoother.update(sx, sy, capture_t)
+            sx, sy = apply_mouse_speed(sx, sy, self.screen_w, self.screen_h, self.mouse_speed)
+
+            now = self.clock()
+            if stats is not None:
+                stats.add(MOTION_TO_CURSOR, now - capture_t)
+
+            t_m = perf()
+            self.mouse.move_to(sx, sy)
+            t_out += perf() - t_m
+            self.last_cursor = (sx, sy)
+            self.moves += 1
+
+            if self.predictor is not None:
+                self.predictor.note_latency((now - capture_t) * 1000.0)
+
+        t1 = perf()
+
+        # Gestures still processed even if cursor isn't moving
+        events = self.gestures.update(hand, timestamp_ms, cursor_xy=self.last_cursor)
+        mouse = self.mouse
+
+        t2 = perf()
+
+        if events.get("scroll", 0):
+            mouse.scroll(events["scroll"])
+
+        if events["left_click"]:
+            mouse.left_click()
+
+        if events["right_click"]:
+            mouse.right_click()
+
+        if events["drag_start"]:
+            mouse.press_left()
+
+        if events["drag_end"]:
+            mouse.release_left()
+
+        if stats is not None:
+            t3 = perf()
+            stats.add(CURSOR, (t1 - t0) - t_out)
+            stats.add(GESTURES, t2 - t1)
+            stats.add(OUTPUT, t_out + (t3 - t2))
+
+        return events
@@ -0,0 +1,117 @@
+# core/idle.py
+import cv2
+
+
+class MotionDetector:
+    """
+    Cheap "did anything move" test for idle mode: the active region of each
+    frame is shrunk to `width` px wide grayscale and compared with the
+    previous one. Motion = more than `min_fraction` of the small pixels
+    changed by more than `threshold` gray levels. All buffers are reused.
+
+    Shrinking samples a 4x larger grid (nearest) and area-averages that, so
+    each small pixel still averages 16 samples of sensor noise at a fraction
+    of the cost of averaging the whole frame.
+    """
+
+    def __init__(self, width: int = 64, threshold: int = 16, min_fraction: float = 0.01):
+        self.width = max(8, int(width))
+        self.threshold = int(threshold)
+        self.min_fraction = float(min_fraction)
+        self._mid = None
+        self._small = None
+        self._gray = [None, None]    # current / previous, swapped each frame
+        self._diff = None
+        self._has_prev = False
+        self.changed = 0.0           # fraction of changed pixels in the last update
+
+    def reset(self):
+        """Forget the previous frame (the next update only primes)."""
+        self._has_prev = False
+
+    def update(self, frame, region) -> bool:
+        """True if `frame` differs from the previous one inside `region` (core.mapping.ActiveRegion)."""
+        crop = frame[region.y0:region.y1, region.x0:region.x1]
+        h, w = crop.shape[:2]
+        size = (self.width, max(1, round(self.width * h / max(1, w))))
+        mid = (size[0] * 4, size[1] * 4)
+        if self._small is None or self._small.shape[1::-1] != size:
+            self._mid = cv2.resize(crop, mid, interpolation=cv2.INTER_NEAREST)
+            self._small = cv2.resize(self._mid, size, interpolation=cv2.INTER_AREA)
+            self._gray = [cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY) for _ in range(2)]
+            self._diff = self._gray[0].copy()
+            self._has_prev = False
+        else:
+            cv2.resize(crop, mid, dst=self._mid, interpolation=cv2.INTER_NEAREST)
+            cv2.resize(self._mid, size, dst=self._small, interpolation=cv2.INTER_AREA)
+
+        cur, prev = self._gray
+        cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY, dst=cur)
+        moved = False
+        if self._has_prev:
+            cv2.absdiff(cur, prev, dst=self._diff)
+            cv2.threshold(self._diff, self.threshold, 255, cv2.THRESH_BINARY, dst=self._diff)
+            self.changed = cv2.countNonZero(self._diff) / self._diff.size
+            moved = self.changed > self.min_fraction
+        self._gray.reverse()
+        self._has_prev = True
+        return moved
+
+
+class IdleMonitor:
+    """
+    Switches the loop between tracking and idle.
+
+    observe() is fed every fresh detection; after `idle_after_ms` without a
+    hand, `idle` turns True. While idle the loop skips the landmarker, sends
+    frames to motion() instead and asks its capture for only `idle_fps`
+    frames per second. Motion inside the active region ends idle on that
+    frame, so the landmarker runs on the very frame that showed it.
+    """
+
+    def __init__(self, idle_after_ms: float = 5000.0, idle_fps: float = 10.0, detector: MotionDetector | None = None):
+        self.idle_after_ms = float(idle_after_ms)
+        self.idle_fps = max(0.1, float(idle_fps))
+        self.detector = detector or MotionDetector()
+        self.idle = False
+        self._last_hand_ms = None
+
+        # Counters
+        self.idle_periods = 0
+        self.idle_frames = 0
+        self.wakeups = 0
+
+    @property
+    def frame_interval_s(self) -> float:
+        """Seconds between captured frames the loop needs now (0 = as fast as the camera)."""
+        return 1.0 / self.idle_fps if self.idle else 0.0
+
+    def observe(self, hand, det_ts_ms: float) -> bool:
+        """Feed a fresh detection (hand or None). Returns True when this one starts idle."""
+        if hand is not None or self._last_hand_ms is None:
+            self._last_hand_ms = det_ts_ms
+            return False
+        if not self.idle and det_ts_ms - self._last_hand_ms >= self.idle_after_ms:
+            self.idle = True
+            self.idle_periods += 1
+            self.detector.reset()
+            return True
+        return False
+
+    def motion(self, frame, region, now_ms: float) -> bool:
+        """While idle: True (and tracking again) if `frame` shows motion inside `region`."""
+        self.idle_frames += 1
+        if not self.detector.update(frame, region):
+            return False
+        self.idle = False
+        self._last_hand_ms = now_ms
+        self.wakeups += 1
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "idle": self.idle,
+            "idle_periods": self.idle_periods,
+            "idle_frames": self.idle_frames,
+            "wakeups": self.wakeups,
+        }
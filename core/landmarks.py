@@ -0,0 +1,161 @@
+# core/landmarks.py
+import math
+from functools import lru_cache
+
+import numpy as np
+
+# Landmark indices (MediaPipe Hands)
+WRIST = 0
+THUMB_TIP = 4
+INDEX_MCP, INDEX_PIP, INDEX_TIP = 5, 6, 8
+MIDDLE_MCP, MIDDLE_PIP, MIDDLE_TIP = 9, 10, 12
+RING_PIP, RING_TIP = 14, 16
+PINKY_MCP, PINKY_PIP, PINKY_TIP = 17, 18, 20
+
+MIRRORED_HANDEDNESS = {"Left": "Right", "Right": "Left"}
+
+# index, middle, ring, pinky
+FINGER_TIPS = np.array([INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP])
+FINGER_PIPS = np.array([INDEX_PIP, MIDDLE_PIP, RING_PIP, PINKY_PIP])
+
+
+@lru_cache(maxsize=8)
+def _px_scale(width: int, height: int) -> np.ndarray:
+    scale = np.array((width, height), dtype=np.float32)
+    scale.flags.writeable = False
+    return scale
+
+
+class Hand:
+    """
+    One detected hand.
+
+    norm: float32 (21, 3) normalized x/y/z in full-frame coordinates (as MediaPipe gives them)
+    px:   float32 (21, 2) sub-pixel image coordinates
+
+    Indexing like the old dict (hand["landmarks"], hand["index_tip"], hand["thumb_tip"],
+    hand["handedness"], hand["score"]) still works; "landmarks" is a list of int tuples
+    built on first use.
+
+    The arrays serve the vectorized users (gesture table, pose features, replay).
+    The few scalar reads per frame (point, distance, the pointing gate) go
+    through `rows`, px as a list of [x, y] floats: indexing a NumPy array per
+    element costs more than the arithmetic it feeds. rows is built with the
+    Hand, so reading it allocates nothing in the control loop; px is not
+    modified in place afterwards.
+    """
+
+    __slots__ = ("norm", "px", "rows", "width", "height", "handedness", "score", "_pts")
+
+    def __init__(self, norm: np.ndarray, width: int, height: int, handedness=None, score: float = 1.0):
+        self.norm = norm
+        self.width = width
+        self.height = height
+        self.px = norm[:, :2] * _px_scale(width, height)
+        self.rows = self.px.tolist()
+        self.handedness = handedness
+        self.score = score
+        self._pts = None
+
+    def mirror(self):
+        """
+        Flip horizontally in place, as if the frame had been mirrored before detection
+        (x -> 1 - x, Left <-> Right). px is replaced, not modified, so arrays
+        taken from it earlier keep the unmirrored values.
+        """
+        self.norm[:, 0] = 1.0 - self.norm[:, 0]
+        self.px = self.norm[:, :2] * _px_scale(self.width, self.height)
+        self.rows = self.px.tolist()
+        self.handedness = MIRRORED_HANDEDNESS.get(self.handedness, self.handedness)
+        self._pts = None
+        return self
+
+    def point(self, i: int):
+        x, y = self.rows[i]
+        return int(x), int(y)
+
+    def distance(self, a: int, b: int) -> float:
+        """Pixel distance between landmarks a and b."""
+        (ax, ay), (bx, by) = self.rows[a], self.rows[b]
+        return math.hypot(ax - bx, ay - by)
+
+    @property
+    def landmarks(self):
+        if self._pts is None:
+            self._pts = [(int(x), int(y)) for x, y in self.rows]
+        return self._pts
+
+    # dict-style compatibility view
+    def __getitem__(self, key):
+        if key == "landmarks":
+            return self.landmarks
+        if key == "index_tip":
+            return self.point(INDEX_TIP)
+        if key == "thumb_tip":
+            return self.point(THUMB_TIP)
+        if key == "handedness":
+            return self.handedness
+        if key == "score":
+            return self.score
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+def hand_from_landmarks(landmarks, w: int, h: int, x0: int = 0, y0: int = 0,
+                        crop_w: int | None = None, crop_h: int | None = None,
+                        handedness=None, score: float = 1.0) -> Hand:
+    """
+    MediaPipe NormalizedLandmark list -> Hand, in one array pass.
+    If the model saw a crop at (x0, y0) of size (crop_w, crop_h), the normalized
+    values are re-expressed relative to the full (w, h) frame.
+    """
+    flat = []
+    add = flat.append
+    for lm in landmarks:
+        add(lm.x)
+        add(lm.y)
+        add(lm.z)
+    norm = np.array(flat, dtype=np.float32).reshape(-1, 3)
+    if crop_w is not None and (x0 or y0 or crop_w != w or crop_h != h):
+        norm[:, 0] = (norm[:, 0] * crop_w + x0) / w
+        norm[:, 1] = (norm[:, 1] * crop_h + y0) / h
+    return Hand(norm, w, h, handedness, score)
+
+
+def landmark_array(hand_or_landmarks) -> np.ndarray:
+    """Pixel landmarks as an (21, 2) float array from a Hand, an old-style dict or a list of tuples."""
+    if isinstance(hand_or_landmarks, Hand):
+        return hand_or_landmarks.px
+    if isinstance(hand_or_landmarks, np.ndarray):
+        return hand_or_landmarks
+    if isinstance(hand_or_landmarks, dict):
+        hand_or_landmarks = hand_or_landmarks["landmarks"]
+    return np.asarray(hand_or_landmarks, dtype=np.float32)
+
+
+def pair_distances(px: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Euclidean (x, y) distance between landmarks a[i] and b[i], all pairs at once."""
+    d = px[a, :2] - px[b, :2]
+    return np.sqrt((d * d).sum(axis=1))
+
+
+def palm_width(px: np.ndarray) -> float:
+    """Index MCP -> pinky MCP distance; scale reference for pinch ratios."""
+    dx = px[INDEX_MCP, 0] - px[PINKY_MCP, 0]
+    dy = px[INDEX_MCP, 1] - px[PINKY_MCP, 1]
+    return max(float(np.hypot(dx, dy)), 1.0)
+
+
+def finger_extension(px: np.ndarray) -> np.ndarray:
+    """
+    (4,) for index, middle, ring, pinky: PIP y minus tip y.
+    In image coordinates smaller y = "higher", so > 0 means extended upward
+    and < 0 means folded.
+    """
+    # PIPs are 6, 10, 14, 18 and tips 8, 12, 16, 20: strided views, no fancy-index copies
+    return px[INDEX_PIP:PINKY_PIP + 1:4, 1] - px[INDEX_TIP:PINKY_TIP + 1:4, 1]
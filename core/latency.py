@@ -0,0 +1,99 @@
+# core/latency.py
+import csv
+import json
+import os
+import time
+
+# Stage names used by main.py / HandTracker / HandController
+READ = "read"              # camera read (+ flush in sync mode)
+FLIP = "flip"              # cv2.flip
+CONVERT = "convert"        # cvtColor (+ crop/resize in ROI mode)
+DETECT = "detect"          # detect_for_video / detect_async
+LANDMARKS = "landmarks"    # MediaPipe result -> Hand
+CURSOR = "cursor"          # pose gate, prediction, mapping, smoothing
+GESTURES = "gestures"      # GestureRecognizer.update
+OUTPUT = "output"          # pynput calls
+LOOP = "loop"              # whole iteration
+MOTION_TO_CURSOR = "motion_to_cursor"   # frame capture -> MouseController.move_to
+
+perf = time.perf_counter
+
+
+class LatencyStats:
+    """
+    Fixed-size ring buffer of durations per stage, cheap enough to leave on.
+
+    Usage on the hot path:
+        t0 = perf(); ...; stats.add(DETECT, perf() - t0)
+
+    Percentiles are computed on demand from the last `size` samples.
+    """
+
+    def __init__(self, size: int = 2048):
+        self.size = max(16, int(size))
+        self._buf = {}     # stage -> list[float] (seconds)
+        self._count = {}   # stage -> total samples ever added
+
+    def add(self, stage: str, seconds: float):
+        buf = self._buf.get(stage)
+        if buf is None:
+            buf = self._buf[stage] = [0.0] * self.size
+            self._count[stage] = 0
+        n = self._count[stage]
+        buf[n % self.size] = seconds
+        self._count[stage] = n + 1
+
+    def samples(self, stage: str) -> list:
+        n = self._count.get(stage, 0)
+        if n == 0:
+            return []
+        buf = self._buf[stage]
+        return buf[:n] if n < self.size else list(buf)
+
+    def summary(self) -> dict:
+        """{stage: {count, mean_ms, p50_ms, p95_ms, p99_ms, max_ms}} over the current window."""
+        out = {}
+        for stage in list(self._buf):   # may run on the viewer thread while stages are added
+            vals = sorted(self.samples(stage))
+            k = len(vals)
+
+            def pct(p):
+                return vals[min(k - 1, int(p * (k - 1) + 0.5))] * 1000.0
+
+            out[stage] = {
+                "count": self._count[stage],
+                "mean_ms": sum(vals) / k * 1000.0,
+                "p50_ms": pct(0.50),
+                "p95_ms": pct(0.95),
+                "p99_ms": pct(0.99),
+                "max_ms": vals[-1] * 1000.0,
+            }
+        return out
+
+    def overlay_text(self, stages=(READ, DETECT, GESTURES, OUTPUT, MOTION_TO_CURSOR)) -> str:
+        """One short line for the debug overlay: p50/p95 in ms."""
+        s = self.summary()
+        parts = []
+        for stage in stages:
+            if stage in s:
+                parts.append(f"{stage} {s[stage]['p50_ms']:.1f}/{s[stage]['p95_ms']:.1f}")
+        return "  ".join(parts)
+
+    def dump(self, path: str):
+        """Write the summary as .json, or .csv for anything else."""
+        summary = self.summary()
+        d = os.path.dirname(path)
+        if d:
+            os.makedirs(d, exist_ok=True)
+
+        if path.lower().endswith(".json"):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=2)
+            return
+
+        cols = ["count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(["stage"] + cols)
+            for stage, row in summary.items():
+                w.writerow([stage] + [row[c] if c == "count" else f"{row[c]:.4f}" for c in cols])
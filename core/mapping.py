@@ -1,7 +1,7 @@
 # core/mapping.py
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class ActiveRegion:
     x0: int
     y0: int
@@ -1,4 +1,12 @@
 # core/pose.py
+import math
+
+import numpy as np
+
+from core.landmarks import (
+    WRIST, INDEX_PIP, INDEX_TIP, MIDDLE_MCP, MIDDLE_PIP, MIDDLE_TIP, RING_PIP, RING_TIP, PINKY_PIP, PINKY_TIP,
+    Hand, finger_extension,
+)
 
 def is_index_pointing(landmarks) -> bool:
     """
@@ -7,31 +15,54 @@ def is_index_pointing(landmarks) -> bool:
     - Middle, ring, pinky mostly folded
 
     Uses y comparisons (works well for typical webcam usage).
-    If you point sideways a lot, we can upgrade this to angle-based.
-    """
+    If you point sideways a lot, use a trained pose classifier (gestures/poses.py).
 
-    # Landmark indices (MediaPipe Hands)
-    # index: tip=8, pip=6
-    # middle: tip=12, pip=10
-    # ring: tip=16, pip=14
-    # pinky: tip=20, pip=18
+    Accepts a Hand, a (21, 2+) array or the old list of (x, y) tuples.
+    """
+    # Per frame (a Hand): scalar compares on Hand.rows beat any array call here
+    if type(landmarks) is Hand:
+        pts = landmarks.rows
+    elif isinstance(landmarks, np.ndarray):
+        # index, middle, ring, pinky: > 0 extended, < 0 folded
+        i_ext, m_ext, r_ext, p_ext = finger_extension(landmarks).tolist()
+        return i_ext > 0 and m_ext < 0 and r_ext < 0 and p_ext < 0
+    elif isinstance(landmarks, Hand):
+        pts = landmarks.rows
+    else:
+        pts = landmarks["landmarks"] if isinstance(landmarks, dict) else landmarks
 
-    i_tip_y = landmarks[8][1]
-    i_pip_y = landmarks[6][1]
+    # Index extended (tip above its PIP), middle, ring and pinky folded
+    return (pts[INDEX_TIP][1] < pts[INDEX_PIP][1] and pts[MIDDLE_TIP][1] > pts[MIDDLE_PIP][1]
+            and pts[RING_TIP][1] > pts[RING_PIP][1] and pts[PINKY_TIP][1] > pts[PINKY_PIP][1])
 
-    m_tip_y = landmarks[12][1]
-    m_pip_y = landmarks[10][1]
 
-    r_tip_y = landmarks[16][1]
-    r_pip_y = landmarks[14][1]
+POSE_FEATURES = 40   # (x, y) of landmarks 1..20
 
-    p_tip_y = landmarks[20][1]
-    p_pip_y = landmarks[18][1]
+def pose_features(px: np.ndarray, left: bool = False) -> np.ndarray:
+    """
+    Rotation- and scale-normalized landmark features, (21, 2+) -> (40,).
+    Points are taken relative to the wrist, rotated so wrist -> middle MCP points
+    up and divided by that length; `left` hands are mirrored onto right ones.
+    """
+    p = px[1:, :2] - px[WRIST, :2]
+    vx, vy = float(p[MIDDLE_MCP - 1, 0]), float(p[MIDDLE_MCP - 1, 1])
+    n = max(math.hypot(vx, vy), 1e-6)
+    ux, uy = vx / n, vy / n
+    sx = -1.0 if left else 1.0
+    # Columns give (x', y'); the wrist -> middle MCP direction u maps to (0, -1)
+    rot = np.array([[-uy * sx, -ux], [ux * sx, -uy]], dtype=np.float32) / n
+    return (p @ rot).ravel()
 
-    # In image coordinates: smaller y = "higher" (finger extended upward)
-    index_extended = i_tip_y < i_pip_y
-    middle_folded  = m_tip_y > m_pip_y
-    ring_folded    = r_tip_y > r_pip_y
-    pinky_folded   = p_tip_y > p_pip_y
 
-    return index_extended and middle_folded and ring_folded and pinky_folded
+def pose_features_batch(px: np.ndarray, left) -> np.ndarray:
+    """pose_features for (N, 21, 2+) landmarks and (N,) `left` flags -> (N, 40)."""
+    p = px[:, 1:, :2] - px[:, WRIST:WRIST + 1, :2]
+    v = p[:, MIDDLE_MCP - 1].astype(np.float64)
+    n = np.maximum(np.hypot(v[:, 0], v[:, 1]), 1e-6)
+    ux, uy = v[:, 0] / n, v[:, 1] / n
+    sx = np.where(np.asarray(left, dtype=bool), -1.0, 1.0)
+    rot = np.empty((len(p), 2, 2))
+    rot[:, 0, 0], rot[:, 0, 1] = -uy * sx, -ux
+    rot[:, 1, 0], rot[:, 1, 1] = ux * sx, -uy
+    rot /= n[:, None, None]
+    return (p @ rot.astype(np.float32)).reshape(len(p), -1)
@@ -0,0 +1,119 @@
+# core/prediction.py
+from dataclasses import dataclass
+
+@dataclass
+class _Axis:
+    # Constant-velocity Kalman state for one axis (position px, velocity px/ms)
+    p: float = 0.0
+    v: float = 0.0
+    pp: float = 0.0   # covariance [[pp, pv], [pv, vv]]
+    pv: float = 0.0
+    vv: float = 0.0
+
+class TipPredictor:
+    """
+    Constant-velocity Kalman filter over the index-tip track (camera pixels).
+
+    update() takes each new detection with the timestamp of the frame it came from;
+    predict() extrapolates to "now + pipeline latency" so the cursor lands where the
+    hand is rather than where it was when the (possibly skipped / in-flight) frame
+    was captured. Extrapolation is capped in time and distance, and reset() is called
+    when the hand is lost.
+    """
+
+    def __init__(
+        self,
+        process_noise: float = 0.0002,
+        measurement_noise: float = 4.0,
+        max_horizon_ms: float = 120.0,
+        max_overshoot_px: float = 40.0,
+        rest_speed: float = 0.25,
+        latency_alpha: float = 0.1,
+    ):
+        self.q = process_noise            # white-acceleration density (px^2/ms^3)
+        self.r = measurement_noise        # measurement variance (px^2)
+        self.max_horizon_ms = max_horizon_ms
+        self.max_overshoot_px = max_overshoot_px
+        self.rest_speed = rest_speed      # px/ms; slower than this fades extrapolation out
+        self.latency_alpha = latency_alpha
+
+        self.latency_ms = 0.0             # EMA of measured capture -> output latency
+        self._x = _Axis()
+        self._y = _Axis()
+        self._t_ms = None
+
+    def reset(self):
+        self._x = _Axis()
+        self._y = _Axis()
+        self._t_ms = None
+
+    def note_latency(self, latency_ms: float):
+        """Feed the measured capture -> cursor latency; sets the extra prediction horizon."""
+        if self.latency_ms == 0.0:
+            self.latency_ms = float(latency_ms)
+        else:
+            self.latency_ms += self.latency_alpha * (latency_ms - self.latency_ms)
+
+    def _propagate(self, a: _Axis, dt: float):
+        a.p += a.v * dt
+        q = self.q
+        pp = a.pp + dt * (2.0 * a.pv + dt * a.vv) + q * dt * dt * dt / 3.0
+        pv = a.pv + dt * a.vv + q * dt * dt / 2.0
+        vv = a.vv + q * dt
+        a.pp, a.pv, a.vv = pp, pv, vv
+
+    def _correct(self, a: _Axis, z: float):
+        s = a.pp + self.r
+        kp = a.pp / s
+        kv = a.pv / s
+        resid = z - a.p
+        a.p += kp * resid
+        a.v += kv * resid
+        pp = (1.0 - kp) * a.pp
+        pv = (1.0 - kp) * a.pv
+        vv = a.vv - kv * a.pv
+        a.pp, a.pv, a.vv = pp, pv, vv
+
+    def update(self, x: float, y: float, t_ms: float):
+        if self._t_ms is None:
+            self._x = _Axis(p=float(x), pp=self.r, vv=1.0)
+            self._y = _Axis(p=float(y), pp=self.r, vv=1.0)
+            self._t_ms = t_ms
+            return
+
+        dt = t_ms - self._t_ms
+        if dt > 0:
+            self._propagate(self._x, dt)
+            self._propagate(self._y, dt)
+            self._t_ms = t_ms
+        self._correct(self._x, float(x))
+        self._correct(self._y, float(y))
+
+    def predict(self, t_ms: float):
+        """Position expected at frame time t_ms plus the measured pipeline latency."""
+        if self._t_ms is None:
+            return None
+
+        horizon = (t_ms - self._t_ms) + self.latency_ms
+        horizon = max(0.0, min(self.max_horizon_ms, horizon))
+
+        vx, vy = self._x.v, self._y.v
+
+        # Soft gate: a still hand only has noise in its velocity estimate, so
+        # extrapolating it would add jitter. Fades in smoothly above rest_speed.
+        v2 = vx * vx + vy * vy
+        r2 = self.rest_speed * self.rest_speed
+        gate = v2 / (v2 + r2) if v2 > 0.0 else 0.0
+
+        dx = vx * horizon * gate
+        dy = vy * horizon * gate
+
+        # Overshoot cap: never lead the filtered position by more than max_overshoot_px
+        d2 = dx * dx + dy * dy
+        cap = self.max_overshoot_px
+        if d2 > cap * cap:
+            s = cap / (d2 ** 0.5)
+            dx *= s
+            dy *= s
+
+        return self._x.p + dx, self._y.p + dy
@@ -0,0 +1,86 @@
+# core/scheduler.py
+from collections import deque
+
+import numpy as np
+
+from core.landmarks import landmark_array, palm_width
+
+
+class InferenceScheduler:
+    """
+    Decides per frame whether to run the hand landmarker, instead of a fixed
+    every-N-frames cadence.
+
+    - Full rate (min_interval_ms) while the hand moves fast or a pinch / drag /
+      scroll is active or about to start (gestures.active / gestures.armed).
+    - Backs off towards max_interval_ms while the hand is steady or absent.
+    Speed is the fastest landmark's speed in palm widths per second, so it does
+    not depend on camera resolution or distance to the camera.
+    """
+
+    def __init__(
+        self,
+        min_interval_ms: float = 0.0,
+        max_interval_ms: float = 150.0,
+        fast_speed: float = 1.5,
+        slow_speed: float = 0.3,
+    ):
+        self.min_interval_ms = float(min_interval_ms)
+        self.max_interval_ms = max(float(max_interval_ms), self.min_interval_ms)
+        self.fast_speed = fast_speed
+        self.slow_speed = min(slow_speed, fast_speed)
+
+        self.speed = 0.0                 # palm widths / s, from the last two detections
+        self.busy = False                # gesture active or armed at the last detection
+        self._prev_px = None
+        self._prev_ts = None
+        self._last_run_ms = None
+        self._runs = deque(maxlen=64)    # recent run timestamps for effective_hz
+
+        self.frames_seen = 0
+        self.runs = 0
+
+    def interval_ms(self) -> float:
+        if self.busy or self.speed >= self.fast_speed:
+            return self.min_interval_ms
+        if self.speed <= self.slow_speed:
+            return self.max_interval_ms
+        # Linear between slow and fast
+        f = (self.speed - self.slow_speed) / (self.fast_speed - self.slow_speed)
+        return self.max_interval_ms + f * (self.min_interval_ms - self.max_interval_ms)
+
+    def should_run(self, now_ms: float) -> bool:
+        self.frames_seen += 1
+        if self._last_run_ms is None:
+            return True
+        return (now_ms - self._last_run_ms) >= self.interval_ms()
+
+    def mark_run(self, now_ms: float):
+        self._last_run_ms = now_ms
+        self._runs.append(now_ms)
+        self.runs += 1
+
+    def observe(self, hand, det_ts_ms: float, gestures=None):
+        """Feed each fresh detection (hand or None) and the recognizer state after it."""
+        self.busy = bool(gestures is not None and (gestures.active or gestures.armed))
+
+        if hand is None:
+            self.speed = 0.0
+            self._prev_px = None
+            self._prev_ts = None
+            return
+
+        px = landmark_array(hand)
+        if self._prev_px is not None and det_ts_ms > self._prev_ts:
+            d = px[:, :2] - self._prev_px[:, :2]
+            max_step = float(np.sqrt((d * d).sum(axis=1)).max())
+            self.speed = max_step / palm_width(px) / ((det_ts_ms - self._prev_ts) / 1000.0)
+        self._prev_px = px
+        self._prev_ts = det_ts_ms
+
+    @property
+    def effective_hz(self) -> float:
+        if len(self._runs) < 2:
+            return 0.0
+        span = self._runs[-1] - self._runs[0]
+        return (len(self._runs) - 1) * 1000.0 / span if span > 0 else 0.0
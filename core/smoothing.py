@@ -1,14 +1,25 @@
 # core/smoothing.py
+import math
+import time
 from dataclasses import dataclass
 
+from core.prediction import TipPredictor
+
 def _clamp(v, lo, hi):
     return max(lo, min(hi, v))
 
-@dataclass
+def _now(t):
+    return time.monotonic() if t is None else t
+
+@dataclass(slots=True)
 class SmoothState:
     x: float | None = None
     y: float | None = None
 
+# All smoothers share one interface:
+#   update(target_x, target_y, t=None) -> (int, int)   t in seconds (time.monotonic())
+#   reset()
+
 class CursorSmoother:
     def __init__(self, alpha: float, deadzone_px: int, max_step_px: int):
         self.alpha = alpha
@@ -16,7 +27,10 @@ class CursorSmoother:
         self.max_step = max_step_px
         self.state = SmoothState()
 
-    def update(self, target_x: int, target_y: int):
+    def reset(self):
+        self.state = SmoothState()
+
+    def update(self, target_x: int, target_y: int, t: float | None = None):
         if self.state.x is None or self.state.y is None:
             self.state.x, self.state.y = float(target_x), float(target_y)
             return int(self.state.x), int(self.state.y)
@@ -39,3 +53,110 @@ class CursorSmoother:
         self.state.y = (1 - self.alpha) * self.state.y + self.alpha * (self.state.y + dy)
 
         return int(self.state.x), int(self.state.y)
+
+
+class OneEuroSmoother:
+    """
+    One Euro filter (Casiez et al.): low-pass whose cutoff rises with speed,
+    so the cursor is steady at rest and responsive during fast moves.
+    """
+
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 0.01, d_cutoff: float = 1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        self._t = None
+        self._x = self._y = 0.0
+        self._dx = self._dy = 0.0
+
+    @staticmethod
+    def _alpha(cutoff: float, dt: float) -> float:
+        tau = 1.0 / (2.0 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def update(self, target_x: int, target_y: int, t: float | None = None):
+        t = _now(t)
+        if self._t is None:
+            self._t = t
+            self._x, self._y = float(target_x), float(target_y)
+            return int(self._x), int(self._y)
+
+        dt = t - self._t
+        if dt <= 0:
+            dt = 1e-3
+        self._t = t
+
+        # Filtered speed
+        ad = self._alpha(self.d_cutoff, dt)
+        self._dx += ad * ((target_x - self._x) / dt - self._dx)
+        self._dy += ad * ((target_y - self._y) / dt - self._dy)
+        speed = math.hypot(self._dx, self._dy)
+
+        # Speed-adaptive cutoff
+        a = self._alpha(self.min_cutoff + self.beta * speed, dt)
+        self._x += a * (target_x - self._x)
+        self._y += a * (target_y - self._y)
+        return int(self._x), int(self._y)
+
+
+class DoubleExpSmoother:
+    """Holt double-exponential smoothing: level + trend, so steady motion has less lag than a plain EMA."""
+
+    def __init__(self, alpha: float = 0.35, beta: float = 0.1):
+        self.alpha = alpha
+        self.beta = beta
+        self.reset()
+
+    def reset(self):
+        self._lx = self._ly = None
+        self._tx = self._ty = 0.0
+
+    def update(self, target_x: int, target_y: int, t: float | None = None):
+        if self._lx is None:
+            self._lx, self._ly = float(target_x), float(target_y)
+            return int(self._lx), int(self._ly)
+
+        a, b = self.alpha, self.beta
+        lx = a * target_x + (1 - a) * (self._lx + self._tx)
+        ly = a * target_y + (1 - a) * (self._ly + self._ty)
+        self._tx = b * (lx - self._lx) + (1 - b) * self._tx
+        self._ty = b * (ly - self._ly) + (1 - b) * self._ty
+        self._lx, self._ly = lx, ly
+        return int(lx), int(ly)
+
+
+class KalmanSmoother:
+    """2D constant-velocity Kalman filter; returns the filtered (not extrapolated) position."""
+
+    def __init__(self, process_noise: float = 0.0001, measurement_noise: float = 16.0):
+        self._kf = TipPredictor(process_noise=process_noise, measurement_noise=measurement_noise,
+                                max_horizon_ms=0.0)
+
+    def reset(self):
+        self._kf.reset()
+
+    def update(self, target_x: int, target_y: int, t: float | None = None):
+        t_ms = _now(t) * 1000.0
+        self._kf.update(target_x, target_y, t_ms)
+        x, y = self._kf.predict(t_ms)
+        return int(x), int(y)
+
+
+SMOOTHERS = ("ema", "one_euro", "double_exp", "kalman")
+
+def make_smoother(name: str, params: dict):
+    """
+    Build a smoother from the `smoothing` section of the config.
+    Unknown names fall back to the EMA CursorSmoother.
+    """
+    name = (name or "ema").lower()
+    if name == "one_euro":
+        return OneEuroSmoother(params["one_euro_min_cutoff"], params["one_euro_beta"], params["one_euro_d_cutoff"])
+    if name == "double_exp":
+        return DoubleExpSmoother(params["double_exp_alpha"], params["double_exp_beta"])
+    if name == "kalman":
+        return KalmanSmoother(params["kalman_process_noise"], params["kalman_measurement_noise"])
+    return CursorSmoother(params["ema_alpha"], params["deadzone_px"], params["max_step_px"])
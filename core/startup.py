@@ -0,0 +1,79 @@
+# core/startup.py
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class StartupTimeline:
+    """
+    Named milestones in ms since `t0` (default: construction). mark() keeps the
+    first time a name is reached, so it is safe to call from the loop.
+    """
+
+    def __init__(self, t0: float | None = None):
+        self.t0 = time.perf_counter() if t0 is None else t0
+        self.marks = {}
+
+    def mark(self, name: str) -> float:
+        if name not in self.marks:
+            self.marks[name] = (time.perf_counter() - self.t0) * 1000.0
+        return self.marks[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.marks
+
+    def report(self) -> str:
+        lines = ["startup (ms since launch):"]
+        for name, ms in sorted(self.marks.items(), key=lambda kv: kv[1]):
+            lines.append(f"  {ms:8.1f}  {name}")
+        return "\n".join(lines)
+
+
+def open_camera_and_tracker(open_camera, create_tracker, warm_up: bool = True,
+                            warm_up_size=(640, 480), timeline: StartupTimeline | None = None,
+                            frame_size=None):
+    """
+    Open the camera on this thread while the tracker is created (model load and
+    the mediapipe import) and warmed up on a worker thread.
+
+    warm_up_size is the frame size expected from the camera. frame_size(camera),
+    if given, returns the size the opened camera actually delivers; when that
+    differs, the tracker is warmed up again at it.
+
+    Returns (camera, tracker). Errors from either side are raised here; if one
+    side fails the other is closed.
+    """
+    def load():
+        tracker = create_tracker()
+        if timeline is not None:
+            timeline.mark("model loaded")
+        if warm_up and hasattr(tracker, "warm_up"):
+            tracker.warm_up(*warm_up_size)
+            if timeline is not None:
+                timeline.mark("model warmed up")
+        return tracker
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="ModelLoad") as pool:
+        future = pool.submit(load)
+        try:
+            cam = open_camera()
+        except BaseException:
+            try:
+                future.result().close()
+            except Exception:
+                pass
+            raise
+        if timeline is not None:
+            timeline.mark("camera open")
+
+        try:
+            tracker = future.result()
+            if warm_up and frame_size is not None and hasattr(tracker, "warm_up"):
+                size = frame_size(cam)
+                if size is not None and tuple(size) != tuple(warm_up_size):
+                    tracker.warm_up(*size)
+                    if timeline is not None:
+                        timeline.mark("model warmed up at camera size")
+        except BaseException:
+            cam.release()
+            raise
+    return cam, tracker
@@ -0,0 +1,92 @@
+# gestures/poses.py
+"""
+Static hand pose classifier: softmax regression over core.pose.pose_features,
+trained by gestures/train_pose.py and saved as a small .npz file.
+"""
+import numpy as np
+
+from core.landmarks import Hand, landmark_array
+from core.pose import pose_features, POSE_FEATURES
+
+MODEL_VERSION = 1
+
+
+class PoseClassifier:
+    """
+    labels[k] is class k. Feature standardization is folded into the weights,
+    so classifying a hand is one (40,) x (40, K) product.
+    """
+
+    def __init__(self, labels, weights, bias, mean, std, min_confidence: float = 0.6):
+        self.labels = [str(x) for x in labels]
+        self.weights = np.asarray(weights, dtype=np.float32)   # (F, K) on standardized features
+        self.bias = np.asarray(bias, dtype=np.float32)
+        self.mean = np.asarray(mean, dtype=np.float32)
+        self.std = np.asarray(std, dtype=np.float32)
+        self.min_confidence = min_confidence
+
+        self._w = self.weights / self.std[:, None]
+        self._b = self.bias - (self.mean / self.std) @ self.weights
+
+    def logits(self, features: np.ndarray) -> np.ndarray:
+        return features @ self._w + self._b
+
+    def classify(self, hand, left: bool | None = None) -> tuple[int, float]:
+        """(class index, probability) for a Hand or (21, 2+) landmarks; `left` defaults to the Hand's handedness."""
+        if left is None:
+            left = isinstance(hand, Hand) and hand.handedness == "Left"
+        z = self.logits(pose_features(landmark_array(hand), left))
+        k = int(z.argmax())
+        e = np.exp(z - z[k])
+        return k, float(1.0 / e.sum())
+
+    def predict(self, hand) -> str | None:
+        """Pose label, or None when the model is not confident."""
+        k, p = self.classify(hand)
+        return self.labels[k] if p >= self.min_confidence else None
+
+    def predict_batch(self, features: np.ndarray) -> np.ndarray:
+        """Class indices for (N, F) features."""
+        return self.logits(features).argmax(axis=1)
+
+    def save(self, path: str):
+        np.savez_compressed(path, version=MODEL_VERSION, labels=np.array(self.labels),
+                            weights=self.weights, bias=self.bias, mean=self.mean, std=self.std)
+
+    @classmethod
+    def load(cls, path: str, min_confidence: float = 0.6) -> "PoseClassifier":
+        with np.load(path) as f:
+            if int(f["version"]) != MODEL_VERSION:
+                raise ValueError(f"Unsupported pose model version: {int(f['version'])}")
+            return cls(f["labels"].tolist(), f["weights"], f["bias"], f["mean"], f["std"], min_confidence)
+
+
+def train(features: np.ndarray, y: np.ndarray, labels, l2: float = 1e-3,
+          iters: int = 500, lr: float = 0.5) -> PoseClassifier:
+    """
+    Full-batch gradient descent on class-balanced softmax cross-entropy.
+    features (N, F), y (N,) class indices into `labels`.
+    """
+    if features.shape[1] != POSE_FEATURES:
+        raise ValueError(f"Expected {POSE_FEATURES} features, got {features.shape[1]}")
+    k = len(labels)
+    mean = features.mean(axis=0)
+    std = features.std(axis=0) + 1e-3
+    x = ((features - mean) / std).astype(np.float64)
+    onehot = np.eye(k)[y]
+
+    # Every class weighs the same however many frames it has
+    counts = np.bincount(y, minlength=k).astype(np.float64)
+    sample_w = (1.0 / np.maximum(counts, 1.0))[y] / k
+
+    w = np.zeros((x.shape[1], k))
+    b = np.zeros(k)
+    for _ in range(iters):
+        z = x @ w + b
+        z -= z.max(axis=1, keepdims=True)
+        p = np.exp(z)
+        p /= p.sum(axis=1, keepdims=True)
+        g = (p - onehot) * sample_w[:, None]
+        w -= lr * (x.T @ g + l2 * w)
+        b -= lr * g.sum(axis=0)
+    return PoseClassifier(labels, w, b, mean, std)
@@ -1,10 +1,22 @@
 # gestures/recognizer.py
 import math
 
-def dist(a, b):
-    return math.hypot(a[0] - b[0], a[1] - b[1])
+import numpy as np
+
+from core.landmarks import INDEX_MCP, PINKY_MCP, landmark_array, pair_distances
+from gestures.table import GestureSpec, default_specs
+
 
 class GestureRecognizer:
+    """
+    Table-driven pinch gestures (see gestures/table.py). All pinch ratios and
+    hysteresis tests are done for the whole table in one NumPy pass; per-gesture
+    Python code only runs for gestures that are held or being released, so the
+    cost per frame barely grows with the number of configured gestures.
+
+    Without `specs` the built-in table is made from the keyword arguments.
+    """
+
     def __init__(
         self,
         pinch_start_ratio=0.30,
@@ -19,182 +31,179 @@ class GestureRecognizer:
         scroll_end_ratio=0.42,
         scroll_px_per_step=22,
         scroll_max_step=6,
+
+        # a pinch ratio below this counts as "about to pinch" (see `armed`)
+        arm_ratio=0.55,
+
+        specs: list[GestureSpec] | None = None,
     ):
-        # click/drag
-        self.start_ratio = pinch_start_ratio
-        self.end_ratio = pinch_end_ratio
-        self.pinch_click_ms = pinch_click_ms
-        self.pinch_drag_ms = pinch_drag_ms
+        if specs is None:
+            specs = default_specs(pinch_start_ratio, pinch_end_ratio, pinch_click_ms, pinch_drag_ms,
+                                  click_max_move_px, scroll_start_ratio, scroll_end_ratio,
+                                  scroll_px_per_step, scroll_max_step)
+        self.specs = list(specs)
         self.click_debounce_ms = click_debounce_ms
-        self.click_max_move_px = click_max_move_px
-
-        # scroll
-        self.s_start = scroll_start_ratio
-        self.s_end = scroll_end_ratio
-        self.scroll_px_per_step = max(6, int(scroll_px_per_step))
-        self.scroll_max_step = int(scroll_max_step)
+        self.arm_ratio = arm_ratio
+        n = len(self.specs)
+
+        # Gesture pairs plus the palm width (index MCP -> pinky MCP) as the last pair
+        self._a = np.array([s.a for s in self.specs] + [INDEX_MCP])
+        self._b = np.array([s.b for s in self.specs] + [PINKY_MCP])
+        self._start = np.array([s.start_ratio for s in self.specs], dtype=np.float32)
+        self._end = np.array([s.end_ratio for s in self.specs], dtype=np.float32)
+
+        # Evaluation order: priority, then table order; held gestures freeze what they suppress
+        index = {s.name: i for i, s in enumerate(self.specs)}
+        order = sorted(range(n), key=lambda i: -self.specs[i].priority)
+        self._rank = {i: k for k, i in enumerate(order)}
+        self._suppresses = [frozenset(index[name] for name in s.suppresses) for s in self.specs]
+
+        self._template = {"left_click": False, "right_click": False, "drag_start": False,
+                          "drag_end": False, "scroll": 0}   # scroll: dy steps (pynput: +up, -down)
+        for s in self.specs:
+            self._template.setdefault(s.action, False)
+
+        # Pinch ratios from the last update, table order; updated in place
+        self.ratios = np.ones(n, dtype=np.float32)
+
+        # Work buffers for update(), so the per-frame pass allocates no arrays.
+        # Everything is float32 like Hand.px: mixed dtypes would make NumPy
+        # allocate casting buffers, and so would reductions, Python scalars as
+        # operands and np.take's default mode.
+        self._pa = np.empty((n + 1, 2), dtype=np.float32)
+        self._pb = np.empty((n + 1, 2), dtype=np.float32)
+        self._dx, self._dy = self._pa[:, 0], self._pa[:, 1]
+        self._d = np.empty(n + 1, dtype=np.float32)
+        self._d_pairs = self._d[:-1]
+        self._d_palm = self._d[-1:].reshape(())
+        self._palm = np.empty((), dtype=np.float32)
+        self._one = np.ones((), dtype=np.float32)
+        self._pinch = np.zeros(n, dtype=bool)
+        self._any = np.zeros(n, dtype=bool)
+        self._out = dict(self._template)
 
         self._last_click_ms = 0
 
-        # Middle pinch state (left click + drag)
-        self._mid_pinched = False
-        self._mid_start_ms = None
-        self._mid_start_cursor = None
-        self._mid_moved = False
-        self._dragging = False
-
-        # Ring pinch state (right click)
-        self._ring_pinched = False
-        self._ring_start_ms = None
-        self._ring_start_cursor = None
-        self._ring_moved = False
-
-        # Pinky pinch state (scroll mode)
-        self._scrolling = False
-        self._scroll_last_y = None
-        self._scroll_accum = 0.0
-
-    def _pinch_state(self, ratio: float, currently_pinched: bool, start_ratio: float, end_ratio: float) -> bool:
-        # hysteresis: start below start_ratio; remain until above end_ratio
-        if currently_pinched:
-            return ratio < end_ratio
-        return ratio < start_ratio
+        # Pinch state for the vectorized pass; hysteresis threshold per gesture
+        self._pinched = np.zeros(n, dtype=bool)
+        self._thresh = self._start.copy()
+        self._held = 0
+
+        # Per-gesture click/drag/scroll state, only touched while a gesture is active
+        self._start_ms = [0] * n
+        self._start_xy = [(0, 0)] * n
+        self._moved = [False] * n
+        self._dragging = [False] * n
+        self._last_y = [0.0] * n
+        self._accum = [0.0] * n
+
+    @property
+    def active(self) -> bool:
+        """A pinch, drag or scroll is in progress."""
+        return self._held > 0
+
+    @property
+    def armed(self) -> bool:
+        """Thumb is close to a pinch target, so a gesture may start any moment."""
+        return bool(self.ratios.min() < self.arm_ratio)
+
+    def _distances(self, px: np.ndarray):
+        """pair_distances() into self._d, without temporaries for float32 (21, 2) landmarks."""
+        if px.dtype != np.float32 or px.shape[1] != 2:
+            self._d[:] = pair_distances(px, self._a, self._b)
+            return
+        # GestureSpec range-checks its indices. "clip" is only
+        # defensive: with out=, the default "raise" mode buffers a copy first
+        px.take(self._a, axis=0, out=self._pa, mode="clip")
+        px.take(self._b, axis=0, out=self._pb, mode="clip")
+        np.subtract(self._pa, self._pb, out=self._pa)
+        np.hypot(self._dx, self._dy, out=self._d)
 
     def update(self, hand, now_ms: int, cursor_xy: tuple[int, int]):
-        pts = hand["landmarks"]
-
-        thumb = pts[4]
-        middle_tip = pts[12]  # left click + drag
-        ring_tip = pts[16]    # right click
-        pinky_tip = pts[20]   # scroll mode
-
-        # Palm width proxy (scale-invariant)
-        index_mcp = pts[5]
-        pinky_mcp = pts[17]
-        palm_w = max(dist(index_mcp, pinky_mcp), 1.0)
-
-        mid_ratio = dist(thumb, middle_tip) / palm_w
-        ring_ratio = dist(thumb, ring_tip) / palm_w
-        pinky_ratio = dist(thumb, pinky_tip) / palm_w
-
-        mid_pinch = self._pinch_state(mid_ratio, self._mid_pinched, self.start_ratio, self.end_ratio)
-        ring_pinch = self._pinch_state(ring_ratio, self._ring_pinched, self.start_ratio, self.end_ratio)
-        scroll_pinch = self._pinch_state(pinky_ratio, self._scrolling, self.s_start, self.s_end)
-
-        cx, cy = cursor_xy
-
-        out = {
-            "left_click": False,
-            "right_click": False,
-            "drag_start": False,
-            "drag_end": False,
-            "scroll": 0,   # dy steps (pynput: +up, -down)
-        }
-
-        # -------------------------
-        # Scroll Mode (thumb + pinky pinch)
-        # -------------------------
-        if scroll_pinch and not self._scrolling:
-            self._scrolling = True
-            # Use middle_tip y as the scroll tracker (stable); could use index_tip too
-            self._scroll_last_y = middle_tip[1]
-            self._scroll_accum = 0.0
-
-        if self._scrolling and scroll_pinch:
-            y = middle_tip[1]
-            dy = y - (self._scroll_last_y if self._scroll_last_y is not None else y)
-            self._scroll_last_y = y
-
-            self._scroll_accum += dy
-
-            # Convert accumulated camera pixels -> wheel steps
-            steps = int(self._scroll_accum / self.scroll_px_per_step)
-
-            if steps != 0:
-                # finger moves DOWN (dy positive) => scroll DOWN => wheel dy negative
-                wheel = -steps
-
-                # cap to avoid bursts
-                if wheel > self.scroll_max_step:
-                    wheel = self.scroll_max_step
-                elif wheel < -self.scroll_max_step:
-                    wheel = -self.scroll_max_step
+        """
+        Gesture events for this frame. The returned dict is reused (reset on the
+        next call): read it before calling update() again.
+        """
+        px = landmark_array(hand)
 
-                out["scroll"] = wheel
-                self._scroll_accum -= steps * self.scroll_px_per_step
+        # Every pair and the palm width (scale-invariant ratios) in one pass
+        self._distances(px)
+        palm_w = np.maximum(self._d_palm, self._one, out=self._palm)
+        r = np.divide(self._d_pairs, palm_w, out=self.ratios)
 
-        if self._scrolling and not scroll_pinch:
-            self._scrolling = False
-            self._scroll_last_y = None
-            self._scroll_accum = 0.0
+        # hysteresis: start below start_ratio; remain until above end_ratio
+        pinch = np.less(r, self._thresh, out=self._pinch)
 
-        # If scrolling, suppress click/drag recognition to avoid conflicts
-        if self._scrolling:
+        out = self._out
+        out.update(self._template)
+        if not (self._held or np.count_nonzero(pinch)):
             return out
 
-        # -------------------------
-        # Middle pinch => LEFT click + DRAG (click on release)
-        # -------------------------
-        if mid_pinch and not self._mid_pinched:
-            self._mid_pinched = True
-            self._mid_start_ms = now_ms
-            self._mid_start_cursor = (cx, cy)
-            self._mid_moved = False
-            self._dragging = False
-
-        if self._mid_pinched and mid_pinch:
-            held = now_ms - (self._mid_start_ms or now_ms)
-            sx, sy = self._mid_start_cursor or (cx, cy)
-
-            if math.hypot(cx - sx, cy - sy) > self.click_max_move_px:
-                self._mid_moved = True
-
-            if (not self._dragging) and held >= self.pinch_drag_ms:
-                self._dragging = True
-                out["drag_start"] = True
+        active = np.flatnonzero(np.logical_or(pinch, self._pinched, out=self._any)).tolist()
+        if len(active) > 1:
+            active.sort(key=self._rank.__getitem__)
+        frozen = ()
+        for i in active:
+            if i in frozen:
+                continue
+            if self._step(i, bool(pinch[i]), px, now_ms, cursor_xy, out) and self._suppresses[i]:
+                frozen = self._suppresses[i].union(frozen)
+        return out
 
-        if self._mid_pinched and not mid_pinch:
-            held = now_ms - (self._mid_start_ms or now_ms)
+    def _set_pinched(self, i, pinched):
+        self._pinched[i] = pinched
+        self._thresh[i] = self._end[i] if pinched else self._start[i]
+        self._held += 1 if pinched else -1
+
+    def _step(self, i, pinch, px, now_ms, cursor_xy, out) -> bool:
+        """Advance gesture i; returns whether it is held afterwards."""
+        spec = self.specs[i]
+
+        if pinch and not self._pinched[i]:
+            self._set_pinched(i, True)
+            self._start_ms[i] = now_ms
+            self._start_xy[i] = cursor_xy
+            self._moved[i] = False
+            self._dragging[i] = False
+            # Scroll tracks the y of its landmark from the start of the pinch
+            self._last_y[i] = float(px[spec.track, 1])
+            self._accum[i] = 0.0
+
+        if pinch and spec.is_scroll:
+            y = float(px[spec.track, 1])
+            self._accum[i] += y - self._last_y[i]
+            self._last_y[i] = y
+
+            # Accumulated camera pixels -> wheel steps
+            steps = int(self._accum[i] / spec.px_per_step)
+            if steps != 0:
+                # finger moves DOWN (dy positive) => scroll DOWN => wheel dy negative;
+                # capped to avoid bursts
+                out[spec.action] += max(-spec.max_step, min(spec.max_step, -steps))
+                self._accum[i] -= steps * spec.px_per_step
+
+        elif pinch:
+            cx, cy = cursor_xy
+            sx, sy = self._start_xy[i]
+            if math.hypot(cx - sx, cy - sy) > spec.max_move_px:
+                self._moved[i] = True
+
+            if spec.drag_ms is not None and not self._dragging[i] and now_ms - self._start_ms[i] >= spec.drag_ms:
+                self._dragging[i] = True
+                out["drag_start"] = True
 
-            if self._dragging:
+        else:
+            # Released; clicks fire here and share one debounce
+            self._set_pinched(i, False)
+            if spec.is_scroll:
+                self._accum[i] = 0.0
+            elif self._dragging[i]:
                 out["drag_end"] = True
-            else:
-                if held >= self.pinch_click_ms and (not self._mid_moved):
-                    if (now_ms - self._last_click_ms) >= self.click_debounce_ms:
-                        out["left_click"] = True
-                        self._last_click_ms = now_ms
-
-            self._mid_pinched = False
-            self._mid_start_ms = None
-            self._mid_start_cursor = None
-            self._mid_moved = False
-            self._dragging = False
-
-        # -------------------------
-        # Ring pinch => RIGHT click (click on release)
-        # -------------------------
-        if ring_pinch and not self._ring_pinched:
-            self._ring_pinched = True
-            self._ring_start_ms = now_ms
-            self._ring_start_cursor = (cx, cy)
-            self._ring_moved = False
-
-        if self._ring_pinched and ring_pinch:
-            sx, sy = self._ring_start_cursor or (cx, cy)
-            if math.hypot(cx - sx, cy - sy) > self.click_max_move_px:
-                self._ring_moved = True
-
-        if self._ring_pinched and not ring_pinch:
-            held = now_ms - (self._ring_start_ms or now_ms)
-
-            if held >= self.pinch_click_ms and (not self._ring_moved):
-                if (now_ms - self._last_click_ms) >= self.click_debounce_ms:
-                    out["right_click"] = True
-                    self._last_click_ms = now_ms
-
-            self._ring_pinched = False
-            self._ring_start_ms = None
-            self._ring_start_cursor = None
-            self._ring_moved = False
-
-        return out
+            elif (now_ms - self._start_ms[i] >= spec.click_ms and not self._moved[i]
+                  and now_ms - self._last_click_ms >= self.click_debounce_ms):
+                out[spec.action] = True
+                self._last_click_ms = now_ms
+            self._moved[i] = False
+            self._dragging[i] = False
+
+        return pinch
@@ -0,0 +1,114 @@
+# gestures/table.py
+"""
+Declarative gesture table. Each entry is a thumb (or any landmark) pinch with
+hysteresis; "action" says what it emits:
+
+- "left_click" or "right_click": fires on release if held at
+  least click_ms without moving the cursor more than max_move_px. With drag_ms
+  set, holding that long starts a drag instead (drag_start / drag_end).
+- "scroll": while held, vertical motion of `track` is turned into wheel steps.
+
+Higher `priority` entries are evaluated first; while one is held, the entries
+it `suppresses` are frozen (neither started nor released).
+"""
+from dataclasses import dataclass, field, fields
+
+from core import landmarks
+
+_LANDMARKS = {k.lower(): v for k, v in vars(landmarks).items() if k.isupper() and isinstance(v, int)}
+NUM_LANDMARKS = 21
+ACTIONS = ("left_click", "right_click", "scroll")     # what HandController.step dispatches
+
+
+@dataclass
+class GestureSpec:
+    name: str
+    a: int                        # landmark pair; the pinch ratio is |a - b| / palm width
+    b: int
+    action: str
+    start_ratio: float = 0.30     # pinch starts below this ratio ...
+    end_ratio: float = 0.40       # ... and ends above this one
+    click_ms: int = 120
+    drag_ms: int | None = None    # None = no drag
+    max_move_px: float = 35.0
+    track: int = landmarks.MIDDLE_TIP   # scroll: landmark whose y is followed
+    px_per_step: int = 22
+    max_step: int = 6
+    priority: int = 0
+    suppresses: list[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        if self.action not in ACTIONS:
+            raise ValueError(f"Gesture {self.name!r}: unknown action {self.action!r} (expected one of {list(ACTIONS)})")
+        # Names resolved and indices range-checked once, so the recognizer can index freely
+        try:
+            self.a, self.b, self.track = landmark_index(self.a), landmark_index(self.b), landmark_index(self.track)
+        except ValueError as e:
+            raise ValueError(f"Gesture {self.name!r}: {e}") from None
+
+    @property
+    def is_scroll(self) -> bool:
+        return self.action == "scroll"
+
+
+def landmark_index(value) -> int:
+    """Landmark given as an index (0..20) or a name such as "thumb_tip"."""
+    if isinstance(value, str):
+        try:
+            return _LANDMARKS[value.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown landmark: {value!r}") from None
+    i = int(value)
+    if not 0 <= i < NUM_LANDMARKS:
+        raise ValueError(f"Landmark index {value!r} out of range (0..{NUM_LANDMARKS - 1})")
+    return i
+
+
+def spec_from_dict(d: dict) -> GestureSpec:
+    known = {f.name for f in fields(GestureSpec)}
+    unknown = set(d) - known
+    if unknown:
+        raise ValueError(f"Unknown gesture field(s) in {d.get('name', '?')!r}: {sorted(unknown)}")
+    spec = GestureSpec(**d)
+    if spec.is_scroll:
+        spec.px_per_step = max(6, int(spec.px_per_step))
+    return spec
+
+
+def default_specs(
+    pinch_start_ratio=0.30,
+    pinch_end_ratio=0.40,
+    pinch_click_ms=120,
+    pinch_drag_ms=480,
+    click_max_move_px=35,
+    scroll_start_ratio=0.32,
+    scroll_end_ratio=0.42,
+    scroll_px_per_step=22,
+    scroll_max_step=6,
+) -> list[GestureSpec]:
+    """Thumb+middle = left click / drag, thumb+ring = right click, thumb+pinky = scroll."""
+    T = landmarks.THUMB_TIP
+    return [
+        GestureSpec("left", T, landmarks.MIDDLE_TIP, "left_click", pinch_start_ratio, pinch_end_ratio,
+                    click_ms=pinch_click_ms, drag_ms=pinch_drag_ms, max_move_px=click_max_move_px),
+        GestureSpec("right", T, landmarks.RING_TIP, "right_click", pinch_start_ratio, pinch_end_ratio,
+                    click_ms=pinch_click_ms, max_move_px=click_max_move_px),
+        GestureSpec("scroll", T, landmarks.PINKY_TIP, "scroll", scroll_start_ratio, scroll_end_ratio,
+                    px_per_step=max(6, int(scroll_px_per_step)), max_step=int(scroll_max_step),
+                    priority=1, suppresses=["left", "right"]),
+    ]
+
+
+def specs_from_table(table: list[dict] | None) -> list[GestureSpec] | None:
+    """GestureSpecs for a config table; None when it is empty (use the built-in table)."""
+    if not table:
+        return None
+    specs = [spec_from_dict(d) for d in table]
+    names = [s.name for s in specs]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate gesture names: {names}")
+    for s in specs:
+        missing = set(s.suppresses) - set(names)
+        if missing:
+            raise ValueError(f"Gesture {s.name!r} suppresses unknown gesture(s): {sorted(missing)}")
+    return specs
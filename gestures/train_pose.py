@@ -0,0 +1,144 @@
+# gestures/train_pose.py
+"""
+Train the static pose classifier from labeled session recordings.
+
+    python -m gestures.train_pose recordings/session-A=pointing recordings/session-B=fist ...
+        [--test recordings/session-C=pointing ...] [--out models/pose_model.npz]
+
+SESSION=LABEL labels every detected hand in a session. A bare SESSION reads
+labels.json from the session directory: {"label": "fist"} or
+{"segments": [[start_ms, end_ms, "fist"], ...]} (frames outside segments are
+skipped). Without --test, the last --holdout fraction of each session is held
+out. Prints the held-out confusion matrix and per-frame classification latency.
+"""
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+from core.pose import pose_features_batch
+from gestures.poses import PoseClassifier, train
+from recording.session import load_session
+
+
+def load_labeled(arg: str):
+    """(px (N, 21, 2), left (N,), labels (N,) str) for the first hand of each fresh frame."""
+    path, _, label = arg.partition("=")
+    session = load_session(path)
+    fr = session.frames
+    keep = (fr["fresh"] == 1) & (fr["n_hands"] > 0)
+
+    if label:
+        labels = np.full(len(fr), label, dtype=object)
+    else:
+        with open(os.path.join(path, "labels.json"), "r", encoding="utf-8") as f:
+            spec = json.load(f)
+        labels = np.full(len(fr), None, dtype=object)
+        if "label" in spec:
+            labels[:] = spec["label"]
+        t = np.asarray(fr["t_ms"])
+        for start_ms, end_ms, name in spec.get("segments", []):
+            labels[(t >= start_ms) & (t <= end_ms)] = name
+    keep &= np.array([x is not None for x in labels], dtype=bool)
+
+    norm = np.asarray(fr["landmarks"][keep, 0])
+    px = norm[:, :, :2] * np.array([session.frame_w, session.frame_h], dtype=np.float32)
+    left = np.asarray(fr["handedness"][keep, 0]) == 0
+    return px, left, labels[keep]
+
+
+def split_tail(n: int, fraction: float) -> np.ndarray:
+    """Mask of the last `fraction` of n frames (a time split; neighbouring frames are near-duplicates)."""
+    mask = np.zeros(n, dtype=bool)
+    mask[n - int(round(n * fraction)):] = True
+    return mask
+
+
+def confusion(y_true: np.ndarray, y_pred: np.ndarray, k: int) -> np.ndarray:
+    cm = np.zeros((k, k), dtype=np.int64)
+    np.add.at(cm, (y_true, y_pred), 1)
+    return cm
+
+
+def format_confusion(cm: np.ndarray, labels) -> str:
+    width = max(8, max(len(x) for x in labels) + 2)
+    lines = ["true \\ pred".ljust(width) + "".join(x.rjust(width) for x in labels) + "recall".rjust(width)]
+    for i, name in enumerate(labels):
+        recall = cm[i, i] / max(cm[i].sum(), 1)
+        lines.append(name.ljust(width) + "".join(str(v).rjust(width) for v in cm[i]) + f"{recall:>{width}.3f}")
+    return "\n".join(lines)
+
+
+def classify_latency_us(clf: PoseClassifier, px: np.ndarray, left: np.ndarray, limit: int = 2000):
+    """Median and p99 of classify() on single hands, as in the live loop."""
+    times = []
+    for p, l in zip(px[:limit], left[:limit].tolist()):
+        t0 = time.perf_counter()
+        clf.classify(p, l)
+        times.append(time.perf_counter() - t0)
+    times = np.array(times) * 1e6
+    return float(np.median(times)), float(np.percentile(times, 99))
+
+
+def run(train_args, test_args=(), out: str | None = None, holdout: float = 0.2,
+        l2: float = 1e-3, iters: int = 500, min_confidence: float = 0.6):
+    """Train, report held-out results and save. Returns (classifier, confusion matrix)."""
+    tr = [load_labeled(a) for a in train_args]
+    if test_args:
+        te = [load_labeled(a) for a in test_args]
+    else:
+        te = []
+        for i, (px, left, lab) in enumerate(tr):
+            m = split_tail(len(px), holdout)
+            te.append((px[m], left[m], lab[m]))
+            tr[i] = (px[~m], left[~m], lab[~m])
+
+    def stack(parts):
+        return (np.concatenate([p for p, _, _ in parts]), np.concatenate([l for _, l, _ in parts]),
+                np.concatenate([y for _, _, y in parts]))
+
+    px, left, lab = stack(tr)
+    labels = sorted(set(lab.tolist()))
+    index = {name: k for k, name in enumerate(labels)}
+    y = np.array([index[x] for x in lab.tolist()])
+    clf = train(pose_features_batch(px, left), y, labels, l2=l2, iters=iters)
+    clf.min_confidence = min_confidence
+    train_acc = float((clf.predict_batch(pose_features_batch(px, left)) == y).mean())
+    print(f"trained on {len(y)} frames, {len(labels)} poses: {', '.join(labels)}; train accuracy {train_acc:.3f}")
+
+    cm = None
+    tpx, tleft, tlab = stack(te)
+    known = np.array([x in index for x in tlab.tolist()], dtype=bool)
+    if known.any():
+        tpx, tleft = tpx[known], tleft[known]
+        ty = np.array([index[x] for x in tlab[known].tolist()])
+        cm = confusion(ty, clf.predict_batch(pose_features_batch(tpx, tleft)), len(labels))
+        print(f"\nheld-out: {len(ty)} frames, accuracy {np.trace(cm) / cm.sum():.3f}")
+        print(format_confusion(cm, labels))
+        med, p99 = classify_latency_us(clf, tpx, tleft)
+        print(f"\nclassify latency per hand: median {med:.1f} us, p99 {p99:.1f} us")
+
+    if out:
+        os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+        clf.save(out)
+        print(f"saved {out} ({os.path.getsize(out)} bytes)")
+    return clf, cm
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Train the HandMouse pose classifier from recorded sessions")
+    ap.add_argument("sessions", nargs="+", help="SESSION[=LABEL]")
+    ap.add_argument("--test", nargs="*", default=[], help="held-out SESSION[=LABEL] (default: tail of each session)")
+    ap.add_argument("--holdout", type=float, default=0.2, help="tail fraction held out when --test is not given")
+    ap.add_argument("--out", default=os.path.join("models", "pose_model.npz"))
+    ap.add_argument("--l2", type=float, default=1e-3)
+    ap.add_argument("--iters", type=int, default=500)
+    ap.add_argument("--min-confidence", type=float, default=0.6)
+    args = ap.parse_args(argv)
+    run(args.sessions, args.test, args.out, args.holdout, args.l2, args.iters, args.min_confidence)
+
+
+if __name__ == "__main__":
+    main()
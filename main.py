@@ -1,28 +1,52 @@
 # main.py
 import ctypes
+import multiprocessing
 import time
-import cv2
+
+# Start of the startup timeline; everything below counts as import time
+LAUNCH_T = time.perf_counter()
 
 from config import (
+    ensure_config_json, save_camera_profile,
     MODEL_PATH,
-    CAMERA_INDEX, CAMERA_WIDTH, CAMERA_HEIGHT, MIRROR_CAMERA,
-    PROCESS_EVERY_N_FRAMES,
+    CAMERA_INDEX, CAMERA_WIDTH, CAMERA_HEIGHT, MIRROR_CAMERA, MIRROR_MODE,
+    PROCESS_EVERY_N_FRAMES, THREADED_CAPTURE, CAMERA_FLUSH_FRAMES,
+    CAMERA_PROFILE, CAMERA_TARGET_WIDTH, CAMERA_TARGET_HEIGHT, CAMERA_MIN_FPS, CAMERA_PROFILE_CACHE,
     ACTIVE_REGION_MARGIN, MAP_GAMMA,
-    EMA_ALPHA, DEADZONE_PX, MAX_STEP_PX,
-    MAX_HANDS, MIN_DETECTION_CONF, MIN_TRACKING_CONF, SHOW_DEBUG,
+    SMOOTHING_FILTER, SMOOTHING_PARAMS,
+    PREDICTION_ENABLED, PREDICTION_PROCESS_NOISE, PREDICTION_MEASUREMENT_NOISE,
+    PREDICTION_MAX_HORIZON_MS, PREDICTION_MAX_OVERSHOOT_PX, PREDICTION_REST_SPEED,
+    MAX_HANDS, MIN_DETECTION_CONF, MIN_TRACKING_CONF, INFERENCE_MODE,
+    SHOW_DEBUG, VIEWER_FPS, VIEWER_SCALE,
+    ROI_ENABLED, ROI_PADDING, ROI_INFER_SIZE, ROI_FULL_SCAN_EVERY, ROI_MIN_SCORE,
     MOUSE_SPEED,
     PINCH_START_RATIO, PINCH_END_RATIO, PINCH_CLICK_MS, PINCH_DRAG_MS,
-    CLICK_DEBOUNCE_MS, CLICK_MAX_MOVE_PX,
+    CLICK_DEBOUNCE_MS, CLICK_MAX_MOVE_PX, GESTURE_TABLE,
+    SCROLL_PINCH_START_RATIO, SCROLL_PINCH_END_RATIO, SCROLL_PX_PER_STEP, SCROLL_MAX_STEP,
+    RECORDING_ENABLED, RECORDING_DIR, RECORDING_SAVE_FRAMES, RECORDING_FRAME_SCALE,
+    PROFILING_ENABLED, PROFILING_WINDOW, PROFILING_REPORT_PATH, PROFILING_ALLOCATIONS,
+    PROFILING_STARTUP_REPORT,
+    ADAPTIVE_INFERENCE, SCHED_MIN_INTERVAL_MS, SCHED_MAX_INTERVAL_MS, SCHED_FAST_SPEED, SCHED_SLOW_SPEED,
+    IDLE_ENABLED, IDLE_AFTER_MS, IDLE_FPS, IDLE_MOTION_WIDTH, IDLE_MOTION_THRESHOLD, IDLE_MOTION_FRACTION,
+    POSE_MODEL_PATH, POSE_MIN_CONFIDENCE, POSE_POINTING_LABEL,
+    THREADED_OUTPUT, OUTPUT_MOUSE, SCREEN_WIDTH, SCREEN_HEIGHT,
+    DISPLAY_RATE_HZ, DISPLAY_MODE, MAX_EXTRAPOLATE_MS,
+    CAMERA_SOURCE, CAMERA_BACKEND, CAMERA_FILE_PATH, CAMERA_FILE_REALTIME, CAMERA_FILE_LOOP,
+    CAMERA_SYNTHETIC_FRAMES,
+    CAMERA_SPEC, PIPELINE_SLOTS, PIPELINE_MAX_RESTARTS,
+    CAMERA_SOURCES, CAMERA_FUSION, CAMERA_FUSION_MAX_SKEW_MS, CAMERA_FUSION_SWITCH_MARGIN,
+    STREAM_ENABLED, STREAM_ADDRESS, STREAM_QUEUE_SIZE,
 )
 
-from camera.webcam import Webcam
-from vision.hand_tracker import HandTracker
-from core.mapping import compute_active_region, map_cam_to_screen
-from core.smoothing import CursorSmoother
-from core.sensitivity import apply_mouse_speed
-from core.pose import is_index_pointing
-from actions.mouse_controller import MouseController
+# Only what every run needs. Camera / tracker modules (cv2, mediapipe) are
+# imported by open_camera() and create_tracker() while both run in parallel,
+# optional subsystems by the branch of main() that enables them.
+from core.smoothing import make_smoother
+from core.controller import HandController
+from core.latency import LatencyStats, perf, READ, FLIP, DETECT, CURSOR, OUTPUT, LOOP
+from core.startup import StartupTimeline, open_camera_and_tracker
 from gestures.recognizer import GestureRecognizer
+from gestures.table import specs_from_table
 
 
 def get_screen_size_windows():
@@ -31,20 +55,167 @@ def get_screen_size_windows():
     return user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
 
 
-def draw_landmarks_simple(frame, pts):
-    for (x, y) in pts:
-        cv2.circle(frame, (x, y), 2, (0, 255, 0), -1)
-    if len(pts) > 8:
-        cv2.circle(frame, pts[8], 8, (0, 255, 0), -1)
+def get_screen_size():
+    if hasattr(ctypes, "windll"):
+        return get_screen_size_windows()
+    return SCREEN_WIDTH, SCREEN_HEIGHT
 
 
 def main():
-    screen_w, screen_h = get_screen_size_windows()
+    screen_w, screen_h = get_screen_size()
+    start_time = time.monotonic()
+    stats = LatencyStats(PROFILING_WINDOW) if PROFILING_ENABLED else None
+
+    startup = StartupTimeline(LAUNCH_T) if PROFILING_STARTUP_REPORT else None
+    timeline = startup   # printed on exit; `startup` is dropped once the cursor moves
+    if startup is not None:
+        startup.mark("imports")
+    ensure_config_json()
+
+    def open_camera():
+        from camera.webcam import Webcam, ThreadedCapture
+        from camera.sources import VideoFileSource, SyntheticSource
+
+        flush = 0 if THREADED_CAPTURE else CAMERA_FLUSH_FRAMES
+        if CAMERA_SOURCE == "file":
+            webcam = VideoFileSource(CAMERA_FILE_PATH, realtime=CAMERA_FILE_REALTIME, loop=CAMERA_FILE_LOOP)
+        elif CAMERA_SOURCE == "synthetic":
+            webcam = SyntheticSource(CAMERA_TARGET_WIDTH, CAMERA_TARGET_HEIGHT, frames=CAMERA_SYNTHETIC_FRAMES)
+        elif CAMERA_PROFILE == "auto":
+            from camera.profile import negotiate, profile_to_dict
+            webcam = Webcam(CAMERA_INDEX, CAMERA_TARGET_WIDTH, CAMERA_TARGET_HEIGHT,
+                            flush_frames=flush, backend=CAMERA_BACKEND)
+            # Cached per camera index; the probe (a few seconds) only runs once
+            _, probed = negotiate(webcam.cap, CAMERA_PROFILE_CACHE.get(str(CAMERA_INDEX)),
+                                  CAMERA_TARGET_WIDTH, CAMERA_TARGET_HEIGHT, CAMERA_MIN_FPS)
+            if probed is not None:
+                save_camera_profile(CAMERA_INDEX, profile_to_dict(probed, CAMERA_TARGET_WIDTH, CAMERA_TARGET_HEIGHT))
+                if startup is not None:
+                    startup.mark("capture profile probed")
+        else:
+            webcam = Webcam(CAMERA_INDEX, CAMERA_WIDTH, CAMERA_HEIGHT, flush_frames=flush, backend=CAMERA_BACKEND)
+
+        if THREADED_CAPTURE:
+            # Background thread keeps only the newest frame; no grab() flushing needed
+            return ThreadedCapture(webcam)
+        return webcam
+
+    def expected_size():
+        # What open_camera() should deliver; checked against the real frames once it is open
+        if CAMERA_SOURCE == "synthetic":
+            return CAMERA_TARGET_WIDTH, CAMERA_TARGET_HEIGHT
+        if CAMERA_SOURCE == "webcam" and CAMERA_PROFILE == "auto":
+            cached = CAMERA_PROFILE_CACHE.get(str(CAMERA_INDEX)) or {}
+            if cached.get("target") == [CAMERA_TARGET_WIDTH, CAMERA_TARGET_HEIGHT]:
+                return int(cached["width"]), int(cached["height"])
+            return CAMERA_TARGET_WIDTH, CAMERA_TARGET_HEIGHT
+        return CAMERA_WIDTH, CAMERA_HEIGHT
+
+    # Mirror detections rather than pixels: saves a full-frame flip per iteration
+    mirror_landmarks = MIRROR_CAMERA and MIRROR_MODE == "landmarks"
+    flip_frames = MIRROR_CAMERA and not mirror_landmarks
+
+    roi = dict(
+        mirror=mirror_landmarks,
+        roi_enabled=ROI_ENABLED,
+        roi_padding=ROI_PADDING,
+        roi_infer_size=ROI_INFER_SIZE,
+        roi_full_scan_every=ROI_FULL_SCAN_EVERY,
+        roi_min_score=ROI_MIN_SCORE,
+        stats=stats,
+    )
 
-    cam = Webcam(CAMERA_INDEX, CAMERA_WIDTH, CAMERA_HEIGHT)
-    tracker = HandTracker(MAX_HANDS, MIN_DETECTION_CONF, MIN_TRACKING_CONF, MODEL_PATH)
-    smoother = CursorSmoother(EMA_ALPHA, DEADZONE_PX, MAX_STEP_PX)
-    mouse = MouseController()
+    def create_tracker():
+        from vision.hand_tracker import HandTracker
+        if INFERENCE_MODE == "live_stream":
+            return HandTracker(MAX_HANDS, MIN_DETECTION_CONF, MIN_TRACKING_CONF, MODEL_PATH,
+                               running_mode="live_stream", **roi)
+        if INFERENCE_MODE == "thread":
+            from vision.async_tracker import AsyncHandTracker
+            return AsyncHandTracker(HandTracker(MAX_HANDS, MIN_DETECTION_CONF, MIN_TRACKING_CONF, MODEL_PATH, **roi))
+        return HandTracker(MAX_HANDS, MIN_DETECTION_CONF, MIN_TRACKING_CONF, MODEL_PATH, **roi)
+
+    if CAMERA_SOURCES:
+        # One capture + tracker process per camera; the fused hand comes back as the
+        # async tracker result, with a blank workspace canvas as the frame
+        from vision.multi_camera import MultiCameraTracker
+        flip_frames = False
+        tracker_kwargs = {k: v for k, v in roi.items() if k != "stats"}
+        tracker_kwargs["mirror"] = MIRROR_CAMERA
+        cam = tracker = MultiCameraTracker(
+            CAMERA_SOURCES,
+            dict(max_hands=MAX_HANDS, min_det_conf=MIN_DETECTION_CONF, min_track_conf=MIN_TRACKING_CONF,
+                 model_path=MODEL_PATH, **tracker_kwargs),
+            fusion=CAMERA_FUSION, max_skew_ms=CAMERA_FUSION_MAX_SKEW_MS,
+            switch_margin=CAMERA_FUSION_SWITCH_MARGIN, time_origin=start_time,
+        )
+    elif INFERENCE_MODE == "processes":
+        # Capture and tracker processes share frames through shared memory; this
+        # process is left with control and output. Landmarks are mirrored by the
+        # tracker, and the frame returned with each result is the unflipped one
+        from vision.pipeline import ProcessPipeline
+        flip_frames = False
+        mirror_landmarks = MIRROR_CAMERA
+        tracker_kwargs = {k: v for k, v in roi.items() if k != "stats"}
+        tracker_kwargs["mirror"] = MIRROR_CAMERA
+        cam = tracker = ProcessPipeline(
+            CAMERA_SPEC,
+            dict(max_hands=MAX_HANDS, min_det_conf=MIN_DETECTION_CONF, min_track_conf=MIN_TRACKING_CONF,
+                 model_path=MODEL_PATH, **tracker_kwargs),
+            slots=PIPELINE_SLOTS, max_restarts=PIPELINE_MAX_RESTARTS, time_origin=start_time,
+        )
+    else:
+        # Model load + warm-up inference run on a worker thread while the camera opens
+        cam, tracker = open_camera_and_tracker(open_camera, create_tracker, warm_up=True,
+                                               warm_up_size=expected_size(), timeline=startup,
+                                               frame_size=lambda c: c.frame_size())
+    smoother = make_smoother(SMOOTHING_FILTER, SMOOTHING_PARAMS)
+    null_mouse = None
+    if OUTPUT_MOUSE == "none":
+        from actions.recording_mouse import NullMouse
+        mouse = null_mouse = NullMouse()
+    else:
+        # pynput needs a desktop session; only imported when it is used
+        from actions.mouse_controller import MouseController
+        mouse = MouseController()
+    output = None
+    if THREADED_OUTPUT:
+        # pynput calls happen on a worker thread; the loop only enqueues
+        from actions.threaded_mouse import ThreadedMouse
+        mouse = output = ThreadedMouse(mouse)
+    display = None
+    if DISPLAY_RATE_HZ > 0:
+        # Cursor moves at the monitor's rate on a timer thread, between the loop's targets
+        from actions.display_mouse import DisplayRateMouse
+        mouse = display = DisplayRateMouse(mouse, DISPLAY_RATE_HZ, DISPLAY_MODE, MAX_EXTRAPOLATE_MS)
+
+    stream = None
+    if STREAM_ENABLED:
+        # Publishing only appends to a queue; the server runs on its own thread
+        from streaming.server import StreamServer
+        from actions.streaming_mouse import StreamingMouse
+        stream = StreamServer(STREAM_ADDRESS, STREAM_QUEUE_SIZE, time_origin=start_time).start()
+        mouse = StreamingMouse(mouse, stream)
+        print(f"event stream on {STREAM_ADDRESS}")
+
+    recorder = None
+    if RECORDING_ENABLED:
+        from recording.session import SessionRecorder, new_session_dir
+        from actions.recording_mouse import RecordingMouse
+        recorder = SessionRecorder(new_session_dir(RECORDING_DIR), RECORDING_SAVE_FRAMES, RECORDING_FRAME_SCALE,
+                                   mirror_frames=mirror_landmarks)
+        mouse = RecordingMouse(mouse)
+
+    predictor = None
+    if PREDICTION_ENABLED:
+        from core.prediction import TipPredictor
+        predictor = TipPredictor(
+            process_noise=PREDICTION_PROCESS_NOISE,
+            measurement_noise=PREDICTION_MEASUREMENT_NOISE,
+            max_horizon_ms=PREDICTION_MAX_HORIZON_MS,
+            max_overshoot_px=PREDICTION_MAX_OVERSHOOT_PX,
+            rest_speed=PREDICTION_REST_SPEED,
+        )
 
     gestures = GestureRecognizer(
         pinch_start_ratio=PINCH_START_RATIO,
@@ -53,95 +224,235 @@ def main():
         pinch_drag_ms=PINCH_DRAG_MS,
         click_debounce_ms=CLICK_DEBOUNCE_MS,
         click_max_move_px=CLICK_MAX_MOVE_PX,
+        scroll_start_ratio=SCROLL_PINCH_START_RATIO,
+        scroll_end_ratio=SCROLL_PINCH_END_RATIO,
+        scroll_px_per_step=SCROLL_PX_PER_STEP,
+        scroll_max_step=SCROLL_MAX_STEP,
+        specs=specs_from_table(GESTURE_TABLE),
     )
 
-    active_region = None
-    start_time = time.monotonic()
+    poses = None
+    if POSE_MODEL_PATH:
+        from gestures.poses import PoseClassifier
+        poses = PoseClassifier.load(POSE_MODEL_PATH, POSE_MIN_CONFIDENCE)
+
+    controller = HandController(
+        mouse, smoother, gestures, screen_w, screen_h,
+        ACTIVE_REGION_MARGIN, MAP_GAMMA, MOUSE_SPEED, predictor=predictor, stats=stats,
+        poses=poses, pointing_label=POSE_POINTING_LABEL,
+    )
+
+    scheduler = None
+    if ADAPTIVE_INFERENCE:
+        from core.scheduler import InferenceScheduler
+        scheduler = InferenceScheduler(SCHED_MIN_INTERVAL_MS, SCHED_MAX_INTERVAL_MS, SCHED_FAST_SPEED, SCHED_SLOW_SPEED)
+
+    idle = None
+    if IDLE_ENABLED and not CAMERA_SOURCES and INFERENCE_MODE != "processes":
+        # Worker processes run their own capture and trackers; idle mode is for the in-process loop
+        from core.idle import IdleMonitor, MotionDetector
+        idle = IdleMonitor(IDLE_AFTER_MS, IDLE_FPS,
+                           MotionDetector(IDLE_MOTION_WIDTH, IDLE_MOTION_THRESHOLD, IDLE_MOTION_FRACTION))
+
+    def set_capture_interval(seconds: float):
+        # Threaded capture stops grabbing frames; other sources are paced by the loop
+        if hasattr(cam, "set_interval"):
+            cam.set_interval(seconds)
+
+    viewer = None
+    if SHOW_DEBUG:
+        # Drawing / imshow / waitKey happen on the viewer thread, not in this loop
+        from ui.viewer import DebugViewer, Overlay
+        viewer = DebugViewer(VIEWER_FPS, VIEWER_SCALE, stats=stats, mirror=mirror_landmarks)
 
     # Frame skipping / reuse last detection
     frame_count = 0
     last_hand = None
+    last_result_seq = 0
+    flipped = None      # reused cv2.flip destination
+
+    # Allocation stages: READ, FLIP, DETECT (idle check, inference, results),
+    # CURSOR (controller.step: cursor, gestures, mouse calls), OUTPUT (the rest)
+    alloc = None
+    if PROFILING_ALLOCATIONS:
+        from core.alloc import AllocationProfiler
+        alloc = AllocationProfiler(PROFILING_WINDOW).start()
 
-    # Cursor value used for gesture gating even when not moving
-    last_cursor = (screen_w // 2, screen_h // 2)
+    if flip_frames:
+        import cv2
 
     try:
         while True:
-            frame = cam.read()
+            if alloc is not None:
+                alloc.begin_frame()
+                alloc.stage(READ)
+            t_read = perf()
+            frame, capture_t = cam.read_latest(timeout=0.05)
             if frame is None:
+                if cam.eof:
+                    break      # file / synthetic source finished
                 continue
 
-            if MIRROR_CAMERA:
-                frame = cv2.flip(frame, 1)
+            t_loop = perf()
+            if alloc is not None:
+                alloc.stage(FLIP)
+            if flip_frames:
+                if flipped is None or flipped.shape != frame.shape:
+                    flipped = cv2.flip(frame, 1)
+                else:
+                    cv2.flip(frame, 1, dst=flipped)
+                frame = flipped
+            if stats is not None:
+                stats.add(READ, t_loop - t_read)
+                stats.add(FLIP, perf() - t_loop)
 
             h, w = frame.shape[:2]
-            if active_region is None:
-                active_region = compute_active_region(w, h, ACTIVE_REGION_MARGIN)
+            controller.set_frame_size(w, h)
+            if startup is not None:
+                startup.mark("first frame")
 
-            timestamp_ms = int((time.monotonic() - start_time) * 1000)
+            # Stamp with the capture time, not the time we got around to the frame
+            frame_t_ms = (capture_t - start_time) * 1000.0
+            timestamp_ms = int(frame_t_ms)
             frame_count += 1
 
-            # Run detection every N frames
-            if frame_count % PROCESS_EVERY_N_FRAMES == 0:
-                data = tracker.process(frame, timestamp_ms)
-                hands = data["hands"]
-                last_hand = hands[0] if hands else None
-
+            if alloc is not None:
+                alloc.stage(DETECT)
+
+            # Frame timestamp and hands of a detection that arrived this iteration
+            det_ts = None
+            fresh_hands = None
+
+            # Idle: only the motion detector looks at the frame; motion wakes the
+            # landmarker on this same frame
+            waking = False
+            if idle is not None and idle.idle:
+                waking = idle.motion(frame, controller.active_region, timestamp_ms)
+                if waking:
+                    set_capture_interval(0.0)
+
+            # Run detection every N frames, or when the scheduler says so
+            if idle is not None and idle.idle:
+                run_inference = False
+            elif waking:
+                run_inference = True
+            elif scheduler is not None:
+                run_inference = scheduler.should_run(timestamp_ms)
+            else:
+                run_inference = frame_count % PROCESS_EVERY_N_FRAMES == 0
+
+            if run_inference:
+                if scheduler is not None:
+                    scheduler.mark_run(timestamp_ms)
+
+                if tracker.is_async:
+                    # Never waits on the model; dropped if inference is still busy
+                    tracker.submit(frame, timestamp_ms)
+                else:
+                    data = tracker.process(frame, timestamp_ms)
+                    hands = data["hands"]
+                    last_hand = hands[0] if hands else None
+                    det_ts = timestamp_ms
+                    fresh_hands = hands
+
+            if tracker.is_async:
+                result = tracker.latest()
+                if result is not None and result.seq != last_result_seq:
+                    last_result_seq = result.seq
+                    last_hand = result.hands[0] if result.hands else None
+                    det_ts = result.timestamp_ms
+                    fresh_hands = result.hands
+
+            if det_ts is not None:
+                controller.on_detection(last_hand, det_ts)
+                if idle is not None and idle.observe(last_hand, det_ts):
+                    set_capture_interval(idle.frame_interval_s)
+                if stream is not None:
+                    stream.publish_hands(det_ts, fresh_hands, w, h)
+
+            if recorder is not None:
+                mouse.begin_frame(recorder.frame_index, frame_t_ms)
+
+            if alloc is not None:
+                alloc.stage(CURSOR)
             if last_hand is not None:
-                hand0 = last_hand
-                lms = hand0["landmarks"]
-
-                # Move cursor only if user is "pointing" with index finger
-                if is_index_pointing(lms):
-                    x_px, y_px = hand0["index_tip"]
-
-                    sx, sy = map_cam_to_screen(
-                        x_px, y_px, active_region, screen_w, screen_h, gamma=MAP_GAMMA
-                    )
-                    sx, sy = smoother.update(sx, sy)
-                    sx, sy = apply_mouse_speed(sx, sy, screen_w, screen_h, MOUSE_SPEED)
-
-                    mouse.move_to(sx, sy)
-                    last_cursor = (sx, sy)
-
-                # Gestures still processed even if cursor isn't moving
-                events = gestures.update(hand0, timestamp_ms, cursor_xy=last_cursor)
-
-                if events.get("scroll", 0):
-                    mouse.scroll(events["scroll"])
-
-                if events["left_click"]:
-                    mouse.left_click()
-
-                if events["right_click"]:
-                    mouse.right_click()
-
-                if events["drag_start"]:
-                    mouse.press_left()
-
-                if events["drag_end"]:
-                    mouse.release_left()
-
-                if SHOW_DEBUG:
-                    draw_landmarks_simple(frame, lms)
-
-            if SHOW_DEBUG:
-                ar = active_region
-                cv2.rectangle(frame, (ar.x0, ar.y0), (ar.x1, ar.y1), (255, 255, 255), 2)
-                cv2.putText(frame, "ESC to quit", (10, 30),
-                            cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
-                cv2.putText(frame, f"N={PROCESS_EVERY_N_FRAMES} margin={ACTIVE_REGION_MARGIN:.2f} gamma={MAP_GAMMA:.2f} speed={MOUSE_SPEED:.2f}",
-                            (10, 65), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-                cv2.imshow("HandMouse Debug", frame)
-
-                if (cv2.waitKey(1) & 0xFF) == 27:
+                controller.step(last_hand, timestamp_ms, capture_t)
+            if alloc is not None:
+                alloc.stage(OUTPUT)
+
+            if startup is not None:
+                if det_ts is not None:
+                    startup.mark("first result")
+                if controller.moves:
+                    startup.mark("first cursor move")
+                    startup = None
+
+            if scheduler is not None and det_ts is not None:
+                # After step(), so the recognizer has seen this detection
+                scheduler.observe(last_hand, det_ts, gestures)
+
+            if recorder is not None:
+                recorder.write_frame(frame_t_ms, w, h, det_ts is not None,
+                                     fresh_hands, det_ts, frame)
+                recorder.write_events(mouse.drain())
+
+            if stream is not None:
+                stream.flush()
+
+            if stats is not None:
+                stats.add(LOOP, perf() - t_loop)
+
+            if idle is not None and idle.idle and not hasattr(cam, "set_interval"):
+                # Unthreaded source: pace idle frames here
+                delay = idle.frame_interval_s - (perf() - t_read)
+                if delay > 0:
+                    time.sleep(delay)
+
+            if viewer is not None:
+                if viewer.quit_requested:
                     break
+                if viewer.wants_frame():
+                    ar = controller.active_region
+                    cadence = f"{scheduler.effective_hz:.0f}Hz" if scheduler is not None else f"N={PROCESS_EVERY_N_FRAMES}"
+                    if idle is not None and idle.idle:
+                        cadence = f"idle {IDLE_FPS:.0f}fps"
+                    lines = [f"{cadence} margin={ACTIVE_REGION_MARGIN:.2f} gamma={MAP_GAMMA:.2f} speed={MOUSE_SPEED:.2f}"]
+                    if poses is not None:
+                        lines.append(f"pose: {controller.pose or '-'}")
+                    viewer.publish(frame, Overlay(
+                        landmarks=last_hand["landmarks"] if last_hand is not None else (),
+                        active_region=(ar.x0, ar.y0, ar.x1, ar.y1),
+                        lines=lines,
+                    ))
+
+            if alloc is not None:
+                alloc.end_frame()
 
     finally:
+        if stats is not None and PROFILING_REPORT_PATH:
+            stats.dump(PROFILING_REPORT_PATH)
+        if alloc is not None:
+            alloc.stop()
+            print(alloc.report())
+        if recorder is not None:
+            recorder.close()
+        if viewer is not None:
+            viewer.close()
+        if display is not None:
+            display.close()
+        if output is not None:
+            output.close()
+        if stream is not None:
+            stream.close()
         tracker.close()
         cam.release()
-        cv2.destroyAllWindows()
+        if null_mouse is not None:
+            print("mouse events (not sent):", null_mouse.counts)
+        if timeline is not None:
+            print(timeline.report())
 
 
 if __name__ == "__main__":
+    # Camera / pipeline worker processes in a packaged exe
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,151 @@
+# recording/replay.py
+"""
+Replay a recorded session through the cursor/gesture pipeline without a camera
+or a real mouse.
+
+    python -m recording.replay recordings/session-YYYYmmdd-HHMMSS [--realtime] [--screen 1920x1080]
+
+Prints the event counts and a digest of the event stream; the same recording
+always produces the same digest.
+"""
+import argparse
+import functools
+import hashlib
+import time
+from collections import Counter
+
+import numpy as np
+
+from actions.recording_mouse import RecordingMouse, EVENT_NAMES
+from recording.session import load_session, EVENT_DTYPE
+
+
+def replay(session, controller, mouse: RecordingMouse, realtime: bool = False):
+    """
+    Feed every recorded frame through `controller` (a HandController whose mouse
+    is `mouse`). Time comes from the recording, never from the wall clock, so the
+    output is deterministic. realtime=True only paces the loop.
+    """
+    now_s = [0.0]
+    controller.clock = lambda: now_s[0]
+    controller.set_frame_size(session.frame_w, session.frame_h)
+
+    frames = session.frames
+    t_col = frames["t_ms"].tolist()
+    fresh_col = frames["fresh"].tolist()
+    det_col = frames["det_t_ms"].tolist()
+
+    wall0 = time.monotonic()
+    t0 = t_col[0] if t_col else 0.0
+    last_hand = None
+
+    for i, t_ms in enumerate(t_col):
+        if realtime:
+            wait = (t_ms - t0) / 1000.0 - (time.monotonic() - wall0)
+            if wait > 0:
+                time.sleep(wait)
+
+        now_s[0] = t_ms / 1000.0
+        mouse.begin_frame(i, t_ms)
+
+        if fresh_col[i]:
+            hands = session.hands(i)
+            last_hand = hands[0] if hands else None
+            controller.on_detection(last_hand, int(det_col[i]))
+
+        if last_hand is not None:
+            controller.step(last_hand, int(t_ms), t_ms / 1000.0)
+
+    return mouse.events
+
+
+def events_digest(events) -> str:
+    return hashlib.sha1(np.array(events, dtype=EVENT_DTYPE).tobytes()).hexdigest()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_poses(path: str, min_confidence: float):
+    # Read-only after loading, so controllers built for tuning can share it
+    from gestures.poses import PoseClassifier
+    return PoseClassifier.load(path, min_confidence)
+
+
+def build_controller(mouse, screen_w: int, screen_h: int, params: dict | None = None):
+    """
+    HandController configured from config.py, driving `mouse`. `params`
+    ("section.key" -> value, as recording/tune.py tunes them) replace the
+    matching mapping / smoothing / gestures settings.
+    """
+    import config as C
+    from core.controller import HandController
+    from core.prediction import TipPredictor
+    from core.smoothing import make_smoother
+    from gestures.recognizer import GestureRecognizer
+    from gestures.table import specs_from_table
+
+    p = params or {}
+    smoothing = dict(C.SMOOTHING_PARAMS)
+    smoothing.update((key.split(".")[1], v) for key, v in p.items()
+                     if key.startswith("smoothing.") and key != "smoothing.filter")
+
+    predictor = None
+    if C.PREDICTION_ENABLED:
+        predictor = TipPredictor(
+            process_noise=C.PREDICTION_PROCESS_NOISE,
+            measurement_noise=C.PREDICTION_MEASUREMENT_NOISE,
+            max_horizon_ms=C.PREDICTION_MAX_HORIZON_MS,
+            max_overshoot_px=C.PREDICTION_MAX_OVERSHOOT_PX,
+            rest_speed=C.PREDICTION_REST_SPEED,
+        )
+
+    gestures = GestureRecognizer(
+        pinch_start_ratio=p.get("gestures.pinch_start_ratio", C.PINCH_START_RATIO),
+        pinch_end_ratio=p.get("gestures.pinch_end_ratio", C.PINCH_END_RATIO),
+        pinch_click_ms=p.get("gestures.pinch_click_ms", C.PINCH_CLICK_MS),
+        pinch_drag_ms=p.get("gestures.pinch_drag_ms", C.PINCH_DRAG_MS),
+        click_debounce_ms=p.get("gestures.click_debounce_ms", C.CLICK_DEBOUNCE_MS),
+        click_max_move_px=p.get("gestures.click_max_move_px", C.CLICK_MAX_MOVE_PX),
+        scroll_start_ratio=C.SCROLL_PINCH_START_RATIO,
+        scroll_end_ratio=C.SCROLL_PINCH_END_RATIO,
+        scroll_px_per_step=C.SCROLL_PX_PER_STEP,
+        scroll_max_step=C.SCROLL_MAX_STEP,
+        specs=specs_from_table(C.GESTURE_TABLE),
+    )
+    poses = None
+    if C.POSE_MODEL_PATH:
+        poses = _load_poses(C.POSE_MODEL_PATH, C.POSE_MIN_CONFIDENCE)
+
+    return HandController(
+        mouse, make_smoother(p.get("smoothing.filter", C.SMOOTHING_FILTER), smoothing), gestures,
+        screen_w, screen_h, C.ACTIVE_REGION_MARGIN,
+        p.get("mapping.map_gamma", C.MAP_GAMMA), p.get("mapping.mouse_speed", C.MOUSE_SPEED),
+        predictor=predictor, poses=poses, pointing_label=C.POSE_POINTING_LABEL,
+    )
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Replay a HandMouse session recording")
+    ap.add_argument("session")
+    ap.add_argument("--realtime", action="store_true", help="pace frames to their recorded timestamps")
+    ap.add_argument("--screen", default="1920x1080", help="screen size WxH")
+    args = ap.parse_args()
+
+    screen_w, screen_h = (int(v) for v in args.screen.lower().split("x"))
+    session = load_session(args.session)
+    mouse = RecordingMouse()
+    controller = build_controller(mouse, screen_w, screen_h)
+
+    t0 = time.perf_counter()
+    events = replay(session, controller, mouse, realtime=args.realtime)
+    elapsed = time.perf_counter() - t0
+
+    counts = Counter(EVENT_NAMES[e[2]] for e in events)
+    print(f"{len(session)} frames replayed in {elapsed:.2f}s ({len(session) / max(elapsed, 1e-9):.0f} fps)")
+    for name in EVENT_NAMES.values():
+        print(f"  {name:<13}{counts.get(name, 0):>8}")
+    print(f"recorded events: {len(session.events)}")
+    print(f"digest: {events_digest(events)}")
+
+
+if __name__ == "__main__":
+    main()
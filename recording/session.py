@@ -0,0 +1,177 @@
+# recording/session.py
+"""
+Session recording format. A session is a directory:
+
+  meta.json     written once: format version, frame size, thumbnail size
+  frames.bin    one FRAME_DTYPE record per loop iteration (fixed size)
+  events.bin    one EVENT_DTYPE record per emitted mouse event
+  thumbs.bin    optional: one downscaled BGR uint8 frame per loop iteration
+
+The .bin files are raw little-endian numpy records, so load_session() maps them
+with np.memmap: no parsing, no copy, regardless of session length.
+"""
+import json
+import os
+import time
+
+import cv2
+import numpy as np
+
+from core.landmarks import Hand
+
+FORMAT_VERSION = 1
+MAX_REC_HANDS = 2
+
+FRAME_DTYPE = np.dtype([
+    ("t_ms", "<f8"),                              # frame timestamp (capture time)
+    ("fresh", "u1"),                              # 1 if the tracker produced a result this frame
+    ("det_t_ms", "<f8"),                          # timestamp of the frame that result came from
+    ("n_hands", "u1"),
+    ("handedness", "i1", (MAX_REC_HANDS,)),       # 0 left, 1 right, -1 unknown
+    ("score", "<f4", (MAX_REC_HANDS,)),
+    ("landmarks", "<f4", (MAX_REC_HANDS, 21, 3)), # normalized x, y, z (full frame)
+])
+
+EVENT_DTYPE = np.dtype([
+    ("frame", "<u4"),
+    ("t_ms", "<f8"),
+    ("kind", "u1"),   # see actions/recording_mouse.py
+    ("a", "<i4"),     # x (move) / dx (scroll)
+    ("b", "<i4"),     # y (move) / dy (scroll)
+])
+
+_HANDEDNESS_CODE = {"Left": 0, "Right": 1}
+_HANDEDNESS_NAME = {0: "Left", 1: "Right"}
+
+
+class SessionRecorder:
+    def __init__(self, path: str, save_frames: bool = False, frame_scale: float = 0.25,
+                 mirror_frames: bool = False):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.save_frames = save_frames
+        self.frame_scale = frame_scale
+        self.mirror_frames = mirror_frames   # frames arrive unflipped, landmarks already mirrored
+
+        self.frame_index = 0
+        self._meta = None
+        self._rec = np.zeros(1, dtype=FRAME_DTYPE)   # reused for every frame
+
+        self._frames_f = open(os.path.join(path, "frames.bin"), "wb")
+        self._events_f = open(os.path.join(path, "events.bin"), "wb")
+        self._thumbs_f = open(os.path.join(path, "thumbs.bin"), "wb") if save_frames else None
+
+    def _write_meta(self, w: int, h: int, thumb):
+        self._meta = {
+            "version": FORMAT_VERSION,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "frame_w": w,
+            "frame_h": h,
+            "max_hands": MAX_REC_HANDS,
+            "thumb_w": thumb.shape[1] if thumb is not None else 0,
+            "thumb_h": thumb.shape[0] if thumb is not None else 0,
+        }
+        with open(os.path.join(self.path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(self._meta, f, indent=2)
+
+    def write_frame(self, t_ms: float, frame_w: int, frame_h: int, fresh: bool, hands,
+                    det_t_ms: float | None = None, frame=None):
+        """
+        One loop iteration. `hands` is the tracker output if fresh, else ignored.
+        det_t_ms defaults to t_ms (synchronous inference).
+        """
+        thumb = None
+        if self.save_frames and frame is not None:
+            tw = max(1, int(frame_w * self.frame_scale))
+            th = max(1, int(frame_h * self.frame_scale))
+            thumb = cv2.resize(frame, (tw, th), interpolation=cv2.INTER_AREA)
+            if self.mirror_frames:
+                thumb = cv2.flip(thumb, 1)
+
+        if self._meta is None:
+            self._write_meta(frame_w, frame_h, thumb)
+
+        r = self._rec[0]
+        r["t_ms"] = t_ms
+        r["fresh"] = 1 if fresh else 0
+        r["det_t_ms"] = t_ms if det_t_ms is None else det_t_ms
+        r["handedness"] = -1
+        r["score"] = 0.0
+        r["landmarks"] = 0.0
+
+        n = 0
+        if fresh and hands:
+            for hand in hands[:MAX_REC_HANDS]:
+                r["landmarks"][n] = hand.norm
+                r["handedness"][n] = _HANDEDNESS_CODE.get(hand.handedness, -1)
+                r["score"][n] = hand.score
+                n += 1
+        r["n_hands"] = n
+
+        self._frames_f.write(self._rec.tobytes())
+        if self._thumbs_f is not None:
+            if thumb is None:
+                thumb = np.zeros((self._meta["thumb_h"], self._meta["thumb_w"], 3), dtype=np.uint8)
+            self._thumbs_f.write(np.ascontiguousarray(thumb).tobytes())
+
+        self.frame_index += 1
+
+    def write_events(self, events):
+        """events: (frame_index, t_ms, kind, a, b) tuples, e.g. RecordingMouse.drain()."""
+        if events:
+            self._events_f.write(np.array(events, dtype=EVENT_DTYPE).tobytes())
+
+    def close(self):
+        for f in (self._frames_f, self._events_f, self._thumbs_f):
+            if f is not None:
+                f.close()
+
+
+def _map(path: str, dtype, shape=None):
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return np.zeros((0,) + (shape or ()), dtype=dtype)
+    if shape is None:
+        return np.memmap(path, dtype=dtype, mode="r")
+    n = os.path.getsize(path) // (np.dtype(dtype).itemsize * int(np.prod(shape)))
+    return np.memmap(path, dtype=dtype, mode="r", shape=(n,) + shape)
+
+
+class Session:
+    """A recorded session, memory-mapped."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, "meta.json"), "r", encoding="utf-8") as f:
+            self.meta = json.load(f)
+        if self.meta.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported session format version: {self.meta.get('version')!r}")
+
+        self.frame_w = int(self.meta["frame_w"])
+        self.frame_h = int(self.meta["frame_h"])
+        self.frames = _map(os.path.join(path, "frames.bin"), FRAME_DTYPE)
+        self.events = _map(os.path.join(path, "events.bin"), EVENT_DTYPE)
+
+        self.thumbs = None
+        tw, th = int(self.meta.get("thumb_w", 0)), int(self.meta.get("thumb_h", 0))
+        if tw and th:
+            self.thumbs = _map(os.path.join(path, "thumbs.bin"), np.uint8, (th, tw, 3))
+
+    def __len__(self):
+        return len(self.frames)
+
+    def hands(self, i: int) -> list:
+        """Hands recorded for frame i (empty if none / not a fresh frame)."""
+        r = self.frames[i]
+        out = []
+        for k in range(int(r["n_hands"])):
+            out.append(Hand(r["landmarks"][k], self.frame_w, self.frame_h,
+                            _HANDEDNESS_NAME.get(int(r["handedness"][k])), float(r["score"][k])))
+        return out
+
+
+def load_session(path: str) -> Session:
+    return Session(path)
+
+
+def new_session_dir(root: str) -> str:
+    return os.path.join(root, time.strftime("session-%Y%m%d-%H%M%S"))
@@ -0,0 +1,390 @@
+# recording/tune.py
+"""
+Tune smoothing, mapping and gesture thresholds offline on labeled recordings.
+
+    python -m recording.tune recordings/session-A recordings/session-B ...
+        [--trials 2000] [--workers 0] [--filter one_euro] [--out config.json] [--dry-run]
+
+Every session needs a labels.json with what the user meant to do:
+    {"clicks":  [[t_ms, "left_click" | "right_click"], ...],
+     "drags":   [[start_ms, end_ms], ...],
+     "targets": [[t_ms, x, y], ...]}      intended cursor position, x and y in 0..1 of the screen
+
+Parameter sets are drawn at random from space(), then around the best ones
+found so far, and replayed on a process pool through the controller
+recording/replay.py builds from the config (smoother, active-region margin,
+predictor, gesture table, scroll and pose settings), with the set applied on
+top. Only the configured smoother's parameters are tuned, or those of
+--filter, which then replaces it; the pinch settings are left out when a
+gesture table is configured, since the app does not use them then. Each set is scored on cursor
+jitter, lag and error against the targets and on false / missed clicks and
+drags; the winner is merged into config.json.
+"""
+import argparse
+import json
+import math
+import os
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+from actions.recording_mouse import RecordingMouse, MOVE, LEFT_CLICK, RIGHT_CLICK, PRESS_LEFT, RELEASE_LEFT
+from recording.replay import build_controller, replay
+from recording.session import load_session
+
+# "section.key" -> (low, high, is_int); section.key as in config.py
+# Smoother parameters by filter name (as for make_smoother); only one filter's are tuned
+SMOOTHING_SPACE = {
+    "ema": {
+        "smoothing.ema_alpha": (0.05, 0.6, False),
+        "smoothing.deadzone_px": (0, 8, True),
+        "smoothing.max_step_px": (20, 200, True),
+    },
+    "one_euro": {
+        "smoothing.one_euro_min_cutoff": (0.05, 5.0, False),
+        "smoothing.one_euro_beta": (0.0, 0.1, False),
+        "smoothing.one_euro_d_cutoff": (0.5, 3.0, False),
+    },
+    "double_exp": {
+        "smoothing.double_exp_alpha": (0.05, 0.8, False),
+        "smoothing.double_exp_beta": (0.01, 0.5, False),
+    },
+    "kalman": {
+        "smoothing.kalman_process_noise": (0.00001, 0.01, False),
+        "smoothing.kalman_measurement_noise": (1.0, 64.0, False),
+    },
+}
+MAPPING_SPACE = {
+    "mapping.map_gamma": (0.8, 1.6, False),
+    "mapping.mouse_speed": (1.0, 4.0, False),
+}
+# Built-in pinch gestures only: a configured gesture table has its own thresholds
+PINCH_SPACE = {
+    "gestures.pinch_start_ratio": (0.15, 0.45, False),
+    "gestures.pinch_end_ratio": (0.2, 0.6, False),
+    "gestures.pinch_click_ms": (40, 300, True),
+    "gestures.pinch_drag_ms": (250, 900, True),
+    "gestures.click_debounce_ms": (100, 500, True),
+    "gestures.click_max_move_px": (10, 90, True),
+}
+
+# Score = sum of weight * metric (lower is better)
+WEIGHTS = {
+    "jitter_px": 1.0,        # cursor movement per frame while the target is still
+    "lag_ms": 0.05,          # delay of the cursor path behind the target path
+    "error_px": 0.05,        # mean distance to the target
+    "false_clicks": 5.0,     # clicks / presses nobody asked for
+    "missed_clicks": 5.0,
+    "missed_drags": 5.0,
+}
+
+MATCH_MS = 700      # an event counts for a label up to this long after it (100 ms before)
+MAX_LAG_FRAMES = 12
+
+
+BOUNDS = {k: b for filt in SMOOTHING_SPACE.values() for k, b in filt.items()} | MAPPING_SPACE | PINCH_SPACE
+
+
+def filter_name(name: str) -> str:
+    """`name` as make_smoother reads it: unknown names are the EMA smoother."""
+    name = (name or "ema").lower()
+    return name if name in SMOOTHING_SPACE else "ema"
+
+
+def space(smoother: str | None = None) -> dict:
+    """
+    Tuned keys: the parameters of `smoother` (a filter name, default the
+    configured one), mapping, and the pinch settings unless a gesture table
+    is configured.
+    """
+    import config as C
+    keys = {**SMOOTHING_SPACE[filter_name(smoother or C.SMOOTHING_FILTER)], **MAPPING_SPACE}
+    if not C.GESTURE_TABLE:
+        keys.update(PINCH_SPACE)
+    return keys
+
+
+def current_setup(smoother: str | None = None) -> dict:
+    """
+    "section.key" values evaluate() applies besides the tuned ones: the
+    smoother to use (`smoother`, else the configured filter). Everything
+    else comes from config.py (with config.json), as in the app.
+    """
+    import config as C
+    return {"smoothing.filter": filter_name(smoother or C.SMOOTHING_FILTER)}
+
+
+def current_params(smoother: str | None = None) -> dict:
+    """The values config.py (with config.json) uses now, for every key in space(smoother)."""
+    import config as C
+    return {key: C.settings[key.split(".")[0]][key.split(".")[1]] for key in space(smoother)}
+
+
+def fix_params(p: dict) -> dict:
+    """Clamp into BOUNDS, round ints, keep release above press and drag above click."""
+    out = {}
+    for key, v in p.items():
+        lo, hi, is_int = BOUNDS[key]
+        v = min(hi, max(lo, v))
+        # 4 significant digits: the Kalman noises are around 1e-4
+        out[key] = int(round(v)) if is_int else float(f"{v:.4g}")
+    if "gestures.pinch_start_ratio" in out:
+        out["gestures.pinch_end_ratio"] = max(out["gestures.pinch_end_ratio"], round(out["gestures.pinch_start_ratio"] + 0.03, 3))
+        out["gestures.pinch_drag_ms"] = max(out["gestures.pinch_drag_ms"], out["gestures.pinch_click_ms"] + 100)
+    return out
+
+
+def to_overrides(p: dict, smoother: str | None = None) -> dict:
+    """
+    Flat "section.key" params -> nested config.json override. The smoother
+    choice is only written when `smoother` is given (the user asked for it).
+    """
+    out = {"smoothing": {"filter": filter_name(smoother)}} if smoother else {}
+    for key, v in p.items():
+        section, name = key.split(".")
+        out.setdefault(section, {})[name] = v
+    return out
+
+
+class LabeledSession:
+    """
+    A recording with its hands decoded once and its labels, shaped for
+    recording.replay.replay() (frames, frame_w, frame_h, hands(i)).
+    """
+
+    def __init__(self, path: str, screen_w: int, screen_h: int):
+        session = load_session(path)
+        self.path = path
+        self.frames = np.array(session.frames)
+        self.frame_w, self.frame_h = session.frame_w, session.frame_h
+        self._hands = [session.hands(i) if self.frames["fresh"][i] else [] for i in range(len(self.frames))]
+
+        with open(os.path.join(path, "labels.json"), "r", encoding="utf-8") as f:
+            labels = json.load(f)
+        self.clicks = [(float(t), kind) for t, kind in labels.get("clicks", [])]
+        self.drags = [(float(a), float(b)) for a, b in labels.get("drags", [])]
+
+        # Target per frame (NaN outside the labeled span)
+        t = self.frames["t_ms"].astype(np.float64)
+        self.target = np.full((len(t), 2), np.nan)
+        tg = np.array(labels.get("targets", []), dtype=np.float64).reshape(-1, 3)
+        if len(tg):
+            inside = (t >= tg[0, 0]) & (t <= tg[-1, 0])
+            self.target[inside, 0] = np.interp(t[inside], tg[:, 0], tg[:, 1]) * (screen_w - 1)
+            self.target[inside, 1] = np.interp(t[inside], tg[:, 0], tg[:, 2]) * (screen_h - 1)
+        step = np.full(len(t), np.nan)
+        step[1:] = np.hypot(*np.diff(self.target, axis=0).T)
+        self.still = step < 0.5
+        self.moving = step >= 0.5
+        self.frame_ms = float(np.median(np.diff(t))) if len(t) > 1 else 33.3
+
+    def __len__(self):
+        return len(self.frames)
+
+    def hands(self, i: int) -> list:
+        return self._hands[i]
+
+
+def evaluate(session: LabeledSession, p: dict, screen_w: int, screen_h: int, setup: dict | None = None) -> dict:
+    """
+    Replay `session` through the app's controller (replay.build_controller)
+    with params `p` and `setup` (current_setup() by default) applied on top,
+    and measure it against the labels.
+    """
+    mouse = RecordingMouse()
+    controller = build_controller(mouse, screen_w, screen_h, {**(setup or current_setup()), **p})
+    drag_ms = max((s.drag_ms or 0) for s in controller.gestures.specs)
+    events = replay(session, controller, mouse)
+
+    # Cursor per frame: position after the frame's last move, held until the next one
+    n = len(session)
+    cursor = np.full((n, 2), np.nan)
+    clicks, presses, releases = [], [], []
+    for frame, t_ms, kind, a, b in events:
+        if kind == MOVE:
+            cursor[frame] = (a, b)
+        elif kind in (LEFT_CLICK, RIGHT_CLICK):
+            clicks.append((t_ms, "left_click" if kind == LEFT_CLICK else "right_click"))
+        elif kind == PRESS_LEFT:
+            presses.append(t_ms)
+        elif kind == RELEASE_LEFT:
+            releases.append(t_ms)
+    idx = np.where(~np.isnan(cursor[:, 0]), np.arange(n), 0)
+    np.maximum.accumulate(idx, out=idx)
+    cursor = cursor[idx]
+
+    target = session.target
+    valid = ~np.isnan(target[:, 0]) & ~np.isnan(cursor[:, 0])
+    dist = np.hypot(*(cursor - target).T)
+    error_px = float(dist[valid].mean()) if valid.any() else 0.0
+
+    step = np.zeros(n)
+    step[1:] = np.hypot(*np.diff(cursor, axis=0).T)
+    still = session.still & valid
+    jitter_px = float(step[still].mean()) if still.any() else 0.0
+
+    # Lag: the shift of the target path that best lines up with the cursor while moving
+    lag_ms = 0.0
+    moving = np.flatnonzero(session.moving & valid)
+    if moving.size:
+        best = None
+        for k in range(MAX_LAG_FRAMES + 1):
+            m = moving[moving >= k]
+            if not m.size:
+                break
+            ok = ~np.isnan(target[m - k, 0])
+            e = float(np.hypot(*(cursor[m[ok]] - target[m[ok] - k]).T).mean()) if ok.any() else math.inf
+            if best is None or e < best[0]:
+                best = (e, k)
+        lag_ms = best[1] * session.frame_ms
+
+    def match(times, labels) -> int:
+        """Labels (sorted times) with an unused event in [t - 100, t + MATCH_MS]."""
+        used, hit = set(), 0
+        for t in labels:
+            for j, e in enumerate(times):
+                if j not in used and t - 100 <= e <= t + MATCH_MS:
+                    used.add(j)
+                    hit += 1
+                    break
+        return hit
+
+    hit_clicks = 0
+    for kind in ("left_click", "right_click"):
+        hit_clicks += match([t for t, k in clicks if k == kind], [t for t, k in session.clicks if k == kind])
+    hit_drags = 0
+    for start, end in session.drags:
+        if any(start - 100 <= e <= start + MATCH_MS + drag_ms for e in presses) and \
+                any(abs(e - end) <= MATCH_MS for e in releases):
+            hit_drags += 1
+
+    return {
+        "jitter_px": jitter_px,
+        "lag_ms": lag_ms,
+        "error_px": error_px,
+        "false_clicks": (len(clicks) - hit_clicks) + max(0, len(presses) - hit_drags),
+        "missed_clicks": len(session.clicks) - hit_clicks,
+        "missed_drags": len(session.drags) - hit_drags,
+    }
+
+
+def combine(metrics: list, sessions: list) -> dict:
+    """Frame-weighted means of the cursor metrics, sums of the gesture counts."""
+    w = np.array([len(s) for s in sessions], dtype=np.float64)
+    out = {}
+    for key in WEIGHTS:
+        vals = np.array([m[key] for m in metrics], dtype=np.float64)
+        out[key] = float(vals.sum()) if key.startswith(("false", "missed")) else float((vals * w).sum() / w.sum())
+    return out
+
+
+def score(metrics: dict, weights: dict = WEIGHTS) -> float:
+    return sum(weights[k] * metrics[k] for k in weights)
+
+
+# -------------------------
+# Process pool
+# -------------------------
+_worker = {}
+
+
+def _init_worker(paths, screen_w: int, screen_h: int, weights: dict, setup: dict):
+    _worker["sessions"] = [LabeledSession(p, screen_w, screen_h) for p in paths]
+    _worker["screen"] = (screen_w, screen_h)
+    _worker["weights"] = weights
+    _worker["setup"] = setup
+
+
+def _evaluate(p: dict):
+    sessions = _worker["sessions"]
+    metrics = combine([evaluate(s, p, *_worker["screen"], _worker["setup"]) for s in sessions], sessions)
+    return score(metrics, _worker["weights"]), p, metrics
+
+
+def sample(rng: np.random.Generator, n: int, keys: dict) -> list:
+    out = []
+    for _ in range(n):
+        out.append(fix_params({k: rng.uniform(lo, hi) for k, (lo, hi, _) in keys.items()}))
+    return out
+
+
+def perturb(rng: np.random.Generator, p: dict, scale: float, keys: dict) -> dict:
+    return fix_params({k: p[k] + rng.normal(0.0, scale * (hi - lo)) for k, (lo, hi, _) in keys.items()})
+
+
+def tune(paths, trials: int = 2000, workers: int = 0, screen=(1920, 1080), weights: dict = WEIGHTS,
+         seed: int = 0, start: dict | None = None, batch: int = 256, log=print, setup: dict | None = None):
+    """
+    Random search, then rounds of perturbations around the 8 best sets, over
+    space() of the smoother in `setup` (current_setup() by default).
+    Returns (best (score, params, metrics), baseline (score, params, metrics), configs per minute).
+    """
+    rng = np.random.default_rng(seed)
+    setup = setup or current_setup()
+    keys = space(setup["smoothing.filter"])
+    start = fix_params(start or current_params(setup["smoothing.filter"]))
+    workers = workers or os.cpu_count() or 1
+    explore = max(1, int(trials * 0.6))
+    results = []
+
+    t0 = time.perf_counter()
+    with Pool(workers, initializer=_init_worker, initargs=(list(paths), screen[0], screen[1], weights, setup)) as pool:
+        chunk = max(1, min(32, batch // (4 * workers)))
+        baseline = pool.apply(_evaluate, (start,))
+        results.append(baseline)
+        todo = sample(rng, explore - 1, keys)
+        done = 1
+        while done < trials:
+            results.extend(pool.imap_unordered(_evaluate, todo, chunksize=chunk))
+            done += len(todo)
+            results.sort(key=lambda r: r[0])
+            log(f"  {done:>6} sets, best score {results[0][0]:.3f}")
+            n = min(batch, trials - done)
+            if n <= 0:
+                break
+            # Narrower steps as the search goes on
+            scale = 0.12 * (1.0 - done / trials) + 0.02
+            elite = [r[1] for r in results[:8]]
+            todo = [perturb(rng, elite[i % len(elite)], scale, keys) for i in range(n)]
+    elapsed = time.perf_counter() - t0
+    return results[0], baseline, done / elapsed * 60.0
+
+
+def format_metrics(metrics: dict) -> str:
+    return ", ".join(f"{k} {v:.1f}" if isinstance(v, float) else f"{k} {v}" for k, v in metrics.items())
+
+
+def main(argv=None):
+    import config as C
+
+    ap = argparse.ArgumentParser(description="Tune HandMouse parameters on labeled recordings")
+    ap.add_argument("sessions", nargs="+", help="session directories with labels.json")
+    ap.add_argument("--trials", type=int, default=2000)
+    ap.add_argument("--workers", type=int, default=0, help="processes (default: one per CPU)")
+    ap.add_argument("--screen", default="1920x1080", help="screen size WxH the targets refer to")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--filter", choices=sorted(SMOOTHING_SPACE),
+                    help="smoother to tune instead of the configured one (also written to config.json)")
+    ap.add_argument("--out", default=C.CONFIG_JSON_PATH, help="config.json to merge the result into")
+    ap.add_argument("--dry-run", action="store_true", help="print the result without writing it")
+    args = ap.parse_args(argv)
+
+    screen = tuple(int(v) for v in args.screen.lower().split("x"))
+    setup = current_setup(args.filter)
+    print(f"tuning the {setup['smoothing.filter']} smoother")
+    if C.GESTURE_TABLE:
+        print("gesture table configured: pinch settings are not tuned")
+    best, baseline, rate = tune(args.sessions, args.trials, args.workers, screen, seed=args.seed, setup=setup)
+    print(f"\n{rate:.0f} parameter sets / minute")
+    print(f"current: score {baseline[0]:.3f}  ({format_metrics(baseline[2])})")
+    print(f"tuned:   score {best[0]:.3f}  ({format_metrics(best[2])})")
+    overrides = to_overrides(best[1], args.filter)
+    print(json.dumps(overrides, indent=2))
+    if not args.dry_run:
+        C.save_overrides(overrides, os.path.abspath(args.out))
+        print(f"merged into {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# streaming/client.py
+"""
+Minimal subscriber for the HandMouse event stream; prints what it receives.
+
+    python -m streaming.client tcp://127.0.0.1:8765 --topics cursor,events
+"""
+import argparse
+import asyncio
+
+from actions.recording_mouse import EVENT_NAMES
+from streaming.protocol import ALL_TOPICS, HANDS, CURSOR, parse_address, read_message, topic_mask
+
+
+async def connect(address: str, topics: int = ALL_TOPICS):
+    """(reader, writer) subscribed to the `topics` bitmask."""
+    kind, host, port = parse_address(address)
+    if kind == "unix":
+        reader, writer = await asyncio.open_unix_connection(host)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    writer.write(bytes([topics]))
+    await writer.drain()
+    return reader, writer
+
+
+async def messages(address: str, topics: int = ALL_TOPICS):
+    """Yields decoded Messages until the server closes the connection."""
+    reader, writer = await connect(address, topics)
+    try:
+        while True:
+            try:
+                yield await read_message(reader)
+            except asyncio.IncompleteReadError:
+                return
+    finally:
+        writer.close()
+
+
+def describe(msg) -> str:
+    if msg.topic == HANDS:
+        width, height, hands = msg.data
+        shown = ", ".join(f"{h or '?'} {s:.2f} tip ({n[8, 0] * width:.0f}, {n[8, 1] * height:.0f})"
+                          for h, s, n in hands)
+        return f"{msg.t_ms:10.1f}  hands   {shown or '-'}"
+    if msg.topic == CURSOR:
+        return f"{msg.t_ms:10.1f}  cursor  {msg.data[0]} {msg.data[1]}"
+    return f"{msg.t_ms:10.1f}  event   {EVENT_NAMES.get(msg.kind, msg.kind)} {msg.data[0]} {msg.data[1]}"
+
+
+async def _print_messages(address: str, topics: int):
+    async for msg in messages(address, topics):
+        print(describe(msg))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Print the HandMouse event stream")
+    ap.add_argument("address", nargs="?", default="tcp://127.0.0.1:8765")
+    ap.add_argument("--topics", default="hands,cursor,events")
+    args = ap.parse_args(argv)
+    try:
+        asyncio.run(_print_messages(args.address, topic_mask(args.topics)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# streaming/protocol.py
+"""
+Binary framing for the event stream (little-endian).
+
+Every message: header <H payload length, B topic, B kind, d t_ms>, then the payload.
+  HANDS   kind 0:  <HHB frame width, height, hand count>, then per hand
+                   <bf handedness (0 left, 1 right, -1 unknown), score> + 21 x 3 f4 normalized landmarks
+  CURSOR  kind 0 (move):  <ii x, y> screen pixels
+  EVENTS  kind = actions.recording_mouse event kind:  <ii a, b> (dx, dy for scroll)
+
+Subscribers send one byte, a bitmask of topics; a later byte replaces it (0 = none).
+t_ms is ms since the pipeline started: capture time for hands, issue time otherwise.
+"""
+import struct
+from dataclasses import dataclass
+
+import numpy as np
+
+from actions.recording_mouse import MOVE
+
+HANDS = 1
+CURSOR = 2
+EVENTS = 4
+ALL_TOPICS = HANDS | CURSOR | EVENTS
+TOPIC_NAMES = {"hands": HANDS, "cursor": CURSOR, "events": EVENTS}
+
+HEADER = struct.Struct("<HBBd")
+FRAME = struct.Struct("<HHB")
+HAND = struct.Struct("<bf")
+XY = struct.Struct("<ii")
+LANDMARK_BYTES = 21 * 3 * 4
+
+_HANDEDNESS_CODE = {"Left": 0, "Right": 1}
+_HANDEDNESS_NAME = {0: "Left", 1: "Right"}
+
+
+def parse_address(address: str):
+    """"tcp://host:port" -> ("tcp", host, port); "unix:///path/to.sock" -> ("unix", path, None)."""
+    scheme, sep, rest = address.partition("://")
+    if not sep or scheme not in ("tcp", "unix"):
+        raise ValueError(f"Stream address must be tcp://host:port or unix:///path, got {address!r}")
+    if scheme == "unix":
+        return "unix", rest, None
+    host, _, port = rest.rpartition(":")
+    return "tcp", host or "127.0.0.1", int(port)
+
+
+def topic_mask(names) -> int:
+    """"hands,cursor" or ["hands", "cursor"] -> bitmask."""
+    if isinstance(names, str):
+        names = [n for n in names.split(",") if n.strip()]
+    mask = 0
+    for name in names:
+        name = name.strip().lower()
+        if name not in TOPIC_NAMES:
+            raise ValueError(f"Unknown topic: {name!r} (expected one of {sorted(TOPIC_NAMES)})")
+        mask |= TOPIC_NAMES[name]
+    return mask
+
+
+def encode_hands(t_ms: float, hands, width: int, height: int) -> bytes:
+    parts = [FRAME.pack(width, height, len(hands))]
+    for hand in hands:
+        parts.append(HAND.pack(_HANDEDNESS_CODE.get(hand.handedness, -1), hand.score))
+        parts.append(hand.norm.tobytes())
+    body = b"".join(parts)
+    return HEADER.pack(len(body), HANDS, 0, t_ms) + body
+
+
+def encode_cursor(t_ms: float, x: int, y: int) -> bytes:
+    return HEADER.pack(XY.size, CURSOR, MOVE, t_ms) + XY.pack(x, y)
+
+
+def encode_event(t_ms: float, kind: int, a: int = 0, b: int = 0) -> bytes:
+    return HEADER.pack(XY.size, EVENTS, kind, t_ms) + XY.pack(a, b)
+
+
+@dataclass
+class Message:
+    topic: int
+    kind: int
+    t_ms: float
+    data: tuple    # HANDS: (width, height, [(handedness, score, norm (21, 3))]); else (a, b)
+
+
+def decode_payload(topic: int, kind: int, t_ms: float, body: bytes) -> Message:
+    if topic != HANDS:
+        return Message(topic, kind, t_ms, XY.unpack(body))
+    width, height, n = FRAME.unpack_from(body)
+    hands, off = [], FRAME.size
+    for _ in range(n):
+        code, score = HAND.unpack_from(body, off)
+        off += HAND.size
+        norm = np.frombuffer(body, dtype=np.float32, count=63, offset=off).reshape(21, 3)
+        off += LANDMARK_BYTES
+        hands.append((_HANDEDNESS_NAME.get(code), score, norm))
+    return Message(topic, kind, t_ms, (width, height, hands))
+
+
+def decode(buf: bytes):
+    """(messages, bytes consumed) for the complete messages at the start of buf."""
+    out, off = [], 0
+    while len(buf) - off >= HEADER.size:
+        size, topic, kind, t_ms = HEADER.unpack_from(buf, off)
+        end = off + HEADER.size + size
+        if end > len(buf):
+            break
+        out.append(decode_payload(topic, kind, t_ms, buf[off + HEADER.size:end]))
+        off = end
+    return out, off
+
+
+async def read_message(reader) -> Message:
+    """Next message from an asyncio StreamReader (raises IncompleteReadError at EOF)."""
+    size, topic, kind, t_ms = HEADER.unpack(await reader.readexactly(HEADER.size))
+    return decode_payload(topic, kind, t_ms, await reader.readexactly(size))
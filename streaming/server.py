@@ -0,0 +1,260 @@
+# streaming/server.py
+import asyncio
+import os
+import socket
+import sys
+import threading
+import time
+from collections import deque
+
+from streaming.protocol import (
+    HANDS, CURSOR, EVENTS, encode_hands, encode_cursor, encode_event, parse_address,
+)
+
+
+# Per-subscriber buffering (bytes): the kernel send buffer is kept small so a slow
+# consumer backs up into our queue (where old messages are dropped) instead of
+# queueing seconds of stale data in the socket; above MAX_BUFFERED in the asyncio
+# transport a subscriber counts as slow
+SEND_BUFFER = 16 * 1024
+MAX_BUFFERED = 16 * 1024
+
+
+class _Subscriber:
+    __slots__ = ("writer", "mask", "queue", "blocked", "ready", "closed", "sent", "dropped")
+
+    def __init__(self, writer, queue_size: int):
+        self.writer = writer
+        self.mask = 0
+        self.queue = deque(maxlen=queue_size)   # only used while blocked
+        self.blocked = False
+        self.ready = asyncio.Event()
+        self.closed = False
+        self.sent = 0
+        self.dropped = 0
+
+
+class StreamServer:
+    """
+    Broadcasts hands, cursor moves and gesture events (streaming/protocol.py)
+    to local subscribers. The asyncio server runs on its own thread; the
+    publish_* methods are called from the vision loop and never wait.
+
+    publish_* only encode the message and append it to a deque; flush()
+    (once per loop iteration) wakes the asyncio thread to send everything
+    pending, so the loop pays for one cross-thread wake per frame rather than
+    one per message. Each batch is joined once per topic mask and written
+    straight to the sockets.
+
+    A subscriber whose socket buffer passes MAX_BUFFERED is slow: its
+    messages go to a bounded queue until the socket drains, losing the
+    oldest (counted in dropped); nobody else is slowed down. Topics nobody
+    subscribed to are not even encoded.
+    """
+
+    def __init__(self, address: str = "tcp://127.0.0.1:8765", queue_size: int = 256,
+                 time_origin: float | None = None):
+        self.address = address
+        self.queue_size = max(1, int(queue_size))
+        self.time_origin = time.monotonic() if time_origin is None else time_origin
+        self.topics = 0                # union of subscriber masks
+
+        self._pending = deque()        # (topic, bytes) from the loop thread
+        self._wake_pending = False
+        self._subs = []
+        self._loop = None
+        self._server = None
+        self._unix_path = None
+        self._ready = threading.Event()
+        self._error = None
+        self._thread = None
+
+        # Counters
+        self.published = 0
+        self.sent = 0
+        self.dropped = 0
+        self.connections = 0
+
+    # -------------------------
+    # Vision loop side
+    # -------------------------
+    def start(self):
+        """Start listening; raises if the address cannot be bound."""
+        self._thread = threading.Thread(target=self._run, name="StreamServer", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+        return self
+
+    def now_ms(self) -> float:
+        return (time.monotonic() - self.time_origin) * 1000.0
+
+    def wants(self, topic: int) -> bool:
+        return bool(self.topics & topic)
+
+    def publish_hands(self, t_ms: float, hands, width: int, height: int):
+        if self.topics & HANDS:
+            self._pending.append((HANDS, encode_hands(t_ms, hands, width, height)))
+            self.published += 1
+
+    def publish_cursor(self, x: int, y: int, t_ms: float | None = None):
+        if self.topics & CURSOR:
+            self._pending.append((CURSOR, encode_cursor(self.now_ms() if t_ms is None else t_ms, x, y)))
+            self.published += 1
+
+    def publish_event(self, kind: int, a: int = 0, b: int = 0, t_ms: float | None = None):
+        if self.topics & EVENTS:
+            self._pending.append((EVENTS, encode_event(self.now_ms() if t_ms is None else t_ms, kind, a, b)))
+            self.published += 1
+
+    def flush(self):
+        """Hand everything published so far to the server thread."""
+        if self._pending and not self._wake_pending:
+            self._wake_pending = True
+            self._loop.call_soon_threadsafe(self._dispatch)
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": len(self._subs),
+            "connections": self.connections,
+            "published": self.published,
+            "sent": self.sent,
+            "dropped": self.dropped,
+        }
+
+    def close(self):
+        if self._loop is None or self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._shutdown)
+        self._thread.join(timeout=2.0)
+        self._thread = None
+
+    # -------------------------
+    # asyncio thread
+    # -------------------------
+    def _run(self):
+        loop = self._loop = asyncio.new_event_loop()
+        try:
+            kind, host, port = parse_address(self.address)
+            if kind == "unix":
+                if sys.platform == "win32":
+                    raise ValueError("unix:// stream addresses are not supported on Windows; use tcp://")
+                if os.path.exists(host):
+                    os.unlink(host)    # stale socket from a previous run
+                self._unix_path = host
+                self._server = loop.run_until_complete(asyncio.start_unix_server(self._serve, host))
+            else:
+                self._server = loop.run_until_complete(asyncio.start_server(self._serve, host, port))
+        except Exception as e:
+            self._error = e
+            self._ready.set()
+            loop.close()
+            return
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+            if self._unix_path is not None and os.path.exists(self._unix_path):
+                os.unlink(self._unix_path)
+
+    def _shutdown(self):
+        self._server.close()
+        subs = list(self._subs)
+        for sub in subs:
+            sub.closed = True
+            sub.ready.set()
+            sub.writer.close()     # flushes what is buffered, then closes
+
+        def stop():
+            # A stalled consumer never takes the rest; don't leave its socket open
+            for sub in subs:
+                sub.writer.transport.abort()
+            # After the sockets are actually closed (abort finishes on the next iteration)
+            self._loop.call_soon(self._loop.stop)
+        self._loop.call_later(0.2, stop)
+
+    def _update_topics(self):
+        mask = 0
+        for sub in self._subs:
+            mask |= sub.mask
+        self.topics = mask
+
+    def _dispatch(self):
+        # Cleared first: a flush() racing with the drain below schedules another pass
+        self._wake_pending = False
+        pending = self._pending
+        msgs = []
+        while pending:
+            msgs.append(pending.popleft())
+        batches = {}                  # mask -> (bytes, message count)
+        for sub in self._subs:
+            mask = sub.mask
+            if sub.blocked:
+                q = sub.queue
+                for topic, data in msgs:
+                    if mask & topic:
+                        if len(q) == q.maxlen:
+                            sub.dropped += 1
+                            self.dropped += 1
+                        q.append(data)
+                continue
+            batch = batches.get(mask)
+            if batch is None:
+                parts = [data for topic, data in msgs if mask & topic]
+                batch = batches[mask] = (b"".join(parts), len(parts))
+            if batch[1]:
+                self._write(sub, *batch)
+
+    def _write(self, sub: _Subscriber, data: bytes, n: int):
+        sub.writer.write(data)
+        sub.sent += n
+        self.sent += n
+        if sub.writer.transport.get_write_buffer_size() > MAX_BUFFERED:
+            sub.blocked = True
+            sub.ready.set()
+
+    async def _read_masks(self, reader, sub: _Subscriber):
+        try:
+            while True:
+                data = await reader.read(64)
+                if not data:
+                    break
+                sub.mask = data[-1]
+                self._update_topics()
+        except ConnectionError:
+            pass
+        sub.closed = True
+        sub.ready.set()
+
+    async def _serve(self, reader, writer):
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER)
+        sub = _Subscriber(writer, self.queue_size)
+        self._subs.append(sub)
+        self.connections += 1
+        masks = asyncio.ensure_future(self._read_masks(reader, sub))
+        try:
+            while True:
+                await sub.ready.wait()
+                sub.ready.clear()
+                if sub.closed:
+                    break
+                # Slow consumer: wait for the socket, then send what survived in the queue
+                while sub.blocked and not sub.closed:
+                    await writer.drain()
+                    sub.blocked = False
+                    if sub.queue:
+                        n = len(sub.queue)
+                        data = b"".join(sub.queue)
+                        sub.queue.clear()
+                        self._write(sub, data, n)
+        except ConnectionError:
+            pass
+        finally:
+            self._subs.remove(sub)
+            self._update_topics()
+            masks.cancel()
+            writer.close()
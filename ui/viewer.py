@@ -0,0 +1,138 @@
+# ui/viewer.py
+import threading
+import time
+from dataclasses import dataclass, field
+
+import cv2
+
+WINDOW_NAME = "HandMouse Debug"
+ESC = 27
+
+
+@dataclass
+class Overlay:
+    """What the debug window draws on top of the frame (frame pixel coordinates)."""
+    landmarks: tuple = ()
+    active_region: tuple | None = None     # (x0, y0, x1, y1)
+    lines: list = field(default_factory=list)
+
+
+def draw_overlay(frame, overlay: Overlay, scale: float = 1.0, stats_line: str = ""):
+    """Landmarks, active region and text lines, drawn in place on `frame`."""
+    if overlay.landmarks:
+        pts = [(int(x * scale), int(y * scale)) for (x, y) in overlay.landmarks]
+        for p in pts:
+            cv2.circle(frame, p, 2, (0, 255, 0), -1)
+        if len(pts) > 8:
+            cv2.circle(frame, pts[8], 8, (0, 255, 0), -1)
+
+    if overlay.active_region is not None:
+        x0, y0, x1, y1 = (int(v * scale) for v in overlay.active_region)
+        cv2.rectangle(frame, (x0, y0), (x1, y1), (255, 255, 255), 2)
+
+    cv2.putText(frame, "ESC to quit", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+    y = 65
+    for line in list(overlay.lines) + ([stats_line] if stats_line else []):
+        cv2.putText(frame, line, (10, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+        y += 30
+    return frame
+
+
+class DebugViewer:
+    """
+    Debug window on its own thread, so drawing, imshow and waitKey never run
+    inside the control loop.
+
+    publish() puts the newest frame + Overlay into a single latest-value slot;
+    it only copies (downscaled by `scale`) when the viewer is due for a new
+    frame, at most `max_fps` times a second. The viewer thread draws, shows
+    and polls the keyboard; ESC sets `quit_requested`.
+
+    `stats` (core.latency.LatencyStats) adds a p50/p95 line, recomputed about
+    twice a second on the viewer thread. `show` / `wait_key` default to
+    cv2.imshow / cv2.waitKey. mirror=True flips the picture (on the viewer
+    thread) for frames that are published unflipped with mirrored landmarks.
+    """
+
+    def __init__(self, max_fps: float = 30.0, scale: float = 1.0, stats=None,
+                 window: str = WINDOW_NAME, show=None, wait_key=None, mirror: bool = False):
+        self.period = 1.0 / max(1.0, max_fps)
+        self.scale = min(1.0, max(0.1, scale))
+        self.stats = stats
+        self.mirror = mirror
+        self.window = window
+        self._show = show or cv2.imshow
+        self._wait_key = wait_key or cv2.waitKey
+        self._owns_window = show is None
+
+        self._cond = threading.Condition()
+        self._slot = None               # (frame, Overlay) not yet shown
+        self._next_publish = 0.0
+        self._running = True
+        self.quit_requested = False
+
+        # Counters
+        self.frames_published = 0
+        self.frames_shown = 0
+
+        self._thread = threading.Thread(target=self._view_loop, name="DebugViewer", daemon=True)
+        self._thread.start()
+
+    def wants_frame(self) -> bool:
+        """True when publish() would take a frame; lets the loop skip building the Overlay."""
+        return time.perf_counter() >= self._next_publish
+
+    def publish(self, frame, overlay: Overlay) -> bool:
+        """Offer the current frame; returns False if the viewer is not due for one yet."""
+        now = time.perf_counter()
+        if now < self._next_publish:
+            return False
+        self._next_publish = now + self.period
+
+        if self.scale < 1.0:
+            img = cv2.resize(frame, None, fx=self.scale, fy=self.scale, interpolation=cv2.INTER_NEAREST)
+        else:
+            img = frame.copy()
+
+        with self._cond:
+            self._slot = (img, overlay)
+            self.frames_published += 1
+            self._cond.notify()
+        return True
+
+    def _view_loop(self):
+        stats_line = ""
+        next_stats = 0.0
+        try:
+            while True:
+                with self._cond:
+                    if self._running and self._slot is None:
+                        self._cond.wait(self.period)
+                    if not self._running:
+                        return
+                    item, self._slot = self._slot, None
+
+                if item is not None:
+                    img, overlay = item
+                    if self.mirror:
+                        img = cv2.flip(img, 1)
+                    if self.stats is not None and time.perf_counter() >= next_stats:
+                        # Percentiles sort the whole window
+                        stats_line = "p50/p95 ms  " + self.stats.overlay_text()
+                        next_stats = time.perf_counter() + 0.5
+                    draw_overlay(img, overlay, self.scale, stats_line)
+                    self._show(self.window, img)
+                    self.frames_shown += 1
+
+                # Keep the window responsive even when no new frame arrives
+                if (self._wait_key(1) & 0xFF) == ESC:
+                    self.quit_requested = True
+        finally:
+            if self._owns_window and self.frames_shown:
+                cv2.destroyWindow(self.window)
+
+    def close(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self._thread.join(timeout=1.0)
@@ -0,0 +1,94 @@
+# vision/async_tracker.py
+import threading
+import time
+
+from vision.hand_tracker import HandsResult
+
+
+class AsyncHandTracker:
+    """
+    Runs a synchronous tracker (anything with process(frame, ts_ms) -> {"hands": [...]})
+    on a worker thread, for backends without a LIVE_STREAM callback.
+
+    Same API as HandTracker in live_stream mode: submit() never waits on the
+    model, and frames that arrive while inference is busy are dropped.
+    Accepted frames are copied into a reused buffer, since capture buffers are
+    recycled before the worker is done with them.
+    """
+
+    is_async = True
+
+    def __init__(self, tracker):
+        self.tracker = tracker
+
+        self._cond = threading.Condition()
+        self._pending = None          # (frame, ts_ms) waiting for the worker
+        self._buf = None              # worker's copy of the submitted frame
+        self._busy = False
+        self._latest = None
+        self._seq = 0
+        self._running = True
+
+        self.frames_submitted = 0
+        self.frames_dropped = 0
+        self.last_infer_ms = 0.0
+
+        self._thread = threading.Thread(target=self._worker, name="AsyncHandTracker", daemon=True)
+        self._thread.start()
+
+    def submit(self, frame_bgr, timestamp_ms: int) -> bool:
+        with self._cond:
+            if self._busy or self._pending is not None:
+                self.frames_dropped += 1
+                return False
+            # The worker is idle, so nothing is reading _buf
+            if self._buf is None or self._buf.shape != frame_bgr.shape:
+                self._buf = frame_bgr.copy()
+            else:
+                self._buf[...] = frame_bgr
+            self._pending = (self._buf, timestamp_ms)
+            self.frames_submitted += 1
+            self._cond.notify()
+        return True
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while self._running and self._pending is None:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                frame, ts_ms = self._pending
+                self._pending = None
+                self._busy = True
+
+            t0 = time.perf_counter()
+            try:
+                hands = self.tracker.process(frame, ts_ms)["hands"]
+            except Exception:
+                hands = []
+            infer_ms = (time.perf_counter() - t0) * 1000.0
+
+            with self._cond:
+                self._seq += 1
+                self._latest = HandsResult(hands, ts_ms, self._seq)
+                self._busy = False
+                self.last_infer_ms = infer_ms
+
+    def warm_up(self, *args, **kwargs):
+        """Warm the wrapped tracker up; call before the first submit()."""
+        warm_up = getattr(self.tracker, "warm_up", None)
+        if warm_up is not None:
+            warm_up(*args, **kwargs)
+
+    def latest(self):
+        """Newest HandsResult, or None before the first result."""
+        with self._cond:
+            return self._latest
+
+    def close(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self._thread.join(timeout=1.0)
+        self.tracker.close()
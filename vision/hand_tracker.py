@@ -1,16 +1,166 @@
 # vision/hand_tracker.py
 import os
+import threading
+import time
+from dataclasses import dataclass
+
 import cv2
-import mediapipe as mp
+import numpy as np
+
+from core.landmarks import hand_from_landmarks
+from core.latency import perf, CONVERT, DETECT, LANDMARKS
+
+
+_mp = None
+
+
+def _mediapipe():
+    """Import mediapipe on first use; it is by far the slowest import at startup."""
+    global _mp
+    if _mp is None:
+        import mediapipe
+        _mp = mediapipe
+    return _mp
+
+
+@dataclass
+class HandsResult:
+    hands: list
+    timestamp_ms: int   # timestamp of the frame the result came from
+    seq: int = 0        # increments with every published result
+
+
+@dataclass
+class CropInfo:
+    # Where the image given to the model came from, in full-frame pixels
+    x0: int
+    y0: int
+    w: int
+    h: int
+    frame_w: int = 0
+    frame_h: int = 0
+
+
+def hands_from_result(result, w: int, h: int, crop: CropInfo | None = None) -> list:
+    """
+    Convert a HandLandmarker result into Hand objects for a (w, h) frame.
+    If the model only saw `crop` (possibly downscaled), landmarks are mapped
+    back into full-frame coordinates.
+    """
+    hands_out = []
+    if result and result.hand_landmarks:
+        if crop is None:
+            crop = CropInfo(0, 0, w, h)
+        handedness = getattr(result, "handedness", None) or []
+        for i, hand_landmarks in enumerate(result.hand_landmarks):
+            label, score = None, 1.0
+            if i < len(handedness) and handedness[i]:
+                label = handedness[i][0].category_name
+                score = float(handedness[i][0].score)
+
+            hands_out.append(
+                hand_from_landmarks(hand_landmarks, w, h, crop.x0, crop.y0, crop.w, crop.h,
+                                    handedness=label, score=score)
+            )
+    return hands_out
 
 
 class HandTracker:
     """
     MediaPipe Tasks API hand tracker (works with mediapipe 0.10.30+).
     Returns pixel landmarks for each detected hand.
+
+    running_mode="video": process() runs detect_for_video synchronously.
+    running_mode="live_stream": submit() hands the frame to detect_async and
+    returns immediately; latest() gives the newest result. Frames submitted
+    while a detection is still in flight are dropped, not queued.
+
+    ROI mode (roi_enabled=True): after a confident detection the next frames only
+    send a padded square box around the previous hand to the model, resized to
+    roi_infer_size x roi_infer_size (0: crop size). A miss, a low score or every
+    roi_full_scan_every frames goes back to a full-frame scan.
+
+    The model's own tracking between frames (VIDEO mode) assumes the image
+    geometry stays put, so the box does too: it keeps its position and size
+    while the hand stays inside its inner half of the padding, and every ROI
+    image has the same size. It is only placed anew (roi_moves) when the hand
+    nears its edge or shrinks to under half of it.
+
+    The last confident hand reaches the next _prepare() as one immutable
+    bounds tuple, replaced whole by _finish(): in live_stream mode that runs
+    on MediaPipe's callback thread.
+
+    `landmarker` can be passed in (e.g. a stub exposing detect_for_video/detect_async)
+    to skip loading the model. `stats` (core.latency.LatencyStats) times the
+    convert / detect / landmarks stages.
+
+    mirror=True gives the results of a horizontally flipped frame without flipping
+    any pixels: the model sees the frame as captured and landmarks / handedness
+    are mirrored afterwards.
+
+    warm_up() runs one inference on a blank frame so the one-time graph setup
+    is not paid on the first camera frame. MediaPipe rejects a timestamp that
+    does not increase, so every call (warm-ups included) gets one above
+    last_ts_ms: process() / submit() clamp the given one to last_ts_ms + 1.
     """
 
-    def __init__(self, max_hands: int, min_det_conf: float, min_track_conf: float, model_path: str):
+    # If the callback never fires for a frame (MediaPipe may drop it), stop
+    # treating the landmarker as busy after this long.
+    BUSY_TIMEOUT_MS = 1000
+
+    def __init__(self, max_hands: int, min_det_conf: float, min_track_conf: float, model_path: str,
+                 running_mode: str = "video",
+                 roi_enabled: bool = False,
+                 roi_padding: float = 0.6,
+                 roi_infer_size: int = 256,
+                 roi_full_scan_every: int = 15,
+                 roi_min_score: float = 0.8,
+                 mirror: bool = False,
+                 landmarker=None,
+                 stats=None):
+        if running_mode not in ("video", "live_stream"):
+            raise ValueError(f"Unknown running_mode: {running_mode!r}")
+
+        self.running_mode = running_mode
+        self.stats = stats
+        self.mirror = mirror
+        self._rgb = None               # reused full-frame cvtColor destination
+        self.is_async = running_mode == "live_stream"
+
+        # ROI
+        self.roi_enabled = roi_enabled
+        self.roi_padding = roi_padding
+        self.roi_infer_size = int(roi_infer_size)
+        self.roi_full_scan_every = max(1, int(roi_full_scan_every))
+        self.roi_min_score = roi_min_score
+        self._roi_bounds = None        # (x0, y0, x1, y1) of the last confident hand, full-frame px
+        self._roi_box = None           # current crop box; only used by _prepare()
+        self._since_full_scan = 0
+        self.roi_frames = 0
+        self.full_frames = 0
+        self.roi_moves = 0
+
+        # Async state (live_stream)
+        self._lock = threading.Lock()
+        self._latest = None
+        self._seq = 0
+        self._busy_since = None
+        self._pending_crops = {}       # timestamp_ms -> CropInfo
+        self.frames_submitted = 0
+        self.frames_dropped = 0
+
+        # Timestamp of the last landmarker call (-1: none yet)
+        self.last_ts_ms = -1
+
+        # Warm-up (live_stream: the callback for its timestamp is swallowed)
+        self._warm_done = threading.Event()
+        self._warming = False
+        self._warm_ts = -1
+
+        if landmarker is not None:
+            self._landmarker = landmarker
+            return
+
         if not os.path.exists(model_path):
             raise FileNotFoundError(
                 f"Model file not found:\n  {model_path}\n\n"
@@ -18,55 +168,220 @@ class HandTracker:
                 f"and ensure MODEL_PATH in config.py points to it."
             )
 
+        mp = _mediapipe()
         BaseOptions = mp.tasks.BaseOptions
         HandLandmarker = mp.tasks.vision.HandLandmarker
         HandLandmarkerOptions = mp.tasks.vision.HandLandmarkerOptions
         RunningMode = mp.tasks.vision.RunningMode
 
+        extra = {}
+        if self.is_async:
+            extra["result_callback"] = self._on_result
+
         self._landmarker = HandLandmarker.create_from_options(
             HandLandmarkerOptions(
                 base_options=BaseOptions(model_asset_path=model_path),
-                running_mode=RunningMode.VIDEO,
+                running_mode=RunningMode.LIVE_STREAM if self.is_async else RunningMode.VIDEO,
                 num_hands=max_hands,
                 min_hand_detection_confidence=min_det_conf,
                 min_hand_presence_confidence=min_det_conf,
                 min_tracking_confidence=min_track_conf,
+                **extra,
             )
         )
 
+    def _next_ts(self, timestamp_ms: int) -> int:
+        ts = max(int(timestamp_ms), self.last_ts_ms + 1)
+        self.last_ts_ms = ts
+        return ts
+
+    def warm_up(self, width: int = 640, height: int = 480, timeout: float = 5.0):
+        """
+        One inference on a blank RGB frame at the next timestamp; leaves ROI
+        state and counters untouched. Can be called again, e.g. at another size.
+        """
+        mp = _mediapipe()
+        blank = np.zeros((height, width, 3), dtype=np.uint8)
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=blank)
+        ts = self._next_ts(0)
+        if not self.is_async:
+            self._landmarker.detect_for_video(image, ts)
+            return
+        self._warm_ts = ts
+        self._warming = True
+        self._warm_done.clear()
+        self._landmarker.detect_async(image, ts)
+        self._warm_done.wait(timeout)
+        self._warming = False
+
     def close(self):
         try:
             self._landmarker.close()
         except Exception:
             pass
 
+    # -------------------------
+    # ROI helpers
+    # -------------------------
+    def _next_box(self, w: int, h: int):
+        """Crop box around the last confident hand, or None for a full-frame scan."""
+        bounds = self._roi_bounds       # read once: _finish() may replace it meanwhile
+        if (not self.roi_enabled) or bounds is None or self._since_full_scan >= self.roi_full_scan_every:
+            self._roi_box = None
+            return None
+
+        bx0, by0, bx1, by1 = bounds
+        size = max(bx1 - bx0, by1 - by0)
+        box = self._roi_box
+        if box is not None:
+            x0, y0, x1, y1 = box
+            margin = size * self.roi_padding / 2.0
+            if (bx0 >= x0 + margin and by0 >= y0 + margin and bx1 <= x1 - margin and by1 <= y1 - margin
+                    and size * (1.0 + 2.0 * self.roi_padding) >= (x1 - x0) / 2.0):
+                return box
+
+        # Square box so the model sees the hand with its usual aspect; moved
+        # inside the frame rather than clipped, so its size is what was asked
+        side = max(int(size * (1.0 + 2.0 * self.roi_padding)), 64)
+        if side > min(w, h):
+            self._roi_box = None
+            return None
+        cx, cy = (bx0 + bx1) / 2.0, (by0 + by1) / 2.0
+        x0 = min(max(0, int(cx - side / 2)), w - side)
+        y0 = min(max(0, int(cy - side / 2)), h - side)
+        new = (x0, y0, x0 + side, y0 + side)
+        if new != box:
+            # Hand at the frame edge: the box may already be as close as it gets
+            self._roi_box = new
+            self.roi_moves += 1
+        return new
+
+    def _prepare(self, frame_bgr):
+        """BGR frame -> (mp.Image, CropInfo) for either a full-frame or ROI pass."""
+        h, w = frame_bgr.shape[:2]
+        box = self._next_box(w, h)
+
+        if box is None:
+            self._since_full_scan = 0
+            self.full_frames += 1
+            if self._rgb is None or self._rgb.shape != frame_bgr.shape:
+                self._rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
+            else:
+                cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB, dst=self._rgb)
+            frame_rgb = self._rgb
+            crop = CropInfo(0, 0, w, h, w, h)
+        else:
+            self._since_full_scan += 1
+            self.roi_frames += 1
+            x0, y0, x1, y1 = box
+            roi = frame_bgr[y0:y1, x0:x1]
+
+            cw, ch = x1 - x0, y1 - y0
+            size = self.roi_infer_size
+            if size > 0 and cw != size:
+                # Always the same image size for the model, whatever the box
+                roi = cv2.resize(roi, (size, size), interpolation=cv2.INTER_AREA if cw > size else cv2.INTER_LINEAR)
+
+            # Landmarks come back normalized, so downscaling doesn't change the remap
+            frame_rgb = cv2.cvtColor(roi, cv2.COLOR_BGR2RGB)
+            crop = CropInfo(x0, y0, cw, ch, w, h)
+
+        # mp.Image copies the pixels, so frame_rgb can be reused right away
+        # (the API has no way to refill an existing Image)
+        mp = _mediapipe()
+        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame_rgb)
+        return mp_image, crop
+
+    def _finish(self, result, crop: CropInfo) -> list:
+        hands = hands_from_result(result, crop.frame_w, crop.frame_h, crop)
+
+        if self.roi_enabled:
+            if hands and hands[0]["score"] >= self.roi_min_score:
+                (x0, y0), (x1, y1) = hands[0].px.min(axis=0).tolist(), hands[0].px.max(axis=0).tolist()
+                self._roi_bounds = (x0, y0, x1, y1)
+            else:
+                # Miss or unsure -> next frame scans the full image
+                self._roi_bounds = None
+
+        if self.mirror:
+            # After the ROI update: _roi_bounds stays in captured-frame pixels
+            for hand in hands:
+                hand.mirror()
+        return hands
+
     def process(self, frame_bgr, timestamp_ms: int):
         """
         frame_bgr: OpenCV frame (BGR)
-        timestamp_ms: monotonically increasing timestamp (ms)
+        timestamp_ms: timestamp (ms); raised to last_ts_ms + 1 if it does not increase
         returns: dict with hands list
         """
-        h, w = frame_bgr.shape[:2]
-        frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
+        timestamp_ms = self._next_ts(timestamp_ms)
+        stats = self.stats
+        if stats is None:
+            mp_image, crop = self._prepare(frame_bgr)
+            result = self._landmarker.detect_for_video(mp_image, timestamp_ms)
+            return {"hands": self._finish(result, crop)}
 
-        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame_rgb)
+        t0 = perf()
+        mp_image, crop = self._prepare(frame_bgr)
+        t1 = perf()
         result = self._landmarker.detect_for_video(mp_image, timestamp_ms)
+        t2 = perf()
+        hands = self._finish(result, crop)
+        t3 = perf()
+
+        stats.add(CONVERT, t1 - t0)
+        stats.add(DETECT, t2 - t1)
+        stats.add(LANDMARKS, t3 - t2)
+        return {"hands": hands}
+
+    # -------------------------
+    # live_stream mode
+    # -------------------------
+    def submit(self, frame_bgr, timestamp_ms: int) -> bool:
+        """Start async detection on this frame. Returns False if it was dropped."""
+        now_ms = time.monotonic() * 1000.0
+        with self._lock:
+            if self._busy_since is not None and (now_ms - self._busy_since) < self.BUSY_TIMEOUT_MS:
+                self.frames_dropped += 1
+                return False
+            self._busy_since = now_ms
+            self.frames_submitted += 1
+            self._pending_crops.clear()
+            timestamp_ms = self._next_ts(timestamp_ms)
+
+        t0 = perf()
+        mp_image, crop = self._prepare(frame_bgr)
+        with self._lock:
+            self._pending_crops[timestamp_ms] = crop
+        t1 = perf()
+        self._landmarker.detect_async(mp_image, timestamp_ms)
+        if self.stats is not None:
+            # detect here is only the hand-off; inference runs in MediaPipe's own thread
+            self.stats.add(CONVERT, t1 - t0)
+            self.stats.add(DETECT, perf() - t1)
+        return True
+
+    def _on_result(self, result, output_image, timestamp_ms: int):
+        if self._warming and timestamp_ms == self._warm_ts:
+            self._warm_done.set()
+            return
+        t0 = perf()
+        with self._lock:
+            crop = self._pending_crops.pop(timestamp_ms, None)
+        if crop is None:
+            crop = CropInfo(0, 0, output_image.width, output_image.height,
+                            output_image.width, output_image.height)
+
+        hands = self._finish(result, crop)
+        if self.stats is not None:
+            self.stats.add(LANDMARKS, perf() - t0)
+        with self._lock:
+            self._seq += 1
+            self._latest = HandsResult(hands, timestamp_ms, self._seq)
+            self._busy_since = None
 
-        hands_out = []
-        if result and result.hand_landmarks:
-            for hand_landmarks in result.hand_landmarks:
-                pts = []
-                for lm in hand_landmarks:
-                    x_px = int(lm.x * w)
-                    y_px = int(lm.y * h)
-                    pts.append((x_px, y_px))
-
-                hands_out.append(
-                    {
-                        "landmarks": pts,
-                        "thumb_tip": pts[4],
-                        "index_tip": pts[8],
-                    }
-                )
-
-        return {"hands": hands_out}
+    def latest(self):
+        """Newest HandsResult, or None before the first result."""
+        with self._lock:
+            return self._latest
@@ -0,0 +1,307 @@
+# vision/multi_camera.py
+"""
+Several cameras, each with its own capture + HandTracker worker process, fused
+into one hand per result in the main process. Inference in the workers runs in
+parallel (no shared GIL); the main process only unpacks landmarks and fuses.
+"""
+import multiprocessing as mp
+import queue
+import time
+import traceback
+from dataclasses import dataclass
+
+import numpy as np
+
+from camera.sources import open_source
+from camera.webcam import ThreadedCapture
+from core.landmarks import Hand
+from vision.hand_tracker import HandTracker, HandsResult
+from vision.pipeline import LandmarkBoard
+
+FUSION_MODES = ("best", "blend")
+FULL_VIEW = (0.0, 0.0, 1.0, 1.0)
+
+
+def _camera_worker(camera_id: int, spec: dict, tracker_kwargs: dict, landmarker_factory, board, ready,
+                   exits, stop):
+    """
+    Worker process: newest frame -> HandTracker -> `board` (a LandmarkBoard),
+    then a release of `ready`. The board holds one result and every publish
+    overwrites it, so a result the main process has not collected yet is
+    replaced by the newer one instead of queued behind it. Ends with
+    (camera_id, error message or None) on `exits` and the board marked done.
+    """
+    cam = tracker = None
+    error = None
+    try:
+        # Model load and warm-up first, so capture starts with the tracker ready
+        landmarker = landmarker_factory() if landmarker_factory is not None else None
+        tracker = HandTracker(landmarker=landmarker, **tracker_kwargs)
+        tracker.warm_up(int(spec.get("width", 640)), int(spec.get("height", 480)))
+        cam = ThreadedCapture(open_source(spec))
+
+        start = time.monotonic()
+        last_ts = tracker.last_ts_ms
+        seq = 0
+        while not stop.is_set():
+            frame, capture_t = cam.read_latest(timeout=0.1)
+            if frame is None:
+                if cam.eof:
+                    break
+                continue
+
+            # detect_for_video needs strictly increasing timestamps
+            last_ts = max(last_ts + 1, int((capture_t - start) * 1000.0))
+            t0 = time.perf_counter()
+            hands = tracker.process(frame, last_ts)["hands"]
+            infer_ms = (time.perf_counter() - t0) * 1000.0
+
+            seq += 1
+            board.publish(seq, last_ts, capture_t, infer_ms, hands)
+            ready.release()
+    except Exception:
+        error = traceback.format_exc()
+    finally:
+        if tracker is not None:
+            tracker.close()
+        if cam is not None:
+            cam.release()
+        exits.put((camera_id, error))
+        board.set_done()
+        ready.release()
+        board.close()
+
+
+@dataclass
+class CameraView:
+    """One camera's newest hand, landmarks already in workspace coordinates."""
+    camera_id: int
+    capture_t: float
+    norm: np.ndarray
+    handedness: str | None
+    score: float
+
+
+def to_workspace(norm: np.ndarray, region) -> np.ndarray:
+    """Camera-normalized landmarks -> workspace-normalized; region = (x0, y0, x1, y1) of the camera's view."""
+    x0, y0, x1, y1 = region
+    out = norm.copy()
+    out[:, 0] = x0 + norm[:, 0] * (x1 - x0)
+    out[:, 1] = y0 + norm[:, 1] * (y1 - y0)
+    return out
+
+
+def fuse(views, mode: str = "best", prefer: int | None = None, switch_margin: float = 0.1):
+    """
+    Pick or blend the views of the hand. Returns (camera_id, norm, handedness,
+    score, capture_t) or None without views.
+
+    "best": the highest detection score; the `prefer`red camera (the previous
+    pick) is kept unless another beats it by more than switch_margin, so the
+    cursor does not hop between cameras with near-equal scores.
+    "blend": score-weighted mean of every view with the best view's handedness.
+    """
+    if not views:
+        return None
+    best = max(views, key=lambda v: v.score)
+    if prefer is not None and prefer != best.camera_id:
+        for v in views:
+            if v.camera_id == prefer and v.score >= best.score - switch_margin:
+                best = v
+                break
+    if mode == "best" or len(views) == 1:
+        return best.camera_id, best.norm, best.handedness, best.score, best.capture_t
+
+    same = [v for v in views if v.handedness == best.handedness]
+    w = np.array([v.score for v in same], dtype=np.float32)
+    w /= max(float(w.sum()), 1e-6)
+    norm = np.tensordot(w, np.stack([v.norm for v in same]), axes=1).astype(np.float32)
+    return best.camera_id, norm, best.handedness, best.score, max(v.capture_t for v in same)
+
+
+class MultiCameraTracker:
+    """
+    Starts one worker process per camera spec (config "camera" keys plus
+    "region": where the camera's mirrored view sits in the shared workspace,
+    default the whole of it) and fuses their results.
+
+    Stands in for both the camera and the async tracker of the main loop:
+    read_latest() waits for worker results and returns a blank workspace-sized
+    canvas with the fused capture time, latest() the fused HandsResult.
+    Hands are in workspace pixels (the first camera's width x height).
+
+    Views older than max_skew_ms behind the newest result are left out, so a
+    camera that lost the hand stops contributing straight away.
+    """
+
+    is_async = True
+
+    def __init__(self, sources, tracker_kwargs: dict, fusion: str = "best", max_skew_ms: float = 100.0,
+                 switch_margin: float = 0.1, landmarker_factory=None, time_origin: float | None = None,
+                 start_method: str = "spawn"):
+        if fusion not in FUSION_MODES:
+            raise ValueError(f"Unknown fusion mode: {fusion!r} (expected one of {FUSION_MODES})")
+        if not sources:
+            raise ValueError("MultiCameraTracker needs at least one camera source")
+        self.fusion = fusion
+        self.max_skew = max_skew_ms / 1000.0
+        self.switch_margin = switch_margin
+        self.time_origin = time.monotonic() if time_origin is None else time_origin
+        self.regions = [tuple(s.get("region") or FULL_VIEW) for s in sources]
+
+        w, h = int(sources[0].get("width", 1280)), int(sources[0].get("height", 720))
+        self.width, self.height = w, h
+        self._canvas = np.zeros((h, w, 3), dtype=np.uint8)
+
+        n = len(sources)
+        self._views = [None] * n           # newest CameraView per camera (None: no hand)
+        self._capture_t = [None] * n       # capture time of each camera's newest result
+        self._done = [False] * n
+        self._camera = None                # camera picked by the last fusion
+        self._published_t = None
+        self._latest = None
+        self._seq = 0
+        self._closed = False
+
+        # Counters
+        self.results = [0] * n
+        self.lost = [0] * n                # overwritten before they were collected (seq gaps)
+        self.infer_ms = [0.0] * n
+        self.picks = [0] * n
+        self._last_seq = [0] * n
+        self._age_sum_ms = 0.0
+        self.max_age_ms = 0.0
+
+        # One latest-wins result slot per camera; `ready` is released after every publish
+        ctx = mp.get_context(start_method)
+        self._boards = [LandmarkBoard(tracker_kwargs.get("max_hands", 1)) for _ in range(n)]
+        self._versions = [0] * n
+        self._ready = ctx.Semaphore(0)
+        self._exits = ctx.Queue()
+        self._errors = {}
+        self._stop = ctx.Event()
+        self._procs = [
+            ctx.Process(target=_camera_worker, name=f"Camera{i}", daemon=True,
+                        args=(i, dict(spec), tracker_kwargs, landmarker_factory, self._boards[i],
+                              self._ready, self._exits, self._stop))
+            for i, spec in enumerate(sources)
+        ]
+        for p in self._procs:
+            p.start()
+
+    @property
+    def eof(self) -> bool:
+        """Every worker has finished (finite sources) and its results were read."""
+        return all(self._done)
+
+    def _finish(self, camera_id: int):
+        """Worker `camera_id` ended: raise its error, if it had one."""
+        self._done[camera_id] = True
+        while camera_id not in self._errors:
+            try:
+                cid, error = self._exits.get(timeout=1.0)
+            except queue.Empty:
+                break
+            self._errors[cid] = error
+        error = self._errors.get(camera_id)
+        if error is not None:
+            raise RuntimeError(f"Camera {camera_id} worker failed:\n{error}")
+
+    def _collect(self, camera_id: int) -> bool:
+        board = self._boards[camera_id]
+        # done is set after the last publish, so read it first to not miss that result
+        done = board.done
+        r = board.read(self._versions[camera_id])
+        if r is not None:
+            self._versions[camera_id], seq, _, capture_t, infer_ms, hands = r
+            self.results[camera_id] += 1
+            self.lost[camera_id] += seq - self._last_seq[camera_id] - 1
+            self._last_seq[camera_id] = seq
+            self.infer_ms[camera_id] = infer_ms
+            self._capture_t[camera_id] = capture_t
+            if hands:
+                norm, handedness, score = hands[0]
+                self._views[camera_id] = CameraView(camera_id, capture_t,
+                                                    to_workspace(norm, self.regions[camera_id]), handedness, score)
+            else:
+                self._views[camera_id] = None
+        if done and not self._done[camera_id]:
+            self._finish(camera_id)
+        return r is not None
+
+    def read_latest(self, timeout: float = 0.0):
+        """
+        Waits up to `timeout` s for worker results, fuses, and returns
+        (canvas, capture_time) for a new fused result, else (None, None).
+        """
+        if not (self._ready.acquire(timeout=timeout) if timeout > 0 else self._ready.acquire(False)):
+            return None, None
+        # Results published meanwhile are all on the boards; one pass collects them
+        while self._ready.acquire(False):
+            pass
+        updated = False
+        for camera_id in range(len(self._boards)):
+            updated |= self._collect(camera_id)
+        if not updated:
+            return None, None
+
+        newest = max(t for t in self._capture_t if t is not None)
+        views = [v for v in self._views if v is not None and newest - v.capture_t <= self.max_skew]
+        fused = fuse(views, self.fusion, self._camera, self.switch_margin)
+        if fused is None:
+            hands, capture_t = [], newest
+            self._camera = None
+        else:
+            camera_id, norm, handedness, score, capture_t = fused
+            hands = [Hand(norm, self.width, self.height, handedness, score)]
+            self._camera = camera_id
+            self.picks[camera_id] += 1
+
+        # Nothing newer than what was already published (e.g. a camera without the hand reported)
+        if self._published_t is not None and capture_t <= self._published_t:
+            return None, None
+        self._published_t = capture_t
+
+        age_ms = (time.monotonic() - capture_t) * 1000.0
+        self._age_sum_ms += age_ms
+        self.max_age_ms = max(self.max_age_ms, age_ms)
+        self._seq += 1
+        self._latest = HandsResult(hands, int((capture_t - self.time_origin) * 1000.0), self._seq)
+        return self._canvas, capture_t
+
+    def submit(self, frame_bgr, timestamp_ms: int) -> bool:
+        # The workers capture and detect on their own
+        return False
+
+    def latest(self):
+        """Newest fused HandsResult, or None before the first result."""
+        return self._latest
+
+    def stats(self) -> dict:
+        return {
+            "cameras": len(self._procs),
+            "fused": self._seq,
+            "results": list(self.results),
+            "lost": list(self.lost),
+            "picks": list(self.picks),
+            "infer_ms": list(self.infer_ms),
+            "avg_age_ms": self._age_sum_ms / max(1, self._seq),
+            "max_age_ms": self.max_age_ms,
+        }
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._stop.set()
+        for p in self._procs:
+            p.join(timeout=2.0)
+            if p.is_alive():
+                p.terminate()
+                p.join(timeout=1.0)
+        self._exits.cancel_join_thread()
+        self._exits.close()
+        for board in self._boards:
+            board.close()
+
+    release = close
@@ -0,0 +1,563 @@
+# vision/pipeline.py
+"""
+Capture and hand tracking in their own processes ("inference_mode":
+"processes"), control (cursor, gestures, mouse output) in the main process,
+so a slow stage no longer holds the GIL for the others.
+
+Frames go from the capture process to the inference process through a
+shared-memory ring of preallocated slots (FrameRing), results come back
+through a small shared block (LandmarkBoard); no pixels are pickled. Both
+are latest-wins: nothing waits for a slower reader.
+"""
+import multiprocessing as mp
+import queue
+import signal
+import time
+import traceback
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from camera.sources import open_source
+from core.landmarks import Hand
+from vision.hand_tracker import HandTracker, HandsResult
+
+NUM_LANDMARKS = 21
+HANDEDNESS = (None, "Left", "Right")     # stored as the index
+
+
+def _aligned(n: int, to: int = 64) -> int:
+    return (n + to - 1) // to * to
+
+
+class FrameRing:
+    """
+    `slots` (at least 4) frame buffers of up to max_width x max_height BGR
+    pixels in one shared-memory block, written by one capture process and
+    read by one tracking process. Latest wins, and neither side waits:
+
+    - the writer fills any slot except the newest frame's, the one the
+      reader holds and the one it kept, so it never blocks and the newest
+      frame stays intact;
+    - the reader acquire()s the newest frame, uses it in place and release()s
+      it, or keep()s it when its result is published, so the frame that
+      result came from stays readable (copy_frame) until the next keep();
+      frames written meanwhile replace each other.
+
+    Each slot records the seq of its frame (0 while being written). A reader
+    checks holds(seq) after using a slot: a writer that picked the slot just
+    as it was claimed shows up there, and the frame is dropped.
+
+    Pickles as its name and size: worker processes attach to the same block.
+    The creating process unlinks it in close().
+    """
+
+    # int64s: newest seq, eof flag, newest slot, held slot, kept slot (-1: none);
+    # then (seq, height, width) per slot
+    _HEADER = 5
+
+    def __init__(self, slots: int, max_width: int, max_height: int, name: str | None = None):
+        self.slots = max(4, int(slots))
+        self.max_width = int(max_width)
+        self.max_height = int(max_height)
+        self.slot_bytes = self.max_width * self.max_height * 3
+        n_ints = self._HEADER + 3 * self.slots
+        pixels_at = _aligned(8 * n_ints + 8 * self.slots)
+
+        self.owner = name is None
+        self._shm = shared_memory.SharedMemory(name=name, create=self.owner,
+                                               size=pixels_at + self.slots * self.slot_bytes)
+        buf = self._shm.buf
+        self._ints = np.ndarray((n_ints,), dtype=np.int64, buffer=buf)
+        self._meta = self._ints[self._HEADER:].reshape(self.slots, 3)
+        self._times = np.ndarray((self.slots,), dtype=np.float64, buffer=buf, offset=8 * n_ints)
+        self._pixels = np.ndarray((self.slots, self.slot_bytes), dtype=np.uint8, buffer=buf, offset=pixels_at)
+        if self.owner:
+            self._ints[:] = 0
+            self._ints[2] = 0
+            self._ints[3:5] = -1
+        self._writing = 0       # writer: slot being filled
+
+    def __getstate__(self):
+        return self._shm.name, self.slots, self.max_width, self.max_height
+
+    def __setstate__(self, state):
+        name, slots, max_width, max_height = state
+        self.__init__(slots, max_width, max_height, name=name)
+
+    @property
+    def latest(self) -> int:
+        """Seq of the newest complete frame (0: none yet)."""
+        return int(self._ints[0])
+
+    @property
+    def eof(self) -> bool:
+        """The capture process's source has ended."""
+        return bool(self._ints[1])
+
+    def set_eof(self):
+        self._ints[1] = 1
+
+    def _view(self, i: int) -> np.ndarray:
+        h, w = int(self._meta[i, 1]), int(self._meta[i, 2])
+        return self._pixels[i, :h * w * 3].reshape(h, w, 3)
+
+    # -------------------------
+    # Writer (capture process)
+    # -------------------------
+    def begin_write(self, shape) -> np.ndarray:
+        """A free slot as an (h, w, 3) array to read / copy the next frame into."""
+        h, w = int(shape[0]), int(shape[1])
+        if len(shape) != 3 or shape[2] != 3 or h * w * 3 > self.slot_bytes:
+            raise ValueError(f"Frame of shape {tuple(shape)} does not fit a "
+                             f"{self.max_width}x{self.max_height} BGR slot (camera width / height)")
+        # held before kept: keep() sets kept before it clears held
+        newest, held, kept = int(self._ints[2]), int(self._ints[3]), int(self._ints[4])
+        i = self._writing
+        while i == newest or i == held or i == kept:
+            i = (i + 1) % self.slots
+        self._writing = i
+        meta = self._meta[i]
+        meta[0] = 0
+        meta[1], meta[2] = h, w
+        return self._view(i)
+
+    def end_write(self, seq: int, capture_t: float):
+        i = self._writing
+        self._times[i] = capture_t
+        self._meta[i, 0] = seq
+        self._ints[2] = i
+        self._ints[0] = seq
+        self._writing = (i + 1) % self.slots
+
+    # -------------------------
+    # Readers
+    # -------------------------
+    def _slot_of(self, seq: int) -> int:
+        if seq > 0:
+            for i in range(self.slots):
+                if int(self._meta[i, 0]) == seq:
+                    return i
+        return -1
+
+    def holds(self, seq: int) -> bool:
+        """Frame `seq` is still complete in its slot."""
+        return self._slot_of(seq) >= 0
+
+    def acquire(self):
+        """
+        Claim the newest frame: (frame, capture_t, seq) in place until release(),
+        or (None, None, 0) before the first frame.
+        """
+        while True:
+            seq, i = int(self._ints[0]), int(self._ints[2])
+            if seq == 0:
+                return None, None, 0
+            self._ints[3] = i
+            if int(self._meta[i, 0]) == seq:
+                return self._view(i), float(self._times[i]), seq
+            # The writer moved on between the two reads; claim the newer frame
+
+    def release(self):
+        self._ints[3] = -1
+
+    def keep(self):
+        """Release the held frame but keep the writer off its slot until the next keep()."""
+        self._ints[4] = self._ints[3]
+        self._ints[3] = -1
+
+    def copy_frame(self, seq: int, out=None):
+        """
+        (frame, capture_t) with frame `seq` copied into `out` (reallocated if
+        the shape differs), or (None, None) if the slot no longer holds it,
+        also when the writer took it over during the copy.
+        """
+        i = self._slot_of(seq)
+        if i < 0:
+            return None, None
+        view = self._view(i)
+        if out is None or out.shape != view.shape:
+            out = np.empty_like(view)
+        np.copyto(out, view)
+        capture_t = float(self._times[i])
+        if int(self._meta[i, 0]) != seq:
+            return None, None
+        return out, capture_t
+
+    def close(self):
+        # Views into the block must go before it can be closed
+        self._ints = self._meta = self._times = self._pixels = None
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
+
+
+class LandmarkBoard:
+    """
+    The newest hands result in a small shared-memory block, written by the
+    inference process and copied out by the main process. A version counter,
+    odd while a write is in progress (a seqlock), lets the reader retry a read
+    that overlapped a write; every result is version // 2.
+
+    Pickles as its name and size, like FrameRing.
+    """
+
+    # int64s: version, frame seq, timestamp_ms, hand count, done flag, torn frames,
+    # then the handedness of each hand
+    _INTS = 6
+
+    def __init__(self, max_hands: int, name: str | None = None):
+        self.max_hands = max(1, int(max_hands))
+        n_ints = self._INTS + self.max_hands
+        n_floats = 2 + self.max_hands          # capture_t, infer_ms, score per hand
+        floats_at = 8 * n_ints
+        norm_at = floats_at + 8 * n_floats
+        size = norm_at + 4 * self.max_hands * NUM_LANDMARKS * 3
+
+        self.owner = name is None
+        self._shm = shared_memory.SharedMemory(name=name, create=self.owner, size=size)
+        buf = self._shm.buf
+        self._ints = np.ndarray((n_ints,), dtype=np.int64, buffer=buf)
+        self._floats = np.ndarray((n_floats,), dtype=np.float64, buffer=buf, offset=floats_at)
+        self._norm = np.ndarray((self.max_hands, NUM_LANDMARKS, 3), dtype=np.float32, buffer=buf, offset=norm_at)
+        if self.owner:
+            self._ints[:] = 0
+
+    def __getstate__(self):
+        return self._shm.name, self.max_hands
+
+    def __setstate__(self, state):
+        name, max_hands = state
+        self.__init__(max_hands, name=name)
+
+    @property
+    def version(self) -> int:
+        return int(self._ints[0])
+
+    @property
+    def done(self) -> bool:
+        """The inference process finished the source's last frame."""
+        return bool(self._ints[4])
+
+    def set_done(self):
+        self._ints[4] = 1
+
+    @property
+    def torn(self) -> int:
+        """Frames the capture process overwrote while they were being tracked (dropped)."""
+        return int(self._ints[5])
+
+    def count_torn(self):
+        self._ints[5] += 1
+
+    def recover(self):
+        """Writer restarting after its predecessor died mid-publish: close the half-written version."""
+        if self._ints[0] & 1:
+            self._ints[0] += 1
+
+    def publish(self, frame_seq: int, timestamp_ms: int, capture_t: float, infer_ms: float, hands):
+        ints, floats = self._ints, self._floats
+        version = int(ints[0])
+        ints[0] = version + 1
+        n = min(len(hands), self.max_hands)
+        ints[1], ints[2], ints[3] = frame_seq, timestamp_ms, n
+        floats[0], floats[1] = capture_t, infer_ms
+        for k in range(n):
+            hand = hands[k]
+            self._norm[k] = hand.norm
+            ints[self._INTS + k] = HANDEDNESS.index(hand.handedness) if hand.handedness in HANDEDNESS else 0
+            floats[2 + k] = hand.score
+        ints[0] = version + 2
+
+    def read(self, since: int = 0):
+        """
+        (version, frame_seq, timestamp_ms, capture_t, infer_ms, [(norm, handedness, score)])
+        copied out, or None if nothing newer than version `since` was published.
+        """
+        ints, floats = self._ints, self._floats
+        while True:
+            version = int(ints[0])
+            if version == since or version & 1:
+                return None     # nothing new, or a write in progress: try again later
+            frame_seq, timestamp_ms, n = int(ints[1]), int(ints[2]), int(ints[3])
+            capture_t, infer_ms = float(floats[0]), float(floats[1])
+            hands = [(self._norm[k].copy(), HANDEDNESS[int(ints[self._INTS + k])], float(floats[2 + k]))
+                     for k in range(n)]
+            if int(ints[0]) == version:
+                return version, frame_seq, timestamp_ms, capture_t, infer_ms, hands
+
+    def close(self):
+        self._ints = self._floats = self._norm = None
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
+
+
+# -------------------------
+# Worker processes
+# -------------------------
+def _worker_setup():
+    # Ctrl+C reaches the whole process group; workers are stopped by the parent
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _signal(sem):
+    sem.release()
+
+
+def _wait(sem, timeout: float) -> bool:
+    """Wait for a _signal() and absorb any others that piled up meanwhile."""
+    if not sem.acquire(timeout=timeout):
+        return False
+    while sem.acquire(False):
+        pass
+    return True
+
+
+def _parent_gone() -> bool:
+    parent = mp.parent_process()
+    return parent is not None and not parent.is_alive()
+
+
+def _capture_worker(spec: dict, ring: FrameRing, frame_ready, stop, errors):
+    """Source frames straight into the ring's slots (copied in if the source used its own buffer)."""
+    _worker_setup()
+    source = None
+    try:
+        source = open_source(spec)
+        shape = None
+        seq = ring.latest       # a restarted worker carries on from the last frame
+        while not stop.value:
+            out = ring.begin_write(shape) if shape is not None else None
+            frame = source.read(out=out)
+            capture_t = time.monotonic()
+            if frame is None:
+                if source.eof:
+                    ring.set_eof()
+                    _signal(frame_ready)
+                    break
+                time.sleep(0.005)
+                continue
+            seq += 1
+            if frame is not out:
+                shape = frame.shape
+                np.copyto(ring.begin_write(shape), frame)
+            ring.end_write(seq, capture_t)
+            _signal(frame_ready)
+            if seq % 64 == 0 and _parent_gone():
+                break
+    except Exception:
+        errors.put(("capture", traceback.format_exc()))
+    finally:
+        if source is not None:
+            source.release()
+        ring.close()
+
+
+def _inference_worker(ring: FrameRing, board: LandmarkBoard, tracker_kwargs: dict, landmarker_factory,
+                      time_origin: float, frame_ready, result_ready, stop, errors):
+    """Newest frame in the ring -> HandTracker -> board; frames that arrive meanwhile are skipped."""
+    _worker_setup()
+    tracker = None
+    try:
+        landmarker = landmarker_factory() if landmarker_factory is not None else None
+        tracker = HandTracker(landmarker=landmarker, **tracker_kwargs)
+        tracker.warm_up(ring.max_width, ring.max_height)
+
+        board.recover()
+        ring.release()          # a previous worker may have died holding a frame
+        last_ts = tracker.last_ts_ms
+        done_seq = board.read()[1] if board.version else 0
+        while not stop.value:
+            seq = ring.latest
+            if seq == done_seq:
+                if ring.eof:
+                    board.set_done()
+                    _signal(result_ready)
+                    break
+                if not _wait(frame_ready, 0.1) and _parent_gone():
+                    break
+                continue
+
+            frame, capture_t, seq = ring.acquire()
+            done_seq = seq
+            # detect_for_video needs strictly increasing timestamps
+            last_ts = max(last_ts + 1, int((capture_t - time_origin) * 1000.0))
+            t0 = time.perf_counter()
+            hands = tracker.process(frame, last_ts)["hands"]
+            infer_ms = (time.perf_counter() - t0) * 1000.0
+            if not ring.holds(seq):
+                ring.release()
+                board.count_torn()
+                continue
+            # The control process copies this frame out with the result
+            ring.keep()
+            board.publish(seq, last_ts, capture_t, infer_ms, hands)
+            _signal(result_ready)
+    except Exception:
+        errors.put(("inference", traceback.format_exc()))
+    finally:
+        if tracker is not None:
+            tracker.close()
+        ring.close()
+        board.close()
+
+
+class ProcessPipeline:
+    """
+    Starts a capture process (config "camera" keys, as for MultiCameraTracker)
+    and an inference process (HandTracker with `tracker_kwargs`, or the
+    landmarker made by `landmarker_factory`), connected by a FrameRing of
+    `slots` frames. The caller is the control process.
+
+    Stands in for both the camera and the async tracker of the main loop:
+    read_latest() waits for a new result and returns a copy of the frame it
+    came from (valid until the next read_latest()) with its capture time,
+    latest() the HandsResult.
+
+    A worker that dies is restarted (up to max_restarts times each, then
+    read_latest() raises); workers ignore SIGINT and are stopped by close().
+    Nothing the workers share holds a lock across calls (semaphores for
+    wake-ups, a lock-free stop flag), so a killed worker cannot leave the
+    others blocked.
+    """
+
+    is_async = True
+
+    def __init__(self, spec: dict, tracker_kwargs: dict, slots: int = 4, max_restarts: int = 5,
+                 landmarker_factory=None, time_origin: float | None = None, start_method: str = "spawn"):
+        self.spec = dict(spec)
+        self.tracker_kwargs = dict(tracker_kwargs)
+        self.landmarker_factory = landmarker_factory
+        self.max_restarts = max(0, int(max_restarts))
+        self.time_origin = time.monotonic() if time_origin is None else time_origin
+
+        self._ring = FrameRing(slots, int(spec.get("width", 1280)), int(spec.get("height", 720)))
+        self._board = LandmarkBoard(int(tracker_kwargs.get("max_hands", 1)))
+        self._frame = None
+        self._version = 0
+        self._latest = None
+        self._closed = False
+
+        # Counters
+        self.restarts = {"capture": 0, "inference": 0}
+        self.results = 0
+        self._age_sum_ms = 0.0
+        self.max_age_ms = 0.0
+        self.last_infer_ms = 0.0
+
+        self._ctx = mp.get_context(start_method)
+        self._frame_ready = self._ctx.Semaphore(0)
+        self._result_ready = self._ctx.Semaphore(0)
+        self._stop = self._ctx.RawValue("b", 0)
+        self._errors = self._ctx.Queue()
+        self._procs = {name: self._start(name) for name in ("inference", "capture")}
+
+    def _start(self, name: str):
+        if name == "capture":
+            target, args = _capture_worker, (self.spec, self._ring, self._frame_ready, self._stop, self._errors)
+        else:
+            target, args = _inference_worker, (self._ring, self._board, self.tracker_kwargs, self.landmarker_factory,
+                                               self.time_origin, self._frame_ready, self._result_ready,
+                                               self._stop, self._errors)
+        proc = self._ctx.Process(target=target, args=args, name=f"Pipeline-{name}", daemon=True)
+        proc.start()
+        return proc
+
+    def _supervise(self):
+        """Restart workers that died before their source ended."""
+        for name, proc in self._procs.items():
+            if proc.is_alive() or self._stop.value:
+                continue
+            if (name == "capture" and self._ring.eof) or (name == "inference" and self._board.done):
+                continue
+            error = None
+            try:
+                while True:
+                    who, text = self._errors.get_nowait()
+                    if who == name:
+                        error = text
+            except queue.Empty:
+                pass
+            reason = error.strip().splitlines()[-1] if error else f"exit code {proc.exitcode}"
+            self.restarts[name] += 1
+            if self.restarts[name] > self.max_restarts:
+                raise RuntimeError(f"Pipeline {name} process failed {self.restarts[name]} times:\n"
+                                   f"{error or reason}")
+            print(f"pipeline: {name} process died ({reason}); restarting")
+            self._procs[name] = self._start(name)
+
+    @property
+    def eof(self) -> bool:
+        """The source ended and its last result was read."""
+        return self._board.done and self._board.version == self._version
+
+    def read_latest(self, timeout: float = 0.0):
+        """
+        Waits up to `timeout` s for a new result; returns (frame, capture_time)
+        for it, else (None, None).
+        """
+        self._supervise()
+        if self._board.version == self._version:
+            if timeout <= 0 or not _wait(self._result_ready, timeout):
+                return None, None
+        while True:
+            result = self._board.read(self._version)
+            if result is None:
+                return None, None
+            self._version, frame_seq, timestamp_ms, capture_t, infer_ms, views = result
+            # The inference process keeps the slot of the newest result's frame, so
+            # this only fails if a newer result was published meanwhile: take that
+            frame, _ = self._ring.copy_frame(frame_seq, self._frame)
+            if frame is not None:
+                break
+        self._frame = frame
+        fh, fw = frame.shape[:2]
+        hands = [Hand(norm, fw, fh, handedness, score) for norm, handedness, score in views]
+
+        age_ms = (time.monotonic() - capture_t) * 1000.0
+        self._age_sum_ms += age_ms
+        self.max_age_ms = max(self.max_age_ms, age_ms)
+        self.last_infer_ms = infer_ms
+        self.results += 1
+        self._latest = HandsResult(hands, timestamp_ms, self._version // 2)
+        return frame, capture_t
+
+    def submit(self, frame_bgr, timestamp_ms: int) -> bool:
+        # The workers capture and detect on their own
+        return False
+
+    def latest(self):
+        """Newest HandsResult, or None before the first result."""
+        return self._latest
+
+    def stats(self) -> dict:
+        published = self._board.version // 2
+        return {
+            "captured": self._ring.latest,
+            "published": published,
+            "results": self.results,
+            "torn": self._board.torn,
+            "restarts": dict(self.restarts),
+            "infer_ms": self.last_infer_ms,
+            "avg_age_ms": self._age_sum_ms / max(1, self.results),
+            "max_age_ms": self.max_age_ms,
+        }
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._stop.value = 1
+        _signal(self._frame_ready)
+        for proc in self._procs.values():
+            proc.join(timeout=2.0)
+            if proc.is_alive():
+                proc.terminate()
+                proc.join(timeout=1.0)
+        self._errors.cancel_join_thread()
+        self._errors.close()
+        self._board.close()
+        self._ring.close()
+
+    release = close